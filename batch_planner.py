@@ -0,0 +1,197 @@
+"""Ekransız (headless) toplu yol planlama
+
+GUI yığınını (PyQt5, tkinter, matplotlib) hiç import etmeden çok sayıda tarla
+için yol planlar ve sonuçları JSON/NPZ olarak yazar.
+
+Kullanım:
+    python batch_planner.py tarlalar.json --planner ASTAR --out sonuclar/
+    python batch_planner.py --builtin --format both
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from fields import builtin_fields, load_fields
+from path_planner_factory import PathPlannerFactory
+from planners.coverage_metrics import coverage_metrics
+from planners.grid_path import GridPath
+from planners.postprocess import occupancy_from_obstacles, postprocess_path
+from planners.planner_type import PlannerType
+from planners.validation import issues_to_dicts
+
+
+def plan_field(field, planner_type, start=(0, 0), goal=None, postprocess=None, cost_map=None,
+               connectivity=4, corner_cutting="never"):
+    """Tek bir tarla için yol planla, (yol, istatistikler) döndür
+
+    postprocess verilirse (postprocess_path argümanları sözlüğü) yol son
+    işlemden geçirilir ve önce/sonra ölçümleri istatistiklere eklenir.
+    cost_map verilirse planlayıcı bu arazi maliyetlerini kullanır ve yolun
+    toplam maliyeti istatistiklere "path_cost" olarak eklenir. Komşuluk ve
+    köşe kesme kuralı her çağrıda açıkça ayarlanır.
+    """
+    if goal is None:
+        goal = (field.grid_size[0]-1, field.grid_size[1]-1)
+
+    planner = PathPlannerFactory.create_planner(planner_type, field.grid_size)
+    planner.set_cost_map(cost_map)
+    planner.set_connectivity(connectivity, corner_cutting)
+
+    was_enabled = planner.stats.enabled
+    planner.enable_instrumentation()
+    try:
+        start_time = time.perf_counter()
+        path = planner.plan_path(start, goal, set(field.obstacles))
+        planning_time = time.perf_counter() - start_time
+        trace = planner.stats.traces[-1]
+    finally:
+        if not was_enabled:
+            planner.enable_instrumentation(False)
+
+    path = [tuple(int(v) for v in pos) for pos in path] if path else []
+    postprocess_stats = None
+    if postprocess is not None and path:
+        # Kısayollar geçilemeyen maliyet hücrelerinden de geçmemeli
+        occupancy = occupancy_from_obstacles(field.grid_size, field.obstacles)
+        if cost_map is not None:
+            occupancy |= cost_map.impassable_mask()
+        options = {"connectivity": planner.path_connectivity or connectivity, **postprocess}
+        result = postprocess_path(path, occupancy, **options)
+        path, postprocess_stats = result.path, result.stats
+
+    stats = {
+        "field": field.name,
+        "planner": planner_type.name,
+        "grid_size": list(field.grid_size),
+        "obstacle_count": len(field.obstacles),
+        "planning_time": planning_time,
+        "steps": len(path),
+        "success": bool(path),
+        "reached_goal": bool(path) and path[-1] == tuple(goal),
+        "counters": trace["counters"],
+        "timers": trace["timers"],
+    }
+    if postprocess_stats is not None:
+        stats["postprocess"] = postprocess_stats
+    if cost_map is not None:
+        stats["path_cost"] = cost_map.path_cost(path)
+    grid = field.to_grid()
+    stats["coverage"] = coverage_metrics(path, grid != -1)._asdict()
+    validation = planner.validate(path, start, goal, grid == -1)
+    stats["valid"] = validation.valid
+    stats["issues"] = issues_to_dicts(validation.issues)
+    return path, stats
+
+
+def write_result(out_dir, path, stats, fmt="json"):
+    """Planlama sonucunu JSON ve/veya NPZ olarak yaz"""
+    base = os.path.join(out_dir, stats["field"])
+
+    if fmt in ("json", "both"):
+        with open(base + ".json", "w") as f:
+            json.dump({"stats": stats, "path": path}, f)
+
+    if fmt in ("npz", "both"):
+        # path: int16/int32 (N, 2) dizi, path_rle: GridPath.from_bytes ile çözülen
+        # run-length biçimi
+        grid_path = GridPath(path)
+        np.savez_compressed(
+            base + ".npz",
+            path=grid_path.array,
+            path_rle=np.frombuffer(grid_path.to_bytes(), dtype=np.uint8),
+            stats=json.dumps(stats),
+        )
+
+
+def write_replay(out_dir, field, path, fmt, step=1):
+    """Planlanan yolun tekrar oynatımını kaydet (matplotlib sadece burada yüklenir)"""
+    from rendering.export import ReplayState, export_replay
+
+    if fmt == "png":
+        output = os.path.join(out_dir, f"{field.name}_frames")
+    else:
+        output = os.path.join(out_dir, f"{field.name}.{fmt}")
+    export_replay(ReplayState.from_field(field, path), output, step=step)
+
+
+def _iter_results(fields, planner_type, workers=1, postprocess=None):
+    """Sonuçları sıralı ya da süreç havuzu üzerinden üret"""
+    if workers > 1:
+        from parallel_planner import plan_fields_parallel
+        yield from plan_fields_parallel(fields, planner_type, max_workers=workers,
+                                        postprocess=postprocess)
+        return
+
+    for field in fields:
+        try:
+            yield plan_field(field, planner_type, postprocess=postprocess)
+        except Exception as e:
+            yield [], {"field": field.name, "planner": planner_type.name,
+                       "success": False, "error": str(e)}
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AgriEDGE ekransız toplu yol planlama")
+    parser.add_argument("fields", nargs="?", help="Tarla tanımlarını içeren JSON dosyası")
+    parser.add_argument("--builtin", action="store_true",
+                        help="Yerleşik dört tarla konfigürasyonunu kullan")
+    parser.add_argument("--planner", default=PlannerType.ADAPTIVE.name,
+                        choices=[t.name for t in PlannerType],
+                        help="Kullanılacak planlama algoritması")
+    parser.add_argument("--out", default="batch_results", help="Çıktı dizini")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Paralel işçi süreç sayısı (1: sıralı)")
+    parser.add_argument("--replay", choices=["mp4", "gif", "png"],
+                        help="Her tarla için ekransız tekrar oynatma kaydı üret")
+    parser.add_argument("--replay-step", type=int, default=1,
+                        help="Tekrar oynatmada kaç yol adımında bir kare alınacağı")
+    parser.add_argument("--format", default="json", choices=["json", "npz", "both"],
+                        help="Yol çıktı biçimi")
+    parser.add_argument("--merge-turns", action="store_true",
+                        help="Merdiven bölümlerini kapsamayı koruyarak tek dönüşe indir")
+    parser.add_argument("--shortcut", action="store_true",
+                        help="Görüş hattı kısaltması uygula (noktadan noktaya yollar için)")
+    args = parser.parse_args(argv)
+    if not args.fields and not args.builtin:
+        parser.error("Bir tarla dosyası verilmeli ya da --builtin kullanılmalı")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    planner_type = PlannerType[args.planner]
+
+    fields = builtin_fields() if args.builtin else load_fields(args.fields)
+    os.makedirs(args.out, exist_ok=True)
+
+    postprocess = None
+    if args.merge_turns or args.shortcut:
+        postprocess = {"merge": args.merge_turns, "shortcut": args.shortcut}
+
+    fields_by_name = {field.name: field for field in fields}
+    summary = []
+    for path, stats in _iter_results(fields, planner_type, args.workers, postprocess):
+        if "error" in stats:
+            print(f"{stats['field']}: planlama hatası: {stats['error']}", file=sys.stderr)
+            summary.append(stats)
+            continue
+
+        write_result(args.out, path, stats, args.format)
+        if args.replay and path:
+            write_replay(args.out, fields_by_name[stats["field"]], path,
+                         args.replay, args.replay_step)
+        summary.append(stats)
+        print(f"{stats['field']}: {stats['steps']} adım, {stats['planning_time']:.2f} saniye")
+
+    with open(os.path.join(args.out, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+
+    return 0 if all(s["success"] for s in summary) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
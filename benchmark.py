@@ -0,0 +1,231 @@
+"""Planlayıcı karşılaştırma (benchmark) aracı
+
+Her PlannerType'ı sabit tohumlu (seed) bir tarla kümesi üzerinde çalıştırır;
+süre, genişletilen düğüm, yol uzunluğu, kapsama oranı ve tepe bellek
+kullanımını JSON dosyasına yazar. İsteğe bağlı olarak kayıtlı bir temel
+(baseline) sonuçla karşılaştırıp gerilemeleri raporlar.
+
+Kullanım:
+    python benchmark.py --out benchmark_results.json
+    python benchmark.py --planners ASTAR ADAPTIVE --sizes 20 50 --baseline eski.json
+    python benchmark.py --quick --save-baseline baseline.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from fields import builtin_fields, maze_field, open_field, random_field
+from planners.coverage_metrics import coverage_metrics
+from planners.planner_type import PlannerType
+from planners.registry import get_planner_class
+
+DEFAULT_SIZES = (20, 50, 100)
+DEFAULT_DENSITIES = (0.1, 0.2, 0.3)
+
+
+def build_corpus(sizes=DEFAULT_SIZES, densities=DEFAULT_DENSITIES, seed=0):
+    """Tekrarlanabilir tarla kümesi: yerleşik, rastgele, labirent ve açık tarlalar"""
+    corpus = builtin_fields()
+    for size in sizes:
+        for density in densities:
+            corpus.append(random_field(size, density, seed))
+        corpus.append(maze_field(size, seed))
+        corpus.append(open_field(size))
+    return corpus
+
+
+def _create_planner(planner_type, grid_size, work_dir):
+    """Önbelleksiz, temiz durumlu bir planlayıcı oluştur"""
+    planner = get_planner_class(planner_type)(grid_size)
+    planner.enable_instrumentation()
+    # Adaptif planlayıcının hafızası ölçümleri etkilemesin ve depodaki
+    # hafıza dosyasına yazılmasın
+    if hasattr(planner, "memory_file"):
+        planner.memory_file = os.path.join(work_dir, "path_memory.pkl")
+        planner.path_memory.clear()
+        planner.path_scores.clear()
+    return planner
+
+
+def _path_metrics(path, field):
+    """Yol uzunluğu, kapsama, tekrar ve dönüş ölçümleri (planners.coverage_metrics)"""
+    return coverage_metrics(path or [], field.to_grid() != -1)
+
+
+def run_case(field, planner_type, repeat=3, warmup=1, seed=0, work_dir="."):
+    """Tek bir (tarla, planlayıcı) çiftini ölç"""
+    start = (0, 0)
+    goal = (field.grid_size[0]-1, field.grid_size[1]-1)
+    obstacles = set(field.obstacles)
+    planner = _create_planner(planner_type, field.grid_size, work_dir)
+
+    def run_once():
+        np.random.seed(seed)  # RRT gibi rastgele planlayıcılar için
+        return planner.plan_path(start, goal, obstacles)
+
+    for _ in range(warmup):
+        run_once()
+
+    times = []
+    path = None
+    for _ in range(repeat):
+        # Her tekrar aynı başlangıç durumundan başlasın
+        planner = _create_planner(planner_type, field.grid_size, work_dir)
+        t0 = time.perf_counter()
+        path = run_once()
+        times.append(time.perf_counter() - t0)
+    counters = planner.stats.traces[-1]["counters"] if planner.stats.traces else {}
+
+    # Bellek ölçümü süreyi bozmasın diye ayrı bir çalıştırmada yapılır
+    planner = _create_planner(planner_type, field.grid_size, work_dir)
+    tracemalloc.start()
+    run_once()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    metrics = _path_metrics(path, field)
+    validation = planner.validate(path, start, goal, obstacles)
+    return {
+        "field": field.name,
+        "planner": planner_type.name,
+        "grid_size": list(field.grid_size),
+        "obstacle_count": len(field.obstacles),
+        "wall_time_median": statistics.median(times),
+        "wall_time_min": min(times),
+        "times": times,
+        "expanded_nodes": counters.get("expanded_nodes"),
+        "counters": counters,
+        "steps": len(path) if path else 0,
+        "path_length": metrics.working_distance + metrics.transit_distance,
+        "coverage_ratio": metrics.coverage_ratio,
+        "overlap_ratio": metrics.overlap_ratio,
+        "transit_distance": metrics.transit_distance,
+        "turns": metrics.turns,
+        "peak_memory_kb": peak / 1024,
+        "success": bool(path) and tuple(path[-1]) == goal,
+        "valid": validation.valid,
+        "issues": {issue.kind: issue.count for issue in validation.issues},
+    }
+
+
+def run_benchmark(planner_types, corpus, repeat=3, warmup=1, seed=0):
+    """Tüm planlayıcıları tüm tarlalarda çalıştır, sonuç sözlüğü döndür"""
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        for field in corpus:
+            for planner_type in planner_types:
+                try:
+                    result = run_case(field, planner_type, repeat, warmup, seed, work_dir)
+                except Exception as e:
+                    result = {"field": field.name, "planner": planner_type.name,
+                              "success": False, "error": str(e)}
+                results.append(result)
+                if "error" in result:
+                    print(f"{field.name:<24} {planner_type.name:<16} HATA: {result['error']}")
+                else:
+                    print(f"{field.name:<24} {planner_type.name:<16} "
+                          f"{result['wall_time_median']*1000:9.2f} ms  "
+                          f"{result['steps']:6d} adım  kapsama %{result['coverage_ratio']*100:5.1f}")
+
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": seed,
+            "repeat": repeat,
+            "warmup": warmup,
+        },
+        "results": results,
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance=0.2, min_delta=0.002):
+    """Süre ve yol uzunluğu gerilemelerini bul
+
+    Medyan süre baseline'dan `tolerance` oranından ve `min_delta` saniyeden
+    fazla artarsa ya da yol uzunluğu değişirse gerileme sayılır. Mutlak eşik,
+    milisaniye altı ölçümlerdeki gürültünün gerileme sayılmasını önler.
+    """
+    previous = {(r["field"], r["planner"]): r for r in baseline["results"] if "error" not in r}
+    regressions = []
+    for result in results["results"]:
+        old = previous.get((result["field"], result["planner"]))
+        if old is None or "error" in result:
+            continue
+
+        slowdown = result["wall_time_median"] - old["wall_time_median"]
+        if (result["wall_time_median"] > old["wall_time_median"] * (1 + tolerance)
+                and slowdown > min_delta):
+            regressions.append({
+                "field": result["field"], "planner": result["planner"],
+                "metric": "wall_time_median",
+                "baseline": old["wall_time_median"], "current": result["wall_time_median"],
+            })
+        if not np.isclose(result["path_length"], old["path_length"]):
+            regressions.append({
+                "field": result["field"], "planner": result["planner"],
+                "metric": "path_length",
+                "baseline": old["path_length"], "current": result["path_length"],
+            })
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AgriEDGE planlayıcı karşılaştırması")
+    parser.add_argument("--planners", nargs="+", default=[t.name for t in PlannerType],
+                        choices=[t.name for t in PlannerType])
+    parser.add_argument("--sizes", nargs="+", type=int, default=list(DEFAULT_SIZES))
+    parser.add_argument("--densities", nargs="+", type=float, default=list(DEFAULT_DENSITIES))
+    parser.add_argument("--quick", action="store_true",
+                        help="Sadece küçük tarlalarla hızlı çalıştır")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--warmup", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--out", default="benchmark_results.json")
+    parser.add_argument("--baseline", help="Karşılaştırılacak önceki sonuç dosyası")
+    parser.add_argument("--save-baseline", help="Sonuçları baseline olarak da kaydet")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="İzin verilen göreli süre artışı")
+    parser.add_argument("--min-delta", type=float, default=0.002,
+                        help="Gerileme sayılacak en küçük mutlak süre artışı (saniye)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    sizes = [20] if args.quick else args.sizes
+    corpus = build_corpus(sizes, args.densities, args.seed)
+    planner_types = [PlannerType[name] for name in args.planners]
+
+    results = run_benchmark(planner_types, corpus, args.repeat, args.warmup, args.seed)
+
+    with open(args.out, "w") as f:
+        json.dump(results, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(results, f, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline, args.tolerance, args.min_delta)
+        for r in regressions:
+            print(f"GERİLEME: {r['field']} / {r['planner']} {r['metric']}: "
+                  f"{r['baseline']:.4f} -> {r['current']:.4f}")
+        if regressions:
+            return 1
+        print("Baseline'a göre gerileme yok")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
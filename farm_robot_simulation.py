@@ -5,7 +5,7 @@ import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 # Sonra importları yap
-from widgets import StatisticsWidget, SensorWidget
+from widgets import StatisticsWidget, SensorWidget, PlanningWorker
 from irrigation.widget import IrrigationWidget
 
 import numpy as np
@@ -14,11 +14,22 @@ import matplotlib.pyplot as plt
 from planners.adaptive_planner import AdaptivePathPlanner
 from matplotlib.colors import ListedColormap
 import time
+import threading
 from mpl_toolkits.mplot3d import Axes3D  # 3D plotting için
 from matplotlib import cm  # Renk haritaları için
 import matplotlib.gridspec as gridspec  # Alt plotlar için
 from path_planner_factory import PathPlannerFactory
+from fields import BUILTIN_FIELDS
+from rendering import SimulationRenderer, export_replay
+from rendering.terrain import BASE_HEIGHT, MAX_SURFACE_CELLS, terrain_mesh
+from simulation import DynamicReplanner, SimulationEngine
 from planners.planner_type import PlannerType
+from planners.grid_path import GridPath
+from planners.postprocess import postprocess_path
+from planners.coverage_metrics import coverage_metrics
+from planners.connectivity import check_connectivity, grid_heuristic, grid_neighbors, step_length
+from planners.distance import UNREACHABLE, geodesic_distance
+from planners.tsp import order_waypoints
 import tkinter as tk
 from tkinter import ttk
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
@@ -27,7 +38,7 @@ from PyQt5.QtWidgets import (
     QWidget, QLabel, QHBoxLayout, QFrame, QTabWidget,
     QProgressBar, QGridLayout, QSizePolicy
 )
-from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtCore import Qt, QTimer, QThreadPool
 from PyQt5.QtGui import QFont, QIcon
 from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.figure import Figure
@@ -41,6 +52,19 @@ class FarmRobot:
         self.grid = np.zeros(grid_size)  # 0: boş, 1: işlenmiş, -1: engel
         self.position = (0, 0)
         self.path = []
+        # Çizim için self.path'in (N, 2) dizi önbelleği: (liste kimliği, uzunluk, GridPath)
+        self._path_cache = None
+        # Engel koordinatları önbelleği; set_obstacles ile geçersiz olur
+        self._obstacle_cache = None
+        # Çalışma anında algılanan engeller: hücre -> engelden önceki grid değeri
+        self.dynamic_obstacles = {}
+        # İsteğe bağlı arazi maliyeti katmanı (planners.cost_map.CostMap)
+        self.cost_map = None
+        # Son planlanan yolun doğrulama sonucu (planners.validation.ValidationResult)
+        self.path_validation = None
+        # Izgara aramalarında komşuluk (4/8) ve çapraz adımda köşe kesme kuralı
+        self.connectivity = 4
+        self.corner_cutting = "never"
         self.planner_factory = PathPlannerFactory()
         # Varsayılan olarak Adaptif planlayıcıyı seç
         self.current_planner = self.planner_factory.create_planner(PlannerType.ADAPTIVE, grid_size)
@@ -49,29 +73,102 @@ class FarmRobot:
     def set_planner(self, planner_type: PlannerType):
         """Yol planlama algoritmasını değiştir"""
         self.current_planner = self.planner_factory.create_planner(planner_type, self.grid_size)
-        
+        self._configure_planner()
+    
+    def _configure_planner(self):
+        # Robotun ayarları (maliyet katmanı, komşuluk) her planlamadan önce yeniden verilir
+        self.current_planner.set_cost_map(self.cost_map)
+        self.current_planner.set_connectivity(self.connectivity, self.corner_cutting)
+    
+    def set_connectivity(self, connectivity, corner_cutting="never"):
+        """Komşuluğu ayarla: 4 ya da 8 (çapraz adımlar), köşe kesme kuralıyla
+
+        Hem robotun kendi A* araması (find_path) hem de seçili planlayıcı kullanır.
+        """
+        check_connectivity(connectivity, corner_cutting)
+        self.connectivity = connectivity
+        self.corner_cutting = corner_cutting
+        if self.current_planner:
+            self._configure_planner()
+    
+    def set_cost_map(self, cost_map):
+        """Arazi maliyeti katmanını ayarla; seçili planlayıcı da bu katmanı kullanır
+
+        Katman yerinde güncellenebilir (ör. çamurlu bölge için cost_map.update),
+        yeniden ayarlamaya gerek yoktur.
+        """
+        self.cost_map = cost_map
+        if self.current_planner:
+            self._configure_planner()
+        
+    @classmethod
+    def from_field(cls, field):
+        """fields.Field tanımından robot oluştur"""
+        robot = cls(field.grid_size)
+        robot.set_obstacles(field.occupancy())
+        return robot
+    
     def set_obstacles(self, obstacles):
-        """Tarlada engelleri ayarla (örn: ağaçlar, kayalar)"""
-        for obs in obstacles:
-            self.grid[obs] = -1
+        """Tarlada engelleri ayarla (örn: ağaçlar, kayalar)
+
+        obstacles: (satır, sütun) listesi, (N, 2) indeks dizisi ya da grid
+        boyutunda boolean maske. Tümü tek numpy atamasıyla yazılır.
+        """
+        obstacles = np.asarray(obstacles)
+        if obstacles.dtype == bool and obstacles.shape == self.grid.shape:
+            self.grid[obstacles] = -1
+        elif obstacles.size:
+            cells = obstacles.astype(np.intp).reshape(-1, 2)
+            self.grid[cells[:, 0], cells[:, 1]] = -1
+        self._obstacle_cache = None
+    
+    def update_obstacles(self, added=(), cleared=()):
+        """Dinamik engelleri artımlı güncelle (sensör bildirimleri)
+
+        Yalnızca değişen hücreler yazılır; kaldırılan dinamik engeller eski
+        değerine (boş/işlenmiş) döner, statik engellere dokunulmaz.
+        """
+        for cell in added:
+            cell = tuple(cell)
+            if self.grid[cell] != -1:
+                self.dynamic_obstacles[cell] = self.grid[cell]
+                self.grid[cell] = -1
+        for cell in cleared:
+            cell = tuple(cell)
+            if cell in self.dynamic_obstacles:
+                self.grid[cell] = self.dynamic_obstacles.pop(cell)
+        if added or cleared:
+            self._obstacle_cache = None
+    
+    def obstacle_cells(self):
+        """Engel koordinatları (np.argwhere ile bir kez çıkarılır, önbellekli)
+
+        Grid'e doğrudan -1 yazıldıysa önbellek set_obstacles([]) ile yenilenmeli.
+        """
+        if self._obstacle_cache is None:
+            cells = list(map(tuple, np.argwhere(self.grid == -1).tolist()))
+            self._obstacle_cache = (cells, frozenset(cells))
+        return self._obstacle_cache[0]
+    
+    def obstacle_set(self):
+        """obstacle_cells'in üyelik testi O(1) olan küme hali"""
+        self.obstacle_cells()
+        return self._obstacle_cache[1]
             
     def heuristic(self, a, b):
-        """Manhattan mesafesi hesapla"""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        """Manhattan (4-komşulu) ya da oktil (8-komşulu) mesafe hesapla"""
+        return grid_heuristic(a, b, self.connectivity)
     
     def get_neighbors(self, pos):
-        """Geçerli komşu pozisyonları bul"""
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:  # 4 yön: sağ, aşağı, sol, yukarı
-            new_pos = (pos[0] + dx, pos[1] + dy)
-            if (0 <= new_pos[0] < self.grid_size[0] and 
-                0 <= new_pos[1] < self.grid_size[1] and 
-                self.grid[new_pos] != -1):
-                neighbors.append(new_pos)
-        return neighbors
+        """Geçerli komşu pozisyonları bul (sağ, aşağı, sol, yukarı; 8'de çaprazlar)"""
+        costs = None if self.cost_map is None else self.cost_map.costs
+        return grid_neighbors(pos, self.grid_size, self.obstacle_set(), costs,
+                              self.connectivity, self.corner_cutting)
     
     def find_path(self, start, goal):
         """A* algoritması ile yol bulma"""
+        costs = None if self.cost_map is None else self.cost_map.costs
+        scale = 1 if costs is None else self.cost_map.min_cost
         frontier = []
         heapq.heappush(frontier, (0, start))
         came_from = {start: None}
@@ -84,11 +181,14 @@ class FarmRobot:
                 break
                 
             for next_pos in self.get_neighbors(current):
-                new_cost = cost_so_far[current] + 1
+                step = 1 if self.connectivity == 4 else step_length(current, next_pos)
+                if costs is not None:
+                    step *= costs.item(next_pos)
+                new_cost = cost_so_far[current] + step
                 
                 if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
                     cost_so_far[next_pos] = new_cost
-                    priority = new_cost + self.heuristic(goal, next_pos)
+                    priority = new_cost + scale * self.heuristic(goal, next_pos)
                     heapq.heappush(frontier, (priority, next_pos))
                     came_from[next_pos] = current
         
@@ -101,22 +201,115 @@ class FarmRobot:
         path.reverse()
         return path
     
-    def plan_coverage_path(self):
-        """Seçili algoritmaya göre yol planla"""
+    def plan_coverage_path(self, return_stats=False, merge_turns=False):
+        """Seçili algoritmaya göre yol planla
+
+        return_stats=True ise (yol, ölçümler) döndürülür; ölçümler bu çağrıya ait
+        sayaç ve faz sürelerini içerir. merge_turns=True ise merdiven şeklindeki
+        bölümler işlenen hücreler korunarak tek dönüşe indirilir.
+        """
         if not self.current_planner:
             raise ValueError("Önce bir planlama algoritması seçilmeli!")
             
-        obstacles = [(i, j) for i in range(self.grid_size[0]) 
-                    for j in range(self.grid_size[1]) 
-                    if self.grid[i, j] == -1]
+        obstacles = self.obstacle_set()
+        self._configure_planner()
+        
+        was_enabled = self.current_planner.stats.enabled
+        if return_stats:
+            self.current_planner.enable_instrumentation()
                     
-        self.path = self.current_planner.plan_path(
-            self.position,
-            (self.grid_size[0]-1, self.grid_size[1]-1),
-            obstacles
-        )
+        try:
+            self.path = self.current_planner.plan_path(
+                self.position,
+                (self.grid_size[0]-1, self.grid_size[1]-1),
+                obstacles
+            )
+            if merge_turns and self.path:
+                occupancy = self.grid == -1
+                if self.cost_map is not None:
+                    occupancy |= self.cost_map.impassable_mask()
+                connectivity = self.current_planner.path_connectivity or self.connectivity
+                self.path = postprocess_path(self.path, occupancy, connectivity=connectivity).path
+            self.path_validation = self.validate_path()
+            if not return_stats:
+                return self.path
+            return self.path, self.current_planner.stats.traces[-1]
+        finally:
+            if return_stats and not was_enabled:
+                self.current_planner.enable_instrumentation(False)
+    
+    def plan_waypoint_tour(self, waypoints, return_to_start=False, time_budget=1.0):
+        """Tek tek ziyaret edilecek noktalar için tur planla (ör. bitki başı çapalama)
+
+        Noktalar engelleri dikkate alan mesafelerle sıralanır (planners.tsp),
+        ardışık noktalar find_path ile bağlanır. Ulaşılamayan noktalar atlanır.
+        Sonuç self.path'e yazılır ve döndürülür.
+        """
+        free = self.grid != -1
+        reach = geodesic_distance(free, self.position, self.connectivity)
+        targets = [tuple(p) for p in waypoints if reach[tuple(p)] != UNREACHABLE]
+        tour = order_waypoints(free, targets, start=self.position, closed=return_to_start,
+                               time_budget=time_budget, connectivity=self.connectivity)
+        stops = [targets[i] for i in tour.order]
+        if return_to_start:
+            stops.append(self.position)
+
+        self.path = [self.position]
+        for stop in stops:
+            self.path.extend(self.find_path(self.path[-1], stop)[1:])
         return self.path
     
+    def plan_coverage_path_stream(self):
+        """Kapsama yolunu parça parça planla; her parça self.path'e eklenip yield edilir
+
+        Planlayıcının iter_path'ini kullanır; tüketici ilk parça gelir gelmez
+        yürütmeye başlayabilir.
+        """
+        if not self.current_planner:
+            raise ValueError("Önce bir planlama algoritması seçilmeli!")
+            
+        obstacles = self.obstacle_set()
+        self._configure_planner()
+        
+        self.path = []
+        for segment in self.current_planner.iter_path(
+                self.position,
+                (self.grid_size[0]-1, self.grid_size[1]-1),
+                obstacles):
+            self.path.extend(segment)
+            yield segment
+        self.path_validation = self.validate_path()
+    
+    def validate_path(self, path=None):
+        """Yolu (varsayılan: self.path) sınır, engel, adım ve uç kontrolleriyle doğrula
+
+        Adım kuralı seçili planlayıcıdan gelir (ör. Theta* için 8-komşulu).
+        Sonuç planners.validation.ValidationResult'tır.
+        """
+        path = self.path if path is None else path
+        goal = (self.grid_size[0]-1, self.grid_size[1]-1)
+        return self.current_planner.validate(path, self.position, goal, self.grid == -1)
+    
+    def coverage_metrics(self, path=None):
+        """Yolun (varsayılan: self.path) kapsama kalitesi ölçümleri
+
+        Kapsama oranı, tekrar ziyaretler, boş kalan hücreler, iş/transit
+        mesafesi ve dönüş sayısı; bkz. planners.coverage_metrics.
+        """
+        path = self.path_array() if path is None else path
+        return coverage_metrics(path, self.grid != -1)
+    
+    def path_array(self):
+        """self.path'in kompakt GridPath karşılığı
+
+        Yol değişmediği sürece tekrar dönüştürülmez; dilimleri kopyasız
+        görünümlerdir, böylece kare başına zip(*path) maliyeti oluşmaz.
+        """
+        key = (id(self.path), len(self.path))
+        if self._path_cache is None or self._path_cache[0] != key:
+            self._path_cache = (key, GridPath(self.path))
+        return self._path_cache[1]
+    
     def visualize(self):
         """Tarlayı ve robotu görselleştir"""
         plt.figure(figsize=(10, 10))
@@ -136,7 +329,8 @@ class FarmRobot:
         plt.imshow(display_grid, cmap=custom_cmap)
         
         if self.path:
-            path_y, path_x = zip(*self.path)
+            path = self.path_array()
+            path_y, path_x = path.ys, path.xs
             
             # Ana yolu çiz
             plt.plot(path_x, path_y, 'white', linewidth=2, label='Robot Yolu')
@@ -227,9 +421,26 @@ class FarmRobot:
         
         dialog.mainloop()
 
-    def simulate_movement(self, delay=0.05):
-        """Robotun hareketini 2D ve 3D görünümle simüle et"""
-        if not self.path:
+    def simulate_movement(self, delay=0.05, fps=30, time_scale=1.0, stream=False,
+                          obstacle_injector=None):
+        """Robotun hareketini 2D ve 3D görünümle simüle et
+
+        Robot durumu SimulationEngine ile arka planda sabit zaman adımıyla
+        (adım başına `delay` saniye) ilerler; çizici en fazla `fps` kare/s ile
+        son durumu çizer. time_scale > 1 simülasyonu hızlandırır.
+
+        stream=True ise yol ayrı bir thread'de plan_coverage_path_stream ile
+        planlanır ve robot ilk parça hazır olur olmaz hareket etmeye başlar.
+
+        obstacle_injector (simulation.ObstacleInjector) verilirse çalışma
+        anında beliren engeller algılanır ve yol yerel olarak yeniden planlanır.
+        """
+        if stream:
+            if not self.current_planner:
+                print("Önce bir planlama algoritması seçilmeli!")
+                return
+            self.path = []
+        elif not self.path:
             print("Önce bir yol planlanmalı!")
             return
         
@@ -275,33 +486,20 @@ class FarmRobot:
         next_button.on_clicked(next_simulation)
         algo_button.on_clicked(change_algorithm)
         
-        # Başlangıç görünüm açısı
-        elev = 30
-        azim = 45
+        renderer = SimulationRenderer(self, fig, ax1, ax2)
+        engine = SimulationEngine(self, speed=1.0 / delay, dt=min(delay, 1.0 / fps),
+                                  path_complete=not stream)
+        if obstacle_injector is not None:
+            DynamicReplanner(self, obstacle_injector).attach(engine)
         
         try:
-            # Her adımı görselleştir
-            for i, new_pos in enumerate(self.path):
-                if not plt.get_fignums():
-                    break
-                    
-                # Subplot'ları temizle
-                ax1.clear()
-                ax2.clear()
-                
-                # Mevcut görünüm açısını al
-                if hasattr(ax2, 'elev') and hasattr(ax2, 'azim'):
-                    elev = ax2.elev
-                    azim = ax2.azim
-                
-                # 2D ve 3D görünümleri çiz
-                self._plot_2d(ax1, i, new_pos)
-                self._plot_3d(ax2, i, new_pos, elev, azim)
-                
-                # Görünümü güncelle
-                plt.tight_layout()
-                plt.draw()
-                plt.pause(delay)
+            plt.tight_layout()
+            plt.show(block=False)
+            if stream:
+                self._start_stream_planning(engine)
+            engine.start(time_scale=time_scale)
+            renderer.follow(engine, fps=min(fps, 1.0 / delay),
+                            should_stop=lambda: not plt.get_fignums())
             
             if plt.get_fignums():
                 plt.show()
@@ -310,13 +508,48 @@ class FarmRobot:
             print(f"Görselleştirme hatası: {e}")
             
         finally:
+            engine.stop()
+            renderer.close()
             plt.close(fig)
     
+    def simulate_dynamic(self, obstacle_injector, speed=10.0, dt=0.05, latency_budget=0.05):
+        """Penceresiz simülasyon: dinamik engellerle yolu sonuna kadar yürüt
+
+        Donanımsız deneme ve ölçüm içindir; (gidilen yol, DynamicReplanner)
+        döndürür. Yeniden planlama süreleri replanner.latency_summary() ile okunur.
+        """
+        engine = SimulationEngine(self, speed=speed, dt=dt)
+        replanner = DynamicReplanner(self, obstacle_injector, latency_budget).attach(engine)
+        snapshot = engine.run(time_scale=None)
+        return engine.path[:snapshot.step_index + 1], replanner
+    
+    def _start_stream_planning(self, engine):
+        """Yolu arka planda planla ve gelen parçaları motora aktar"""
+        def produce():
+            try:
+                for segment in self.plan_coverage_path_stream():
+                    engine.append_path(segment)
+            except Exception as e:
+                print(f"Planlama hatası: {e}")
+            finally:
+                engine.mark_path_complete()
+        
+        thread = threading.Thread(target=produce, name="stream-planner", daemon=True)
+        thread.start()
+        return thread
+    
+    def export_simulation(self, output, fps=20, step=1, view="both", dpi=100):
+        """Simülasyonu pencere açmadan MP4/GIF/PNG dizisi olarak kaydet
+
+        Kareler Agg ile çizilir ve bekleme yapılmadan kodlayıcıya aktarılır.
+        """
+        if not self.path:
+            print("Önce bir yol planlanmalı!")
+            return 0
+        return export_replay(self, output, fps=fps, step=step, view=view, dpi=dpi)
+    
     def _plot_2d(self, ax, step_index, current_pos):
-        """2D görünümü çiz"""
-        # Robotun pozisyonunu güncelle
-        self.position = current_pos
-        self.grid[current_pos] = 1
+        """2D görünümü çiz (robot durumunu değiştirmez, SimulationEngine ilerletir)"""
         
         # Özel renk haritası
         colors = ['#8B4513',  # Kahverengi (işlenmemiş toprak)
@@ -331,17 +564,19 @@ class FarmRobot:
         
         # Yolları çiz
         if self.path and len(self.path) > 0:
-            path_y, path_x = zip(*self.path)
+            path = self.path_array()
+            path_y, path_x = path.ys, path.xs
             # Tüm yolu soluk göster
             ax.plot(path_x, path_y, 'white', alpha=0.3, linewidth=2, label='Planlanan Yol')
             
             # Gidilen yolu göster
             if step_index > 0:
-                current_path_y, current_path_x = zip(*self.path[:step_index+1])
+                travelled = path[:step_index+1]
+                current_path_y, current_path_x = travelled.ys, travelled.xs
                 ax.plot(current_path_x, current_path_y, 'yellow', linewidth=3, label='Gidilen Yol')
             
             # Robot ve hedef konumunu göster
-            ax.plot(self.position[1], self.position[0], 'ro', markersize=15, 
+            ax.plot(current_pos[1], current_pos[0], 'ro', markersize=15, 
                     label='Robot', markeredgecolor='white')
             ax.plot(path_x[-1], path_y[-1], 'bo', markersize=15, 
                     label='Hedef', markeredgecolor='white')
@@ -352,20 +587,25 @@ class FarmRobot:
         ax.set_ylabel('Y (metre)')
         ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
 
-    def _plot_3d(self, ax, step_index, current_pos, elev=30, azim=45):
-        """3D görünümü daha estetik bir şekilde göster"""
-        # Grid verilerini 3D yüzeye dönüştür
-        X, Y = np.meshgrid(range(self.grid_size[1]), range(self.grid_size[0]))
-        Z = np.zeros_like(self.grid, dtype=float)
+    def _plot_3d(self, ax, step_index, current_pos, elev=30, azim=45, max_cells=MAX_SURFACE_CELLS):
+        """3D görünümü daha estetik bir şekilde göster
+
+        Zemin yüzeyi tarla başına bir kez kurulur. Aynı eksene tekrar
+        çağrıldığında (ax.clear() yapılmadıysa) sadece robot ve gidilen yol
+        güncellenir. max_cells büyük grid'lerde yüzeyi seyreltir.
+        """
+        # Robot ve yol yüksekliği - zeminden biraz yukarıda
+        path_height = BASE_HEIGHT + 0.04  # Yol yüksekliği
+        robot_height = path_height  # Robot yolu ile aynı yükseklikte
         
-        # Orijinal grid'i kopyala (işlenmiş alanları göz ardı et)
-        display_grid = self.grid.copy()
-        display_grid[display_grid == 1] = 0  # İşlenmiş alanları normal toprak olarak göster
+        artists = getattr(self, '_3d_artists', None)
+        if artists and artists['ax'] is ax and artists['surface'] in ax.collections:
+            self._update_3d(artists, step_index, current_pos, path_height)
+            ax.view_init(elev=elev, azim=azim)
+            return
         
-        # Yükseklikleri sadeleştir
-        base_height = 0.0  # Temel yükseklik
-        Z[display_grid == 0] = base_height  # Tüm toprak aynı seviyede
-        Z[display_grid == -1] = base_height + 0.02  # Engeller hafif yüksek
+        # Zemin ağı engel düzenine göre önbellekten gelir
+        X, Y, Z = terrain_mesh(self.grid, max_cells)
         
         # Özel renk haritası
         colors = ['#C19A6B',  # Açık kahve (toprak)
@@ -379,34 +619,31 @@ class FarmRobot:
                              linewidth=0, antialiased=True,
                              alpha=1.0)
         
-        # Robot ve yol yüksekliği - zeminden biraz yukarıda
-        path_height = base_height + 0.04  # Yol yüksekliği
-        robot_height = path_height  # Robot yolu ile aynı yükseklikte
+        artists = {'ax': ax, 'surface': surf, 'travelled': None, 'robot': None}
         
         # Yolu çiz
         if self.path and len(self.path) > 0:
-            path_y, path_x = zip(*self.path)
+            path = self.path_array()
+            path_y, path_x = path.ys, path.xs
             
             # Ana yolu çiz
             path_z = [path_height] * len(self.path)
             ax.plot(path_x, path_y, path_z, color='white', 
                    alpha=0.7, linewidth=3, label='Planlanan Yol')
             
-            # Gidilen yolu göster
-            if step_index > 0:
-                current_path_y, current_path_x = zip(*self.path[:step_index+1])
-                current_path_z = [path_height] * (step_index + 1)
-                ax.plot(current_path_x, current_path_y, current_path_z, 
-                       color='#FFD700', linewidth=4, label='Gidilen Yol')
-            
-            # Robot ve hedefi göster
-            ax.scatter([current_pos[1]], [current_pos[0]], [robot_height],
-                      color='red', s=200, label='Robot',
-                      edgecolor='white', linewidth=2)
+            # Gidilen yol ve robot her karede güncellenir
+            artists['travelled'], = ax.plot([], [], [], color='#FFD700',
+                                            linewidth=4, label='Gidilen Yol')
+            artists['robot'] = ax.scatter([current_pos[1]], [current_pos[0]], [robot_height],
+                                          color='red', s=200, label='Robot',
+                                          edgecolor='white', linewidth=2)
             
             ax.scatter([path_x[-1]], [path_y[-1]], [robot_height],
                       color='blue', s=200, label='Hedef',
                       edgecolor='white', linewidth=2)
+            self._update_3d(artists, step_index, current_pos, path_height)
+        
+        self._3d_artists = artists
         
         # Görünüm ayarları
         ax.view_init(elev=elev, azim=azim)
@@ -437,7 +674,16 @@ class FarmRobot:
         margin = 2
         ax.set_xlim(-margin, self.grid_size[1] + margin)
         ax.set_ylim(-margin, self.grid_size[0] + margin)
-        ax.set_zlim(base_height - 0.05, base_height + 0.08)
+        ax.set_zlim(BASE_HEIGHT - 0.05, BASE_HEIGHT + 0.08)
+    
+    def _update_3d(self, artists, step_index, current_pos, path_height):
+        """3D görünümde sadece robotu ve gidilen yolu güncelle"""
+        if artists['robot'] is None:
+            return
+        artists['robot']._offsets3d = ([current_pos[1]], [current_pos[0]], [path_height])
+        travelled = self.path_array()[:step_index+1]
+        artists['travelled'].set_data_3d(travelled.xs, travelled.ys,
+                                         np.full(len(travelled), path_height))
 
 class FarmRobotGUI(QMainWindow):
     def __init__(self):
@@ -446,6 +692,15 @@ class FarmRobotGUI(QMainWindow):
         self.setGeometry(100, 100, 1200, 800)
         self.is_connected = False
         self.current_task = None
+        
+        # Arka plan planlama işleri
+        self.thread_pool = QThreadPool.globalInstance()
+        self.planning_workers = {}
+        self.robots = {}
+        self.planned = {}
+        self.job_progress = {}
+        self.next_field = 0
+        self.replaying = False
 
         # Metin çevirileri
         self.translations = {
@@ -788,6 +1043,19 @@ class FarmRobotGUI(QMainWindow):
         left_layout.addWidget(self.connect_button)
         left_layout.addWidget(start_button)
         left_layout.addWidget(exit_button)
+        
+        # Planlama ilerlemesi ve iptal
+        self.planning_progress = QProgressBar()
+        self.planning_progress.setMaximum(100)
+        self.planning_progress.setValue(0)
+        self.planning_status = QLabel("")
+        self.planning_status.setObjectName("taskStatus")
+        self.cancel_planning_button = self.create_button("Planlamayı İptal Et", "dangerButton")
+        self.cancel_planning_button.setEnabled(False)
+        
+        left_layout.addWidget(self.planning_progress)
+        left_layout.addWidget(self.planning_status)
+        left_layout.addWidget(self.cancel_planning_button)
         left_layout.addStretch()
 
         # Sağ kontrol grubu - Görev seçimi
@@ -918,6 +1186,7 @@ class FarmRobotGUI(QMainWindow):
         self.connect_button.clicked.connect(self.toggle_connection)
         start_button.clicked.connect(self.start_simulation)
         exit_button.clicked.connect(self.close)
+        self.cancel_planning_button.clicked.connect(self.cancel_planning)
         self.mapping_button.clicked.connect(lambda: self.set_task("Haritalama"))
         self.hoeing_button.clicked.connect(lambda: self.set_task("Çapalama"))
 
@@ -1056,40 +1325,22 @@ class FarmRobotGUI(QMainWindow):
             self.current_task_label.setStyleSheet("color: #95A5A6; font-size: 12px;")
 
     def start_simulation(self):
+        """Tarlaları arka planda planla, planı hazır olanları sırayla göster"""
+        if self.planning_workers:
+            print("Planlama zaten devam ediyor")
+            return
+        
         # Tarla konfigürasyonları
         grid_size = (30, 30)
-        field_configs = [
-            # Tarla 1: Dikey engeller
-            [
-                *[(i, 5) for i in range(1, 25)],  # Uzun dikey engel
-                *[(i, 15) for i in range(1, 25)], # İkinci dikey engel
-                *[(i, 25) for i in range(1, 25)], # Üçüncü dikey engel
-            ],
-            # Tarla 2: Yatay engeller
-            [
-                *[(5, j) for j in range(1, 25)],  # Uzun yatay engel
-                *[(15, j) for j in range(1, 25)], # İkinci yatay engel
-                *[(25, j) for j in range(1, 25)], # Üçüncü yatay engel
-            ],
-            # Tarla 3: Karma desenler
-            [
-                # Büyük L şeklinde engeller
-                *[(5, j) for j in range(5, 15)],
-                *[(i, 5) for i in range(5, 15)],
-                *[(15, j) for j in range(15, 25)],
-                *[(i, 15) for i in range(15, 25)],
-            ],
-            # Tarla 4: Çapraz engeller
-            [
-                *[(i, i) for i in range(1, 25)],  # Çapraz engel
-                *[(i, 25-i) for i in range(1, 25)],  # Ters çapraz engel
-            ]
-        ]
-
-        i = 0
-        while i < len(field_configs):
-            print(f"\nTarla {i+1} simülasyonu başlıyor...")
-            
+        field_configs = BUILTIN_FIELDS
+        goal = (grid_size[0]-1, grid_size[1]-1)
+        
+        self.robots = {}
+        self.planned = {}
+        self.job_progress = {}
+        self.next_field = 0
+        
+        for i, obstacles in enumerate(field_configs):
             # Yeni robot oluştur
             robot = FarmRobot(grid_size)
             
@@ -1097,26 +1348,94 @@ class FarmRobotGUI(QMainWindow):
             robot.set_planner(PlannerType.ADAPTIVE)
             
             # Engelleri ayarla
-            robot.set_obstacles(field_configs[i])
-            
-            # Yol planla
-            start_time = time.time()
-            robot.plan_coverage_path()
-            planning_time = time.time() - start_time
+            robot.set_obstacles(obstacles)
+            self.robots[i] = robot
             
-            print(f"Yol planlama süresi: {planning_time:.2f} saniye")
-            print(f"Toplam adım sayısı: {len(robot.path)}")
-            
-            # Hareketi simüle et
-            robot.simulate_movement(delay=0.1)
-            
-            # Simülasyon kontrolü
-            if robot.simulation_finished:
-                break
-            elif robot.next_simulation:
-                i += 1
-            else:
-                i += 1
+            # Yol planlamayı GUI thread'i dışında başlat
+            worker = PlanningWorker(i, robot.current_algorithm, grid_size,
+                                    robot.position, goal, obstacles)
+            worker.signals.progress.connect(self._on_planning_progress)
+            worker.signals.finished.connect(self._on_planning_finished)
+            worker.signals.failed.connect(self._on_planning_failed)
+            worker.signals.cancelled.connect(self._on_planning_cancelled)
+            self.planning_workers[i] = worker
+            self.thread_pool.start(worker)
+        
+        self.planning_progress.setValue(0)
+        self.planning_status.setText("Yol planlanıyor...")
+        self.cancel_planning_button.setEnabled(True)
+    
+    def cancel_planning(self):
+        """Devam eden planlama işlerini ve bekleyen simülasyonları iptal et"""
+        for worker in self.planning_workers.values():
+            worker.cancel()
+        self.next_field = len(self.robots)
+        self.planning_status.setText("Planlama iptal edildi")
+    
+    def _on_planning_progress(self, job_id, info):
+        """Arka plan işinden gelen ilerlemeyi göster"""
+        if "fraction" in info:
+            self.job_progress[job_id] = info["fraction"]
+        if self.robots:
+            total = sum(self.job_progress.values()) / len(self.robots)
+            self.planning_progress.setValue(int(total * 100))
+        self.planning_status.setText(
+            f"Tarla {job_id+1}: {info.get('covered_cells', '-')} hücre, "
+            f"{info.get('expanded_nodes', '-')} genişletme"
+        )
+    
+    def _on_planning_finished(self, job_id, path, planning_time):
+        robot = self.robots[job_id]
+        robot.path = path
+        print(f"\nTarla {job_id+1} yol planlama süresi: {planning_time:.2f} saniye")
+        print(f"Toplam adım sayısı: {len(path)}")
+        robot.path_validation = robot.validate_path()
+        for issue in robot.path_validation.issues:
+            print(f"Tarla {job_id+1} yol uyarısı: {issue.message}")
+        stats_widget = self.findChild(StatisticsWidget)
+        if stats_widget:
+            stats_widget.show_coverage(robot.coverage_metrics())
+        self._job_done(job_id, robot)
+    
+    def _on_planning_failed(self, job_id, message):
+        print(f"Tarla {job_id+1} planlama hatası: {message}")
+        self._job_done(job_id, None)
+    
+    def _on_planning_cancelled(self, job_id):
+        self._job_done(job_id, None)
+    
+    def _job_done(self, job_id, robot):
+        self.planned[job_id] = robot
+        self.planning_workers.pop(job_id, None)
+        if not self.planning_workers:
+            self.cancel_planning_button.setEnabled(False)
+            if self.next_field < len(self.robots):
+                self.planning_status.setText("Planlama tamamlandı")
+        # Simülasyonu sinyal işleyicisinin dışında başlat
+        QTimer.singleShot(0, self._show_ready_fields)
+    
+    def _show_ready_fields(self):
+        """Planı hazır olan tarlaları sırayla simüle et"""
+        # Simülasyon penceresi Qt olaylarını işlerken yeni planlar gelebilir
+        if self.replaying:
+            return
+        self.replaying = True
+        try:
+            while self.next_field in self.planned:
+                robot = self.planned[self.next_field]
+                self.next_field += 1
+                if robot is None or not robot.path:
+                    continue
+                
+                print(f"\nTarla {self.next_field} simülasyonu başlıyor...")
+                robot.simulate_movement(delay=0.1)
+                
+                # Simülasyon kontrolü
+                if robot.simulation_finished:
+                    self.cancel_planning()
+                    break
+        finally:
+            self.replaying = False
 
     def toggle_theme(self):
         """Tema değiştirme"""
@@ -0,0 +1,310 @@
+"""Çok büyük tarlalar için bellek eşlemeli (memmap), karolara bölünmüş tarla deposu
+
+Hücre değerleri FarmRobot.grid ile aynıdır (0: boş, 1: işlenmiş, -1: engel)
+ancak float64 yerine int8 tutulur. Grid, diskte karo (tile) karo ardışık
+duracak şekilde (karo_satır, karo_sütun, T, T) boyutlu bir .npy dosyasında
+saklanır; bir karoya erişmek yalnızca o karonun sayfalarını okur. Erişilen
+karolar LRU önbellekte tutulur, değişen (kirli) karolar önbellekten
+çıkarılırken ya da flush() ile dosyaya geri yazılır.
+
+Kullanım:
+    store = TiledFieldStore.create("ciftlik.npy", (20000, 20000), tile_size=512)
+    store.set_obstacles(mask_parcasi, origin=(4096, 8192))
+    store[(10, 20)] = 1
+    pencere = store.window(0, 1024, 0, 1024)
+    store.close()
+"""
+import json
+from collections import OrderedDict
+
+import numpy as np
+
+from fields import Field
+
+FREE = 0
+COVERED = 1
+OBSTACLE = -1
+
+DEFAULT_TILE_SIZE = 512
+DEFAULT_CACHE_TILES = 64
+
+
+def _meta_path(path):
+    return path + ".json"
+
+
+class TiledFieldStore:
+    """int8 hücreli, karolu ve memmap destekli tarla grid'i
+
+    Tek hücre erişimi (store[(y, x)]) FarmRobot.grid gibi çalışır; böylece
+    SimulationEngine doğrudan bu depo üzerinde işlenen hücreleri işaretleyebilir.
+    """
+
+    def __init__(self, path, mode="r+", cache_tiles=DEFAULT_CACHE_TILES):
+        with open(_meta_path(path)) as f:
+            meta = json.load(f)
+        self.path = path
+        self.shape = tuple(meta["shape"])
+        self.tile_size = meta["tile_size"]
+        self.readonly = mode == "r"
+        self._tiles = np.lib.format.open_memmap(path, mode=mode)
+        self.tiles_shape = self._tiles.shape[:2]
+
+        self.cache_tiles = cache_tiles
+        self._cache = OrderedDict()
+        self._dirty = set()
+        self.hits = 0
+        self.misses = 0
+        self.writebacks = 0
+
+    @classmethod
+    def create(cls, path, shape, tile_size=DEFAULT_TILE_SIZE, cache_tiles=DEFAULT_CACHE_TILES):
+        """Boş (tamamı FREE) yeni bir depo dosyası oluştur"""
+        rows, cols = shape
+        tiles = (-(-rows // tile_size), -(-cols // tile_size), tile_size, tile_size)
+        memmap = np.lib.format.open_memmap(path, mode="w+", dtype=np.int8, shape=tiles)
+        del memmap
+        with open(_meta_path(path), "w") as f:
+            json.dump({"shape": [rows, cols], "tile_size": tile_size}, f)
+        return cls(path, "r+", cache_tiles)
+
+    @classmethod
+    def from_grid(cls, path, grid, tile_size=DEFAULT_TILE_SIZE, cache_tiles=DEFAULT_CACHE_TILES):
+        """Bellekteki bir grid'den (ör. FarmRobot.grid) depo oluştur"""
+        grid = np.asarray(grid)
+        store = cls.create(path, grid.shape, tile_size, cache_tiles)
+        store.write_window(0, 0, grid.astype(np.int8))
+        store.flush()
+        return store
+
+    @classmethod
+    def from_field(cls, path, field, tile_size=DEFAULT_TILE_SIZE, cache_tiles=DEFAULT_CACHE_TILES):
+        """fields.Field tanımından depo oluştur (engeller karo karo yazılır)"""
+        store = cls.create(path, field.grid_size, tile_size, cache_tiles)
+        if field.obstacles:
+            store.set_obstacles(np.asarray(field.obstacles, dtype=np.intp))
+        store.flush()
+        return store
+
+    # Karo önbelleği
+
+    def tile(self, ty, tx):
+        """(ty, tx) karosunun önbellekteki kopyası (LRU)"""
+        key = (ty, tx)
+        tile = self._cache.get(key)
+        if tile is not None:
+            self.hits += 1
+            self._cache.move_to_end(key)
+            return tile
+
+        self.misses += 1
+        tile = np.array(self._tiles[ty, tx])
+        self._cache[key] = tile
+        if len(self._cache) > self.cache_tiles:
+            self._evict()
+        return tile
+
+    def _evict(self):
+        key, tile = self._cache.popitem(last=False)
+        if key in self._dirty:
+            self._write_back(key, tile)
+
+    def _write_back(self, key, tile):
+        self._tiles[key] = tile
+        self._dirty.discard(key)
+        self.writebacks += 1
+
+    def _check_writable(self):
+        # Önbellekteki karo değiştirilmeden önce: salt okunur depoda ne diskte ne
+        # dosyada olan veri okunmasın
+        if self.readonly:
+            raise ValueError("Depo salt okunur açıldı")
+
+    def _mark_dirty(self, ty, tx):
+        self._dirty.add((ty, tx))
+
+    def flush(self):
+        """Kirli karoları dosyaya yaz"""
+        for key in list(self._dirty):
+            self._write_back(key, self._cache[key])
+        if not self.readonly:
+            self._tiles.flush()
+
+    def close(self):
+        self.flush()
+        self._cache.clear()
+        self._tiles = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Hücre ve pencere erişimi
+
+    def _locate(self, y, x):
+        if not (0 <= y < self.shape[0] and 0 <= x < self.shape[1]):
+            raise IndexError(f"Hücre tarla dışında: {(y, x)}")
+        ty, oy = divmod(y, self.tile_size)
+        tx, ox = divmod(x, self.tile_size)
+        return ty, tx, oy, ox
+
+    def __getitem__(self, pos):
+        ty, tx, oy, ox = self._locate(*pos)
+        return int(self.tile(ty, tx)[oy, ox])
+
+    def __setitem__(self, pos, value):
+        self._check_writable()
+        ty, tx, oy, ox = self._locate(*pos)
+        self.tile(ty, tx)[oy, ox] = value
+        self._mark_dirty(ty, tx)
+
+    def _tile_spans(self, y0, y1, x0, x1):
+        """[y0, y1) x [x0, x1) penceresinin kestiği karolar ve karo içi dilimler"""
+        size = self.tile_size
+        for ty in range(y0 // size, (y1 - 1) // size + 1):
+            sy0, sy1 = max(y0, ty * size), min(y1, (ty + 1) * size)
+            for tx in range(x0 // size, (x1 - 1) // size + 1):
+                sx0, sx1 = max(x0, tx * size), min(x1, (tx + 1) * size)
+                yield (ty, tx,
+                       slice(sy0 - ty * size, sy1 - ty * size),
+                       slice(sx0 - tx * size, sx1 - tx * size),
+                       slice(sy0 - y0, sy1 - y0),
+                       slice(sx0 - x0, sx1 - x0))
+
+    def window(self, y0, y1, x0, x1):
+        """[y0, y1) x [x0, x1) penceresini yalnızca ilgili karoları okuyarak döndür"""
+        y0, x0 = max(y0, 0), max(x0, 0)
+        y1, x1 = min(y1, self.shape[0]), min(x1, self.shape[1])
+        out = np.empty((max(y1 - y0, 0), max(x1 - x0, 0)), dtype=np.int8)
+        if out.size:
+            for ty, tx, ty_s, tx_s, oy_s, ox_s in self._tile_spans(y0, y1, x0, x1):
+                out[oy_s, ox_s] = self.tile(ty, tx)[ty_s, tx_s]
+        return out
+
+    def window_field(self, name, y0, y1, x0, x1):
+        """Pencereyi planlayıcılara verilebilecek bir Field olarak döndür
+
+        Koordinatlar pencereye görelidir; sonuç yollarına (y0, x0) eklenmelidir.
+        """
+        return Field.from_mask(name, self.window(y0, y1, x0, x1) == OBSTACLE)
+
+    def write_window(self, y0, x0, values):
+        """values dizisini (y0, x0) köşesinden itibaren yaz"""
+        self._check_writable()
+        values = np.asarray(values, dtype=np.int8)
+        y1, x1 = y0 + values.shape[0], x0 + values.shape[1]
+        if y0 < 0 or x0 < 0 or y1 > self.shape[0] or x1 > self.shape[1]:
+            raise IndexError(f"Pencere tarla dışına taşıyor: {(y0, y1, x0, x1)}")
+        if not values.size:
+            return
+        for ty, tx, ty_s, tx_s, oy_s, ox_s in self._tile_spans(y0, y1, x0, x1):
+            self.tile(ty, tx)[ty_s, tx_s] = values[oy_s, ox_s]
+            self._mark_dirty(ty, tx)
+
+    def _write_cells(self, cells, value, keep_obstacles):
+        """Hücre listesine değer yaz; hücreler karolara göre gruplanır
+
+        Yalnızca gerçekten değişen hücresi olan karolar kirli işaretlenir.
+        """
+        self._check_writable()
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        if not len(cells):
+            return 0
+        outside = ((cells < 0) | (cells >= np.asarray(self.shape))).any(axis=1)
+        if outside.any():
+            raise IndexError(f"Hücre tarla dışında: {tuple(cells[outside][0].tolist())}")
+        tile_ids = (cells[:, 0] // self.tile_size) * self.tiles_shape[1] + cells[:, 1] // self.tile_size
+        order = np.argsort(tile_ids, kind="stable")
+        cells, tile_ids = cells[order], tile_ids[order]
+        bounds = np.flatnonzero(np.diff(tile_ids)) + 1
+        changed = 0
+        for group in np.split(np.arange(len(cells)), bounds):
+            ty, tx = divmod(int(tile_ids[group[0]]), self.tiles_shape[1])
+            tile = self.tile(ty, tx)
+            oy = cells[group, 0] - ty * self.tile_size
+            ox = cells[group, 1] - tx * self.tile_size
+            if keep_obstacles:
+                keep = tile[oy, ox] != OBSTACLE
+                oy, ox = oy[keep], ox[keep]
+            tile_changed = int((tile[oy, ox] != value).sum())
+            if tile_changed:
+                tile[oy, ox] = value
+                self._mark_dirty(ty, tx)
+                changed += tile_changed
+        return changed
+
+    def set_obstacles(self, obstacles, origin=(0, 0)):
+        """Engel hücrelerini yaz: (N, 2) indeksler ya da origin'e göre boolean maske
+
+        Tarla dışına düşen hücre varsa hiçbir şey yazılmadan IndexError fırlatılır.
+        """
+        obstacles = np.asarray(obstacles)
+        if obstacles.dtype == bool:
+            cells = np.argwhere(obstacles) + np.asarray(origin)
+        else:
+            cells = obstacles.reshape(-1, 2)
+        self._write_cells(cells, OBSTACLE, keep_obstacles=False)
+
+    def mark_covered(self, cells):
+        """Hücreleri işlenmiş olarak işaretle (engeller korunur); yeni işlenen sayısını döndür"""
+        return self._write_cells(cells, COVERED, keep_obstacles=True)
+
+    # Karo bazlı özetler
+
+    def iter_tiles(self):
+        """Tüm karoları (ty, tx, karo) olarak sırayla gez"""
+        for ty in range(self.tiles_shape[0]):
+            for tx in range(self.tiles_shape[1]):
+                yield ty, tx, self.tile(ty, tx)
+
+    def counts(self):
+        """Boş, işlenmiş ve engel hücre sayıları (dolgu hücreleri hariç)"""
+        totals = {"free": 0, "covered": 0, "obstacle": 0}
+        for ty, tx, tile in self.iter_tiles():
+            rows = min(self.tile_size, self.shape[0] - ty * self.tile_size)
+            cols = min(self.tile_size, self.shape[1] - tx * self.tile_size)
+            values = tile[:rows, :cols]
+            totals["obstacle"] += int((values == OBSTACLE).sum())
+            totals["covered"] += int((values == COVERED).sum())
+            totals["free"] += int((values == FREE).sum())
+        return totals
+
+    def overview(self, max_cells=200):
+        """Renderer'lar için küçültülmüş görünüm: (grid, stride)
+
+        Her stride x stride blok, içinde engel varsa -1, hücrelerin çoğu
+        işlenmişse 1, aksi halde 0 olur. stride karo boyutunu tam böler, böylece
+        her karo bir kez okunup bağımsız olarak indirgenir. Karo boyutu yetmezse
+        (çok geniş tarlalar) stride karo boyutunun katı olur ve bir blok birden
+        fazla karonun özetlerinden indirgenir.
+        """
+        needed = max(1, -(-max(self.shape) // max_cells))
+        if needed > self.tile_size:
+            return self._overview_multi_tile(-(-needed // self.tile_size))
+        stride = next(s for s in range(needed, self.tile_size + 1) if self.tile_size % s == 0)
+        per_tile = self.tile_size // stride
+        out = np.zeros((self.tiles_shape[0] * per_tile, self.tiles_shape[1] * per_tile), np.int8)
+        for ty, tx, tile in self.iter_tiles():
+            blocks = tile.reshape(per_tile, stride, per_tile, stride)
+            obstacle = (blocks == OBSTACLE).any(axis=(1, 3))
+            covered = (blocks == COVERED).mean(axis=(1, 3)) >= 0.5
+            view = np.where(obstacle, OBSTACLE, np.where(covered, COVERED, FREE))
+            out[ty * per_tile:(ty + 1) * per_tile, tx * per_tile:(tx + 1) * per_tile] = view
+        rows, cols = -(-self.shape[0] // stride), -(-self.shape[1] // stride)
+        return out[:rows, :cols], stride
+
+    def _overview_multi_tile(self, tiles_per_block):
+        """overview'un stride = tiles_per_block * tile_size durumu: karo özetlerini topla"""
+        stride = tiles_per_block * self.tile_size
+        rows, cols = -(-self.tiles_shape[0] // tiles_per_block), -(-self.tiles_shape[1] // tiles_per_block)
+        obstacle = np.zeros((rows, cols), dtype=bool)
+        covered = np.zeros((rows, cols), dtype=np.int64)
+        for ty, tx, tile in self.iter_tiles():
+            by, bx = ty // tiles_per_block, tx // tiles_per_block
+            obstacle[by, bx] |= bool((tile == OBSTACLE).any())
+            covered[by, bx] += int(np.count_nonzero(tile == COVERED))
+        out = np.where(obstacle, OBSTACLE, np.where(covered * 2 >= stride * stride, COVERED, FREE))
+        rows, cols = -(-self.shape[0] // stride), -(-self.shape[1] // stride)
+        return out[:rows, :cols], stride
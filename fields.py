@@ -0,0 +1,258 @@
+import json
+import os
+
+import numpy as np
+
+# Varsayılan tarla boyutu
+DEFAULT_GRID_SIZE = (30, 30)
+
+# Yerleşik tarla konfigürasyonları (GUI simülasyonu da bunları kullanır)
+BUILTIN_FIELDS = [
+    # Tarla 1: Dikey engeller
+    [
+        *[(i, 5) for i in range(1, 25)],  # Uzun dikey engel
+        *[(i, 15) for i in range(1, 25)], # İkinci dikey engel
+        *[(i, 25) for i in range(1, 25)], # Üçüncü dikey engel
+    ],
+    # Tarla 2: Yatay engeller
+    [
+        *[(5, j) for j in range(1, 25)],  # Uzun yatay engel
+        *[(15, j) for j in range(1, 25)], # İkinci yatay engel
+        *[(25, j) for j in range(1, 25)], # Üçüncü yatay engel
+    ],
+    # Tarla 3: Karma desenler
+    [
+        # Büyük L şeklinde engeller
+        *[(5, j) for j in range(5, 15)],
+        *[(i, 5) for i in range(5, 15)],
+        *[(15, j) for j in range(15, 25)],
+        *[(i, 15) for i in range(15, 25)],
+    ],
+    # Tarla 4: Çapraz engeller
+    [
+        *[(i, i) for i in range(1, 25)],  # Çapraz engel
+        *[(i, 25-i) for i in range(1, 25)],  # Ters çapraz engel
+    ]
+]
+
+
+class Field:
+    """Planlama için tarla tanımı: boyut ve engel hücreleri"""
+
+    def __init__(self, name, grid_size, obstacles):
+        self.name = name
+        self.grid_size = tuple(grid_size)
+        self.obstacles = [tuple(obs) for obs in obstacles]
+
+    @classmethod
+    def from_mask(cls, name, mask):
+        """Boolean doluluk maskesinden (True: engel) tarla oluştur"""
+        mask = np.asarray(mask, dtype=bool)
+        return cls(name, mask.shape, obstacles_from_occupancy(mask))
+
+    @classmethod
+    def from_indices(cls, name, grid_size, rows, cols):
+        """Engel satır/sütun indeks dizilerinden tarla oluştur"""
+        mask = np.zeros(grid_size, dtype=bool)
+        mask[np.asarray(rows, dtype=np.intp), np.asarray(cols, dtype=np.intp)] = True
+        return cls.from_mask(name, mask)
+
+    def occupancy(self):
+        """Engel hücreleri True olan boolean maske"""
+        mask = np.zeros(self.grid_size, dtype=bool)
+        if self.obstacles:
+            cells = np.asarray(self.obstacles, dtype=np.intp)
+            mask[cells[:, 0], cells[:, 1]] = True
+        return mask
+
+    def to_grid(self):
+        """Tarlayı 0: boş, -1: engel değerli bir grid'e dönüştür"""
+        return np.where(self.occupancy(), -1.0, 0.0)
+
+    def __repr__(self):
+        return f"Field({self.name!r}, {self.grid_size}, {len(self.obstacles)} engel)"
+
+
+def builtin_fields(grid_size=DEFAULT_GRID_SIZE):
+    """Yerleşik dört tarlayı Field listesi olarak döndür"""
+    return [Field(f"tarla_{i+1}", grid_size, obstacles)
+            for i, obstacles in enumerate(BUILTIN_FIELDS)]
+
+
+def obstacles_from_occupancy(occupancy):
+    """Doluluk dizisinden (True/1: engel) engel listesi çıkar"""
+    occupancy = np.asarray(occupancy)
+    return list(map(tuple, np.argwhere(occupancy > 0).tolist()))
+
+
+def _edge_cells(vertices):
+    """Çokgen kenarlarının geçtiği hücreler (ince engeller kaybolmasın diye)"""
+    start = vertices
+    end = np.roll(vertices, -1, axis=0)
+    samples = int(np.ceil(2 * np.abs(end - start).max())) + 1
+    t = np.linspace(0.0, 1.0, samples)[:, None, None]
+    points = start + (end - start) * t
+    return np.rint(points.reshape(-1, 2)).astype(np.intp)
+
+
+def rasterize_polygons(grid_size, polygons, max_block=1 << 22):
+    """Çokgen engelleri doluluk maskesine dönüştür
+
+    Köşeler (satır, sütun) hücre koordinatlarıdır. Merkezi çokgenin içinde
+    kalan hücreler (çift-tek kuralı) ve kenarların geçtiği hücreler engel olur.
+    Her çokgen için tüm kenarlar ve sınır kutusundaki tüm hücreler tek numpy
+    işleminde test edilir; bellek için satırlar max_block elemanlık bloklara
+    bölünür.
+    """
+    mask = np.zeros(grid_size, dtype=bool)
+    rows, cols = grid_size
+    for polygon in polygons:
+        vertices = np.asarray(polygon, dtype=float).reshape(-1, 2)
+        if len(vertices) < 3:
+            raise ValueError("Çokgen en az üç köşe içermeli")
+
+        y0 = max(int(np.floor(vertices[:, 0].min())), 0)
+        y1 = min(int(np.ceil(vertices[:, 0].max())) + 1, rows)
+        x0 = max(int(np.floor(vertices[:, 1].min())), 0)
+        x1 = min(int(np.ceil(vertices[:, 1].max())) + 1, cols)
+        if y0 >= y1 or x0 >= x1:
+            continue
+
+        # Kenarlar (E, 1, 1) olarak yayınlanır
+        ay, ax = vertices[:, 0, None, None], vertices[:, 1, None, None]
+        by, bx = np.roll(ay, -1, axis=0), np.roll(ax, -1, axis=0)
+        xs = np.arange(x0, x1, dtype=float)[None, None, :]
+        step = max(1, max_block // (len(vertices) * (x1 - x0)))
+        for start in range(y0, y1, step):
+            ys = np.arange(start, min(start + step, y1), dtype=float)[None, :, None]
+            straddles = (ay > ys) != (by > ys)
+            with np.errstate(divide='ignore', invalid='ignore'):
+                crossing_x = ax + (bx - ax) * (ys - ay) / (by - ay)
+            inside = np.logical_xor.reduce(straddles & (xs < crossing_x), axis=0)
+            mask[start:start + inside.shape[0], x0:x1] |= inside
+
+        cells = _edge_cells(vertices)
+        valid = ((cells[:, 0] >= 0) & (cells[:, 0] < rows)
+                 & (cells[:, 1] >= 0) & (cells[:, 1] < cols))
+        mask[cells[valid, 0], cells[valid, 1]] = True
+    return mask
+
+
+def _read_raster(path):
+    """GeoTIFF'i rasterio ile (kuruluysa) ilk bant olarak oku"""
+    try:
+        import rasterio
+    except ImportError:
+        return None
+    with rasterio.open(path) as dataset:
+        return dataset.read(1)
+
+
+def load_occupancy_image(path, threshold=128):
+    """Doluluk görüntüsünü oku: .npy doğrudan, GeoTIFF rasterio ile, diğerleri Pillow ile
+
+    Görüntülerde eşik değerinden koyu pikseller engel kabul edilir. rasterio
+    kurulu değilse .tif dosyaları da Pillow ile okunur.
+    """
+    if path.endswith(".npy"):
+        return np.load(path) > 0
+
+    if path.lower().endswith((".tif", ".tiff")):
+        band = _read_raster(path)
+        if band is not None:
+            return band < threshold
+
+    try:
+        from PIL import Image
+    except ImportError:
+        raise ImportError("Görüntü okumak için Pillow gerekli: pip install pillow")
+
+    with Image.open(path) as image:
+        pixels = np.asarray(image.convert("L"))
+    return pixels < threshold
+
+
+def field_from_dict(data, base_dir="."):
+    """JSON tarla tanımından Field oluştur
+
+    Desteklenen biçimler (obstacles ve polygons görüntüyle birleştirilebilir):
+        {"name": "t1", "grid_size": [30, 30], "obstacles": [[1, 5], ...]}
+        {"name": "t2", "image": "tarla.png", "threshold": 128}
+        {"name": "t3", "grid_size": [30, 30], "polygons": [[[2, 2], [2, 8], [6, 5]]]}
+    """
+    name = data.get("name", "tarla")
+
+    if "image" in data:
+        image_path = os.path.join(base_dir, data["image"])
+        occupancy = load_occupancy_image(image_path, data.get("threshold", 128))
+    elif "grid_size" in data:
+        occupancy = np.zeros(tuple(data["grid_size"]), dtype=bool)
+    else:
+        raise ValueError(f"Tarla tanımında grid_size eksik: {name}")
+
+    obstacles = np.asarray(data.get("obstacles", []), dtype=np.intp).reshape(-1, 2)
+    occupancy[obstacles[:, 0], obstacles[:, 1]] = True
+    if data.get("polygons"):
+        occupancy |= rasterize_polygons(occupancy.shape, data["polygons"])
+    return Field.from_mask(name, occupancy)
+
+
+def load_fields(path):
+    """JSON dosyasından tarla listesini yükle
+
+    Dosya bir tarla listesi ya da {"fields": [...]} biçiminde olabilir.
+    """
+    with open(path) as f:
+        data = json.load(f)
+
+    if isinstance(data, dict):
+        data = data.get("fields", [data])
+
+    base_dir = os.path.dirname(os.path.abspath(path))
+    return [field_from_dict(item, base_dir) for item in data]
+
+
+def random_field(size, density, seed=0):
+    """Verilen yoğunlukta rastgele engelli tarla (başlangıç ve bitiş boş bırakılır)"""
+    rng = np.random.default_rng(seed)
+    occupancy = rng.random((size, size)) < density
+    occupancy[0, 0] = occupancy[-1, -1] = False
+    name = f"rastgele_{size}_{int(density * 100)}_s{seed}"
+    return Field(name, occupancy.shape, obstacles_from_occupancy(occupancy))
+
+
+def maze_field(size, seed=0):
+    """Derinlik öncelikli arama ile labirent benzeri tarla üret"""
+    rng = np.random.default_rng(seed)
+    occupancy = np.ones((size, size), dtype=bool)
+    cells = (size + 1) // 2
+
+    # Hücreler çift indekslerde, aralarındaki duvarlar tek indekslerde
+    visited = np.zeros((cells, cells), dtype=bool)
+    stack = [(0, 0)]
+    visited[0, 0] = True
+    occupancy[0, 0] = False
+    while stack:
+        cy, cx = stack[-1]
+        options = [(cy + dy, cx + dx) for dy, dx in [(0, 1), (1, 0), (0, -1), (-1, 0)]
+                   if 0 <= cy + dy < cells and 0 <= cx + dx < cells
+                   and not visited[cy + dy, cx + dx]]
+        if not options:
+            stack.pop()
+            continue
+        ny, nx = options[rng.integers(len(options))]
+        visited[ny, nx] = True
+        occupancy[2*ny, 2*nx] = False
+        occupancy[cy + ny, cx + nx] = False  # Aradaki duvarı kaldır
+        stack.append((ny, nx))
+
+    if size % 2 == 0:
+        # Çift boyutlarda son satır/sütun hücre ızgarasına denk gelmez, koridor yap
+        occupancy[-1, :] = False
+        occupancy[:, -1] = False
+    return Field(f"labirent_{size}_s{seed}", occupancy.shape, obstacles_from_occupancy(occupancy))
+
+
+def open_field(size):
+    """Engelsiz açık tarla"""
+    return Field(f"acik_{size}", (size, size), [])
@@ -0,0 +1,348 @@
+"""Çok robotlu kapsama: alan bölümleme, paralel planlama ve makespan
+
+Boş alan robotların başlangıç noktalarına göre dengeli ve bağlantılı
+bölgelere ayrılır (DARP benzeri ağırlıklı jeodezik Voronoi). Her bölgenin
+kapsama yolu ayrı bir süreçte planlanır; sonuçta N yol, en uzun görev süresi
+(makespan) ve ortak geçiş hücreleri için çakışma raporu döner.
+
+--goals verilirse kapsama yerine robotlar başlangıçlarından hedeflerine
+uzay-zaman rezervasyonlu A* (öncelikli planlama / CBS) ile çakışmasız
+yönlendirilir.
+
+Kullanım:
+    python multi_robot.py --builtin --robots 3
+    python multi_robot.py tarlalar.json --robots 4 --planner ADAPTIVE --workers 4
+    python multi_robot.py --builtin --starts "0,0;29,29" --goals "29,29;0,0"
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from batch_planner import plan_field
+from fields import Field, builtin_fields, load_fields
+from parallel_planner import SharedGrid, _plan_job
+from planners.distance import UNREACHABLE, geodesic_distance
+from planners.planner_type import PlannerType
+from planners.spacetime_planner import plan_multi_agent
+
+# Bölgelenmemiş (engel ya da hiçbir robotun ulaşamadığı) hücre etiketi
+NO_REGION = -1
+
+MultiRobotPlan = namedtuple('MultiRobotPlan', ['paths', 'labels', 'stats', 'conflicts'])
+
+
+def default_starts(occupancy, robots):
+    """Başlangıç noktalarını en uzak nokta örneklemesiyle dağıt
+
+    İlk robot taramadaki ilk boş hücreden başlar; her yeni robot, seçilmiş
+    başlangıçlara jeodezik olarak en uzak hücreye yerleşir.
+    """
+    free = ~np.asarray(occupancy, dtype=bool)
+    first = np.argwhere(free)
+    if not len(first):
+        raise ValueError("Tarlada boş hücre yok")
+
+    starts = [tuple(int(v) for v in first[0])]
+    nearest = geodesic_distance(free, starts[0]).astype(np.int64)
+    for _ in range(robots - 1):
+        candidates = np.where(nearest > 0, nearest, -1)
+        if candidates.max() <= 0:
+            raise ValueError(f"{robots} robot için yeterli ulaşılabilir hücre yok")
+        start = np.unravel_index(np.argmax(candidates), free.shape)
+        starts.append(tuple(int(v) for v in start))
+        dist = geodesic_distance(free, start)
+        nearest = np.where(dist >= 0, np.minimum(nearest, dist), nearest)
+    return starts
+
+
+def _assign(cost, reachable, penalty):
+    labels = np.argmin(cost + penalty, axis=0)
+    return np.where(reachable, labels, NO_REGION)
+
+
+def partition_field(occupancy, starts, iterations=50, tolerance=0.02, learning_rate=0.3):
+    """Boş alanı robotlara dengeli ve bağlantılı bölgeler halinde ata
+
+    Her hücre ağırlıklı jeodezik mesafesi en küçük robota verilir; büyük
+    bölgelerin ağırlığı artırılıp küçüklerinki azaltılarak hücre sayıları
+    dengelenir. Başlangıcından kopuk kalan parçalar o robot için yasaklanıp
+    komşu bölgelere devredilir. Dönen etiket grid'inde -1 bölgesiz hücredir.
+    """
+    free = ~np.asarray(occupancy, dtype=bool)
+    for start in starts:
+        if not free[start]:
+            raise ValueError(f"Başlangıç noktası engel üzerinde: {start}")
+    if len(set(starts)) != len(starts):
+        raise ValueError("Robotların başlangıç noktaları farklı olmalı")
+
+    dist = np.stack([geodesic_distance(free, start) for start in starts]).astype(float)
+    dist[dist == UNREACHABLE] = np.inf
+    reachable = np.isfinite(dist).any(axis=0)
+    target = reachable.sum() / len(starts)
+    weights = np.ones(len(starts))
+
+    best = None
+    for _ in range(iterations):
+        cost = dist * weights[:, None, None]
+        penalty = np.zeros_like(dist)
+        labels = _assign(cost, reachable, penalty)
+        for _ in range(len(starts)):
+            orphans = False
+            for robot, start in enumerate(starts):
+                region = labels == robot
+                connected = geodesic_distance(region, start) >= 0
+                detached = region & ~connected
+                if detached.any():
+                    penalty[robot][detached] = np.inf
+                    orphans = True
+            if not orphans:
+                break
+            labels = _assign(cost, reachable, penalty)
+            # Tüm robotlar için yasaklanan hücreler en yakın robota döner
+            stuck = reachable & ~np.isfinite(cost + penalty).any(axis=0)
+            labels[stuck] = np.argmin(dist[:, stuck], axis=0)
+
+        sizes = np.bincount(labels[labels >= 0], minlength=len(starts))
+        imbalance = np.abs(sizes - target).max() / target
+        if best is None or imbalance < best[0]:
+            best = (imbalance, labels)
+        if imbalance <= tolerance:
+            break
+        weights *= 1 + learning_rate * (sizes / target - 1)
+    return best[1]
+
+
+def find_conflicts(paths):
+    """Yollar arasındaki çakışmaları bul
+
+    Robotlar her zaman adımında bir hücre ilerler ve yolunu bitiren robot son
+    hücresinde bekler. Aynı anda aynı hücre (vertex), karşılıklı yer
+    değiştirme (edge) çakışmaları ve birden fazla robotun kullandığı ortak
+    geçiş hücreleri (zamandan bağımsız) raporlanır.
+    """
+    paths = [np.asarray(p, dtype=np.int64).reshape(-1, 2) for p in paths if len(p)]
+    if len(paths) < 2:
+        return {"vertex": [], "edge": [], "shared_cells": 0}
+
+    horizon = max(len(p) for p in paths)
+    width = max(int(p[:, 1].max()) for p in paths) + 1
+    ids = np.empty((len(paths), horizon), dtype=np.int64)
+    for robot, path in enumerate(paths):
+        cells = path[:, 0] * width + path[:, 1]
+        ids[robot, :len(cells)] = cells
+        ids[robot, len(cells):] = cells[-1]
+
+    vertex = []
+    order = np.sort(ids, axis=0)
+    for t in np.flatnonzero((order[1:] == order[:-1]).any(axis=0)):
+        cells, counts = np.unique(ids[:, t], return_counts=True)
+        for cell in cells[counts > 1]:
+            robots = np.flatnonzero(ids[:, t] == cell).tolist()
+            vertex.append({"time": int(t), "cell": list(divmod(int(cell), width)),
+                           "robots": robots})
+
+    edge = []
+    if horizon > 1:
+        now, nxt = ids[:, :-1], ids[:, 1:]
+        swaps = ((now[:, None] == nxt[None, :]) & (nxt[:, None] == now[None, :])
+                 & (now[:, None] != now[None, :]))
+        for a, b, t in zip(*np.nonzero(np.triu(np.ones(len(paths), bool), 1)[:, :, None] & swaps)):
+            edge.append({"time": int(t), "robots": [int(a), int(b)],
+                         "cells": [list(divmod(int(ids[a, t]), width)),
+                                   list(divmod(int(ids[b, t]), width))]})
+
+    visited = np.concatenate([np.unique(row) for row in ids])
+    shared = int((np.bincount(visited) > 1).sum())
+    return {"vertex": vertex, "edge": edge, "shared_cells": shared}
+
+
+def _region_field(field, labels, robot):
+    """Robotun bölgesi dışındaki her hücreyi engel sayan tarla"""
+    blocked = np.argwhere(labels != robot)
+    return Field(f"{field.name}_robot{robot}", field.grid_size, map(tuple, blocked.tolist()))
+
+
+def _region_goal(labels, robot, start):
+    """Bölgenin başlangıca jeodezik olarak en uzak hücresi
+
+    Hedef alan planlayıcılar (A*, RRT vb.) için bölge içinde kalan bir hedef;
+    kapsama planlayıcıları bunu yok sayar.
+    """
+    dist = geodesic_distance(labels == robot, start)
+    return tuple(int(v) for v in np.unravel_index(np.argmax(dist), dist.shape))
+
+
+def _plan_regions(field, labels, starts, planner_type, workers):
+    """Her bölgenin kapsama yolunu (sıralı ya da paralel) planla"""
+    goals = [_region_goal(labels, robot, start) for robot, start in enumerate(starts)]
+    if workers == 1:
+        return [plan_field(_region_field(field, labels, robot), planner_type, start, goal)
+                for robot, (start, goal) in enumerate(zip(starts, goals))]
+
+    grids = [SharedGrid(labels != robot) for robot in range(len(starts))]
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_plan_job, grid.name, grid.shape,
+                                       f"{field.name}_robot{robot}", planner_type.name,
+                                       start, goal)
+                       for robot, (grid, start, goal) in enumerate(zip(grids, starts, goals))]
+            results = []
+            for future in futures:
+                path, stats = future.result()
+                results.append((path.tolist(), stats))
+            return results
+    finally:
+        for grid in grids:
+            grid.close()
+
+
+def plan_multi_robot(field, robots=2, starts=None, planner_type=PlannerType.ADAPTIVE,
+                     workers=None, speed=1.0):
+    """Tarlayı robotlar arasında bölüp her bölgeyi paralel planla
+
+    speed: robot hızı (hücre/s), makespan saniyesi için kullanılır.
+    workers: süreç sayısı (None: robot sayısı, 1: sıralı).
+    """
+    occupancy = field.to_grid() == -1
+    if starts is None:
+        starts = default_starts(occupancy, robots)
+    starts = [tuple(start) for start in starts]
+
+    partition_start = time.perf_counter()
+    labels = partition_field(occupancy, starts)
+    partition_time = time.perf_counter() - partition_start
+
+    planning_start = time.perf_counter()
+    results = _plan_regions(field, labels, starts, planner_type,
+                            workers or len(starts))
+    planning_time = time.perf_counter() - planning_start
+
+    paths = []
+    robot_stats = []
+    for robot, (start, (path, stats)) in enumerate(zip(starts, results)):
+        # Kapsama planlayıcıları başlangıç hücresini yola eklemez
+        if not path or tuple(path[0]) != start:
+            path = [start] + [tuple(p) for p in path]
+        paths.append(path)
+        robot_stats.append({
+            "robot": robot,
+            "start": list(start),
+            "region_cells": int((labels == robot).sum()),
+            "steps": len(path) - 1,
+            "time": (len(path) - 1) / speed,
+            "planning_time": stats.get("planning_time"),
+        })
+
+    steps = [s["steps"] for s in robot_stats]
+    stats = {
+        "field": field.name,
+        "planner": planner_type.name,
+        "robots": len(starts),
+        "partition_time": partition_time,
+        "planning_time": planning_time,
+        "makespan_steps": max(steps),
+        "makespan": max(steps) / speed,
+        "total_steps": sum(steps),
+        "balance": min(steps) / max(steps) if max(steps) else 1.0,
+        "unassigned_cells": int(((labels == NO_REGION) & ~occupancy).sum()),
+        "per_robot": robot_stats,
+    }
+    return MultiRobotPlan(paths, labels, stats, find_conflicts(paths))
+
+
+def route_robots(field, starts, goals, method="auto", speed=1.0):
+    """Robotları başlangıçlarından hedeflerine çakışmasız yönlendir"""
+    starts = [tuple(start) for start in starts]
+    goals = [tuple(goal) for goal in goals]
+    if len(starts) != len(goals):
+        raise ValueError("Her robot için bir hedef verilmeli")
+
+    planning_start = time.perf_counter()
+    paths = plan_multi_agent(field.grid_size, set(field.obstacles), starts, goals, method)
+    planning_time = time.perf_counter() - planning_start
+    if paths is None:
+        paths = [[] for _ in starts]
+
+    steps = [max(len(path) - 1, 0) for path in paths]
+    stats = {
+        "field": field.name,
+        "method": method,
+        "robots": len(starts),
+        "planning_time": planning_time,
+        "routed": sum(1 for path in paths if path),
+        "makespan_steps": max(steps),
+        "makespan": max(steps) / speed,
+        "total_steps": sum(steps),
+    }
+    return MultiRobotPlan(paths, None, stats, find_conflicts(paths))
+
+
+def _parse_cells(text):
+    return [tuple(int(v) for v in cell.split(",")) for cell in text.split(";")]
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="AgriEDGE çok robotlu kapsama planlama")
+    parser.add_argument("fields", nargs="?", help="Tarla tanımlarını içeren JSON dosyası")
+    parser.add_argument("--builtin", action="store_true",
+                        help="Yerleşik dört tarla konfigürasyonunu kullan")
+    parser.add_argument("--robots", type=int, default=2, help="Robot sayısı")
+    parser.add_argument("--starts", help="Başlangıçlar, örn. '0,0;29,29' (varsayılan: otomatik)")
+    parser.add_argument("--planner", default=PlannerType.ADAPTIVE.name,
+                        choices=[t.name for t in PlannerType],
+                        help="Bölge kapsama planlayıcısı")
+    parser.add_argument("--workers", type=int, help="Paralel işçi süreç sayısı (1: sıralı)")
+    parser.add_argument("--speed", type=float, default=1.0, help="Robot hızı (hücre/s)")
+    parser.add_argument("--goals", help="Hedefler, örn. '29,29;0,0' (kapsama yerine yönlendirme)")
+    parser.add_argument("--method", default="auto", choices=["auto", "cbs", "prioritized"],
+                        help="Yönlendirme yöntemi (--goals ile)")
+    parser.add_argument("--out", default="multi_robot_results", help="Çıktı dizini")
+    args = parser.parse_args(argv)
+    if not args.fields and not args.builtin:
+        parser.error("Bir tarla dosyası verilmeli ya da --builtin kullanılmalı")
+    if args.starts:
+        args.starts = _parse_cells(args.starts)
+        args.robots = len(args.starts)
+    if args.goals:
+        args.goals = _parse_cells(args.goals)
+        if not args.starts or len(args.starts) != len(args.goals):
+            parser.error("--goals ile aynı sayıda --starts verilmeli")
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    planner_type = PlannerType[args.planner]
+    fields = builtin_fields() if args.builtin else load_fields(args.fields)
+    os.makedirs(args.out, exist_ok=True)
+
+    summary = []
+    for field in fields:
+        if args.goals:
+            plan = route_robots(field, args.starts, args.goals, args.method, args.speed)
+        else:
+            plan = plan_multi_robot(field, args.robots, args.starts, planner_type,
+                                    args.workers, args.speed)
+        labels = plan.labels.tolist() if plan.labels is not None else None
+        with open(os.path.join(args.out, field.name + ".json"), "w") as f:
+            json.dump({"stats": plan.stats, "paths": plan.paths,
+                       "labels": labels, "conflicts": plan.conflicts}, f)
+        summary.append(plan.stats)
+        balance = f", denge {plan.stats['balance']:.2f}" if "balance" in plan.stats else ""
+        print(f"{field.name}: {plan.stats['robots']} robot, makespan "
+              f"{plan.stats['makespan_steps']} adım{balance}, "
+              f"{len(plan.conflicts['vertex']) + len(plan.conflicts['edge'])} çakışma")
+
+    with open(os.path.join(args.out, "summary.json"), "w") as f:
+        json.dump(summary, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
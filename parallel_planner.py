@@ -0,0 +1,100 @@
+"""Süreç havuzu ile paralel toplu yol planlama
+
+(tarla, planlayıcı) işleri ProcessPoolExecutor üzerinde dağıtılır. Her tarlanın
+doluluk grid'i bir kez paylaşımlı belleğe (shared memory) yazılır; işçiler grid'i
+kopyalamadan bu bellekten okur, böylece her işte grid pickle'lanmaz.
+"""
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from batch_planner import plan_field
+from fields import Field, obstacles_from_occupancy
+from planners.grid_path import GridPath
+from planners.planner_type import PlannerType
+
+
+class SharedGrid:
+    """Paylaşımlı bellekte tutulan salt okunur int8 doluluk grid'i"""
+
+    def __init__(self, occupancy):
+        occupancy = np.asarray(occupancy, dtype=np.int8)
+        self.shape = occupancy.shape
+        self.shm = shared_memory.SharedMemory(create=True, size=max(occupancy.nbytes, 1))
+        view = np.ndarray(self.shape, dtype=np.int8, buffer=self.shm.buf)
+        view[:] = occupancy
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def close(self):
+        """Belleği serbest bırak (sadece oluşturan süreç çağırmalı)"""
+        self.shm.close()
+        self.shm.unlink()
+
+
+def _attach(name):
+    """İşçi süreçte var olan paylaşımlı belleğe bağlan
+
+    Havuz işçileri ana sürecin resource tracker'ını paylaşır; belleğin
+    silinmesinden (unlink) yalnızca SharedGrid'i oluşturan ana süreç sorumludur.
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    return shared_memory.SharedMemory(name=name)
+
+
+def _plan_job(shm_name, shape, field_name, planner_name, start, goal, postprocess=None):
+    """İşçi süreçte çalışan tek planlama işi"""
+    shm = _attach(shm_name)
+    try:
+        occupancy = np.ndarray(shape, dtype=np.int8, buffer=shm.buf)
+        field = Field(field_name, shape, obstacles_from_occupancy(occupancy))
+        path, stats = plan_field(field, PlannerType[planner_name], start, goal, postprocess)
+        stats["worker_pid"] = os.getpid()
+        # Süreçler arası aktarımda run-length sıkıştırılmış biçimde gider
+        return GridPath(path), stats
+    finally:
+        shm.close()
+
+
+def plan_fields_parallel(fields, planner_types, max_workers=None, start=(0, 0), goal=None,
+                         postprocess=None):
+    """Tüm (tarla, planlayıcı) işlerini paralel planla
+
+    Sonuçlar bittikçe (yol, istatistikler) olarak yield edilir; sıralama
+    garanti edilmez. Hatalı işler istatistiklerde "error" alanıyla döner.
+    postprocess, plan_field'e aynen iletilir.
+    """
+    if isinstance(planner_types, PlannerType):
+        planner_types = [planner_types]
+
+    shared = []
+    try:
+        for field in fields:
+            shared.append((field, SharedGrid(field.to_grid() == -1)))
+
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = {}
+            for field, grid in shared:
+                for planner_type in planner_types:
+                    future = executor.submit(_plan_job, grid.name, grid.shape,
+                                             field.name, planner_type.name, start, goal,
+                                             postprocess)
+                    futures[future] = (field.name, planner_type.name)
+
+            for future in as_completed(futures):
+                field_name, planner_name = futures[future]
+                try:
+                    path, stats = future.result()
+                    yield path.tolist(), stats
+                except Exception as e:
+                    yield [], {"field": field_name, "planner": planner_name,
+                               "success": False, "error": str(e)}
+    finally:
+        for _, grid in shared:
+            grid.close()
@@ -1,33 +1,32 @@
 from planners.planner_type import PlannerType
-from planners.rrt_planner import RRTPlanner
-from planners.potential_field_planner import PotentialFieldPlanner
-from planners.adaptive_planner import AdaptivePathPlanner
-from planners.astar_planner import AStarPlanner
-from planners.voronoi_planner import VoronoiPlanner
-from planners.genetic_planner import GeneticPlanner
-from planners.ant_colony_planner import AntColonyPlanner
-from planners.wavefront_planner import WavefrontPlanner
+from planners.registry import get_planner_class, register_planner
 
 class PathPlannerFactory:
-    @staticmethod
-    def create_planner(planner_type: PlannerType, grid_size):
-        if planner_type == PlannerType.ADAPTIVE:
-            return AdaptivePathPlanner(grid_size)
-        elif planner_type == PlannerType.ASTAR:
-            return AStarPlanner(grid_size)
-        elif planner_type == PlannerType.RRT:
-            return RRTPlanner(grid_size)
-        elif planner_type == PlannerType.POTENTIAL_FIELD:
-            return PotentialFieldPlanner(grid_size)
-        elif planner_type == PlannerType.VORONOI:
-            return VoronoiPlanner(grid_size)
-        elif planner_type == PlannerType.GENETIC:
-            return GeneticPlanner(grid_size)
-        elif planner_type == PlannerType.ANT_COLONY:
-            return AntColonyPlanner(grid_size)
-        elif planner_type == PlannerType.WAVEFRONT:
-            return WavefrontPlanner(grid_size)
-        else:
-            # Varsayılan olarak Adaptif planlayıcıyı döndür
-            print(f"Uyarı: {planner_type.value} henüz implement edilmedi. Adaptif planlayıcı kullanılıyor.")
-            return AdaptivePathPlanner(grid_size) 
\ No newline at end of file
+    # (planlayıcı tipi, grid boyutu) -> prototip planlayıcı
+    # Prototip hiçbir çağırana verilmez; yalnızca pahalı kurulumu (ör. adaptif
+    # planlayıcının hafıza dosyası) tekrar kullanmak için tutulur
+    _instances = {}
+
+    @classmethod
+    def create_planner(cls, planner_type: PlannerType, grid_size, use_cache=True):
+        """Varsayılan ayarlı yeni bir planlayıcı; modülü ancak ilk istendiğinde import edilir
+
+        Maliyet katmanı, komşuluk, ölçüm ve ilerleme callback'i her örneğe
+        özeldir. use_cache=True ise örnek önbellekteki prototipten spawn ile
+        türetilir; use_cache=False tamamen bağımsız bir örnek oluşturur.
+        """
+        if not use_cache:
+            return get_planner_class(planner_type)(grid_size)
+
+        key = (planner_type, tuple(grid_size))
+        if key not in cls._instances:
+            cls._instances[key] = get_planner_class(planner_type)(grid_size)
+        return cls._instances[key].spawn()
+
+    @classmethod
+    def clear_cache(cls):
+        """Önbellekteki planlayıcıları temizle"""
+        cls._instances.clear()
+
+    # Harici planlayıcılar için kısayol: @PathPlannerFactory.register(PlannerType.X)
+    register = staticmethod(register_planner)
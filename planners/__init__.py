@@ -1,4 +1,29 @@
 from .planner_type import PlannerType
-from .rrt_planner import RRTPlanner
-from .potential_field_planner import PotentialFieldPlanner
-from .adaptive_planner import AdaptivePathPlanner 
\ No newline at end of file
+from .registry import register_planner, get_planner_class
+from .base_planner import BasePlanner, PlanningCancelled
+
+# Planlayıcı sınıfları NumPy gibi ağır bağımlılıklar getirdiği için
+# paket import edilirken değil, ilk erişildiğinde yüklenir
+_LAZY_EXPORTS = {
+    "RRTPlanner": ".rrt_planner",
+    "PotentialFieldPlanner": ".potential_field_planner",
+    "AdaptivePathPlanner": ".adaptive_planner",
+    "GridPath": ".grid_path",
+    "postprocess_path": ".postprocess",
+    "SpaceTimeAStarPlanner": ".spacetime_planner",
+    "ReservationTable": ".spacetime_planner",
+    "CostMap": ".cost_map",
+    "solve_tsp": ".tsp",
+    "order_waypoints": ".tsp",
+    "coverage_metrics": ".coverage_metrics",
+    "validate_path": ".validation",
+    "InvalidPathError": ".validation",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        import importlib
+        module = importlib.import_module(_LAZY_EXPORTS[name], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,12 +1,21 @@
+import copy
 import numpy as np
 import pickle
 import os
+import threading
+import time
 from collections import defaultdict
+from .base_planner import BasePlanner
+from .connectivity import grid_heuristic, grid_neighbors, step_length
+from .grid_path import GridPath
+
+class AdaptivePathPlanner(BasePlanner):
+    # Sütun taraması hedefe değil son sütunun ucuna varır
+    reaches_goal = False
 
-class AdaptivePathPlanner:
     def __init__(self, grid_size):
         """Adaptif yol planlayıcı başlatma"""
-        self.grid_size = grid_size
+        super().__init__(grid_size)
         # Başarılı rotaları saklamak için hafıza
         self.path_memory = defaultdict(list)
         # Rota başarı metriklerini tutmak için sözlük
@@ -17,10 +26,22 @@ class AdaptivePathPlanner:
         self.learning_rate = 0.1
         # Hafıza dosya yolu
         self.memory_file = 'path_memory.pkl'
+        # İlerleme bildirimi için kapsama taramasındaki toplam genişletme
+        self._progress_expanded = 0
+        # Hafıza spawn edilen örneklerle paylaşılır; öğrenme ve kaydetme bu kilitle
+        # sıralanır, böylece eşzamanlı işlerin öğrendiği rotalar birbirini ezmez
+        self._memory_lock = threading.RLock()
         
         # Eğer varsa önceki hafızayı yükle
         self._load_memory()
     
+    def spawn(self):
+        """Yeni örnek; hafıza dosyası yeniden okunmaz, öğrenilen rotalar ve kilit paylaşılır"""
+        planner = copy.copy(self)
+        BasePlanner.__init__(planner, self.grid_size)
+        planner._progress_expanded = 0
+        return planner
+    
     def _load_memory(self):
         """Önceki çalışmalardan kaydedilmiş hafızayı yükle"""
         if os.path.exists(self.memory_file):
@@ -34,33 +55,59 @@ class AdaptivePathPlanner:
     
     def save_memory(self):
         """Mevcut hafızayı kaydet"""
-        try:
-            with open(self.memory_file, 'wb') as f:
-                pickle.dump({
-                    'memory': self.path_memory,
-                    'scores': self.path_scores
-                }, f)
-        except Exception as e:
-            print(f"Hafıza kaydetme hatası: {e}")
+        with self._memory_lock:
+            try:
+                # Paralel süreç/thread'ler aynı dosyaya yazabileceği için önce geçici
+                # dosyaya yaz, sonra atomik olarak yerine taşı
+                tmp_file = f"{self.memory_file}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(tmp_file, 'wb') as f:
+                    pickle.dump({
+                        'memory': self.path_memory,
+                        'scores': self.path_scores
+                    }, f)
+                os.replace(tmp_file, self.memory_file)
+            except Exception as e:
+                print(f"Hafıza kaydetme hatası: {e}")
     
     def plan_path(self, start, goal, obstacles):
         """Yol planla"""
+        complete_path = []
+        for segment in self.iter_path(start, goal, obstacles):
+            complete_path.extend(segment)
+        return complete_path
+
+    def iter_path(self, start, goal, obstacles):
+        """Kapsama yolunu sütun sütun parçalar halinde üret
+
+        Her sütunun taraması (ve sonraki sütuna geçiş) bittiğinde o parça
+        yield edilir; tüketici tüm planın bitmesini beklemeden yürütmeye
+        başlayabilir. Öğrenme, tarama tamamlandıktan sonra tam yol ile yapılır.
+        """
         key = self._get_path_key(obstacles)
         
         # Hafızada benzer durum var mı kontrol et
-        if key in self.path_memory and self.path_scores[key] > 0.7:
+        # defaultdict'e okuma sırasında anahtar eklenmesin (hafıza başka thread'de kaydediliyor olabilir)
+        if key in self.path_memory and self.path_scores.get(key, 0.0) > 0.7:
+            self.stats.count("memory_hits")
             # Başarılı rotalardan en iyisini seç
             best_path = max(self.path_memory[key], 
                           key=lambda p: self._evaluate_path(p, obstacles))
-            return self._adapt_path(best_path, start, goal, obstacles)
+            yield self._adapt_path(best_path, start, goal, obstacles)
+            return
         
         # Hafızada uygun yol yoksa, basit bir kapsama yolu oluştur
-        complete_path = []
+        self.stats.count("memory_misses")
+        sweep_start = time.perf_counter()
+        self._progress_expanded = 0
+        complete_path = [start]
         current_pos = start
         direction = 1  # 1: aşağı, -1: yukarı
+        # Alt yollar ilk hücreleri atlanarak eklendiğinden başlangıç ayrıca verilir
+        yield [start]
         
         # Her sütunu dikey olarak tara
         for x in range(self.grid_size[1]):
+            segment = []
             if direction == 1:  # Aşağı doğru
                 y_range = range(self.grid_size[0])
             else:  # Yukarı doğru
@@ -68,12 +115,12 @@ class AdaptivePathPlanner:
                 
             for y in y_range:
                 target = (y, x)
-                if target not in obstacles:  # Engel değilse
+                if target not in obstacles and self._passable(target):  # Engel değilse
                     if target != current_pos:
                         # A* ile alt yolları bul
                         sub_path = self._find_path(current_pos, target, obstacles)
                         if sub_path:
-                            complete_path.extend(sub_path[1:])  # İlk pozisyonu atlayarak ekle
+                            segment.extend(sub_path[1:])  # İlk pozisyonu atlayarak ekle
                     current_pos = target
             
             # Bir sonraki sütuna geç
@@ -87,39 +134,63 @@ class AdaptivePathPlanner:
                 else:
                     next_target = (self.grid_size[0]-1, next_x)  # Alt
                 
-                if next_target not in obstacles:
+                if next_target not in obstacles and self._passable(next_target):
                     sub_path = self._find_path(current_pos, next_target, obstacles)
                     if sub_path:
-                        complete_path.extend(sub_path[1:])
+                        segment.extend(sub_path[1:])
                     current_pos = next_target
+            
+            complete_path.extend(segment)
+            self._report_progress(fraction=(x + 1) / self.grid_size[1],
+                                  covered_cells=len(complete_path),
+                                  expanded_nodes=self._progress_expanded)
+            if segment:
+                yield segment
+        
+        self.stats.add_time("coverage_sweep", time.perf_counter() - sweep_start)
         
         # Yeni yolu öğren
-        self.learn_from_path(complete_path, 1.0, obstacles)
-        return complete_path
+        with self.stats.timer("learn"):
+            self.learn_from_path(complete_path, 1.0, obstacles)
     
     def learn_from_path(self, path, success_score, obstacles):
         """Tamamlanan bir rotadan öğren"""
         key = self._get_path_key(obstacles)
-        self.path_memory[key].append(path)
-        
-        # Başarı puanını güncelle
-        current_score = self.path_scores[key]
-        self.path_scores[key] = (1 - self.learning_rate) * current_score + self.learning_rate * success_score
-        
-        # Hafızayı kaydet
-        self.save_memory()
+        with self._memory_lock:
+            # Hafıza ve pickle dosyası için kompakt (run-length) biçimde sakla
+            self.path_memory[key].append(GridPath(path))
+
+            # Başarı puanını güncelle
+            current_score = self.path_scores[key]
+            self.path_scores[key] = (1 - self.learning_rate) * current_score + self.learning_rate * success_score
+
+            # Hafızayı kaydet
+            self.save_memory()
     
     def _get_path_key(self, obstacles):
-        """Engel konfigürasyonuna göre benzersiz anahtar oluştur"""
-        return hash(tuple(sorted(obstacles)))
+        """Engel konfigürasyonuna (ve varsa maliyet katmanına) göre benzersiz anahtar oluştur"""
+        key = hash(tuple(sorted(obstacles)))
+        if self.cost_map is not None:
+            # Maliyetler değişince eski rotalar artık en iyi olmayabilir
+            key = hash((key, self.cost_map.fingerprint()))
+        if self.connectivity != 4:
+            # Çapraz adımlı rotalar 4-komşulu rotalarla karışmasın
+            key = hash((key, self.connectivity, self.corner_cutting))
+        return key
+
+    def _passable(self, pos):
+        return self.cost_map is None or self.cost_map.passable(pos)
     
     def _evaluate_path(self, path, obstacles):
         """Rotayı değerlendir"""
         if not path:
             return 0.0
             
-        # Rota uzunluğu
-        length_score = 1.0 / len(path)
+        # Rota uzunluğu (maliyet katmanı varsa ağırlıklı uzunluk)
+        if self.cost_map is None:
+            length_score = 1.0 / len(path)
+        else:
+            length_score = 1.0 / (self.cost_map.path_cost(path) + 1.0)
         
         # Engellerden uzaklık
         clearance_score = self._calculate_clearance(path, obstacles)
@@ -147,16 +218,7 @@ class AdaptivePathPlanner:
         if len(path) < 3:
             return 1.0
             
-        turns = 0
-        for i in range(1, len(path)-1):
-            dx1 = path[i][0] - path[i-1][0]
-            dy1 = path[i][1] - path[i-1][1]
-            dx2 = path[i+1][0] - path[i][0]
-            dy2 = path[i+1][1] - path[i][1]
-            
-            if (dx1, dy1) != (dx2, dy2):
-                turns += 1
-                
+        turns = GridPath(path).turn_count()
         return 1.0 / (turns + 1)
     
     def _adapt_path(self, path, start, goal, obstacles):
@@ -173,10 +235,14 @@ class AdaptivePathPlanner:
         return adapted_path
     
     def _adjust_endpoints(self, path, start, goal):
-        """Rotanın başlangıç ve bitiş noktalarını ayarla"""
+        """Rotayı başlangıçtan başlat
+
+        Tarama hedefte bitmediği için son nokta değiştirilmez (bkz. reaches_goal).
+        Başlangıcı içermeden kaydedilmiş eski rotalarda başlangıç başa eklenir.
+        """
         path = list(path)
-        path[0] = start
-        path[-1] = goal
+        if path[0] != start:
+            path.insert(0, start)
         return path
     
     def _avoid_obstacles(self, path, obstacles):
@@ -207,42 +273,56 @@ class AdaptivePathPlanner:
         if start == goal:
             return [start]
             
-        # Manhattan mesafesi için heuristik
+        # Maliyet katmanı varsa adım maliyeti girilen hücrenin maliyeti olur;
+        # sezgisel en küçük maliyetle ölçeklenerek kabul edilebilir kalır
+        costs = None if self.cost_map is None else self.cost_map.costs
+        scale = 1 if costs is None else self.cost_map.min_cost
+        connectivity = self.connectivity
+        
+        # Manhattan (4-komşulu) ya da oktil (8-komşulu) mesafe için heuristik
         def heuristic(a, b):
-            return abs(a[0] - b[0]) + abs(a[1] - b[1])
+            return scale * grid_heuristic(a, b, connectivity)
         
         # Komşu noktaları bul
         def get_neighbors(pos):
-            neighbors = []
-            for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-                new_pos = (pos[0] + dx, pos[1] + dy)
-                if (0 <= new_pos[0] < self.grid_size[0] and 
-                    0 <= new_pos[1] < self.grid_size[1] and 
-                    new_pos not in obstacles):
-                    neighbors.append(new_pos)
-            return neighbors
+            return grid_neighbors(pos, self.grid_size, obstacles, costs,
+                                  connectivity, self.corner_cutting)
         
         # A* algoritması
         frontier = [(0, start)]
         came_from = {start: None}
         cost_so_far = {start: 0}
+        # Sayaçlar döngüde yerel tutulur, ölçüme sonda tek seferde yazılır
+        expanded = 0
+        pushes = 1
         
         while frontier:
             current = frontier.pop(0)[1]
+            expanded += 1
             
             if current == goal:
                 break
                 
             for next_pos in get_neighbors(current):
-                new_cost = cost_so_far[current] + 1
+                step = 1 if connectivity == 4 else step_length(current, next_pos)
+                if costs is not None:
+                    step *= costs.item(next_pos)
+                new_cost = cost_so_far[current] + step
                 
                 if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
                     cost_so_far[next_pos] = new_cost
                     priority = new_cost + heuristic(goal, next_pos)
                     frontier.append((priority, next_pos))
                     frontier.sort()  # Önceliğe göre sırala
+                    pushes += 1
                     came_from[next_pos] = current
         
+        self._progress_expanded += expanded
+        self.stats.count("subpath_searches")
+        self.stats.count("expanded_nodes", expanded)
+        self.stats.count("heap_pushes", pushes)
+        self.stats.count("collision_checks", connectivity * expanded)
+        
         # Yolu oluştur
         if goal not in came_from:
             return None
@@ -1,4 +1,5 @@
 from .base_planner import BasePlanner
+from .connectivity import grid_heuristic, grid_neighbors, step_length
 import heapq
 
 class AStarPlanner(BasePlanner):
@@ -6,27 +7,49 @@ class AStarPlanner(BasePlanner):
         super().__init__(grid_size)
     
     def plan_path(self, start, goal, obstacles):
-        """A* algoritması ile yol planla"""
+        """A* algoritması ile yol planla
+
+        cost_map ayarlıysa adım maliyeti girilen hücrenin maliyetidir; sezgisel
+        en küçük maliyetle ölçeklenir, böylece kabul edilebilir kalır. 8-komşulu
+        modda çapraz adımlar √2 uzunluğundadır ve oktil sezgisel kullanılır.
+        """
+        costs = None if self.cost_map is None else self.cost_map.costs
+        scale = 1 if costs is None else self.cost_map.min_cost
+        diagonal = self.connectivity == 8
         frontier = []
         heapq.heappush(frontier, (0, start))
         came_from = {start: None}
         cost_so_far = {start: 0}
+        # Sayaçlar döngüde yerel tutulur, ölçüme sonda tek seferde yazılır
+        expanded = 0
+        pushes = 1
         
         while frontier:
             current = heapq.heappop(frontier)[1]
+            expanded += 1
+            if expanded % 1024 == 0:
+                self._report_progress(expanded_nodes=expanded)
             
             if current == goal:
                 break
                 
             for next_pos in self._get_neighbors(current, obstacles):
-                new_cost = cost_so_far[current] + 1
+                step = step_length(current, next_pos) if diagonal else 1
+                if costs is not None:
+                    step *= costs.item(next_pos)
+                new_cost = cost_so_far[current] + step
                 
                 if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
                     cost_so_far[next_pos] = new_cost
-                    priority = new_cost + self._heuristic(goal, next_pos)
+                    priority = new_cost + scale * self._heuristic(goal, next_pos)
                     heapq.heappush(frontier, (priority, next_pos))
+                    pushes += 1
                     came_from[next_pos] = current
         
+        self.stats.count("expanded_nodes", expanded)
+        self.stats.count("heap_pushes", pushes)
+        self.stats.count("collision_checks", self.connectivity * expanded)
+        
         # Yolu oluştur
         path = []
         current = goal
@@ -37,16 +60,11 @@ class AStarPlanner(BasePlanner):
         return path
     
     def _heuristic(self, a, b):
-        """Manhattan mesafesi hesapla"""
-        return abs(a[0] - b[0]) + abs(a[1] - b[1])
+        """Manhattan (4-komşulu) ya da oktil (8-komşulu) mesafe hesapla"""
+        return grid_heuristic(a, b, self.connectivity)
     
     def _get_neighbors(self, pos, obstacles):
         """Geçerli komşu pozisyonları bul"""
-        neighbors = []
-        for dx, dy in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            new_pos = (pos[0] + dx, pos[1] + dy)
-            if (0 <= new_pos[0] < self.grid_size[0] and 
-                0 <= new_pos[1] < self.grid_size[1] and 
-                new_pos not in obstacles):
-                neighbors.append(new_pos)
-        return neighbors 
\ No newline at end of file
+        costs = None if self.cost_map is None else self.cost_map.costs
+        return grid_neighbors(pos, self.grid_size, obstacles, costs,
+                              self.connectivity, self.corner_cutting)
@@ -1,10 +1,104 @@
 from abc import ABC, abstractmethod
 
+from .connectivity import check_connectivity
+from .instrumentation import NULL_STATS, PlannerStats, traced
+
+
+class PlanningCancelled(Exception):
+    """İlerleme callback'i planlamayı iptal etmek için bu hatayı fırlatır"""
+
+
 class BasePlanner(ABC):
+    # Çıktı yolunun adım kuralı; None ise arama ayarı (connectivity/corner_cutting)
+    # geçerlidir. Sürekli yoldan hücre üreten planlayıcılar bunları geçersiz kılar.
+    path_connectivity = None
+    path_corner_cutting = None
+    # Yol hedefte bitiyor mu; kapsama taramaları son hücrede biter ve False yapar
+    reaches_goal = True
+
     def __init__(self, grid_size):
         self.grid_size = grid_size
+        # Ölçüm varsayılan olarak kapalı
+        self.stats = NULL_STATS
+        # İsteğe bağlı ilerleme callback'i: callback(bilgi_sözlüğü)
+        # Arka plan işlerinde PlanningCancelled fırlatarak planlamayı durdurabilir
+        self.progress_callback = None
+        # İsteğe bağlı arazi maliyeti katmanı (cost_map.CostMap); yoksa her adım 1
+        self.cost_map = None
+        # Izgara aramalarında komşuluk (4 ya da 8) ve çapraz adımda köşe kesme kuralı
+        self.connectivity = 4
+        self.corner_cutting = "never"
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Her planlayıcının plan_path'i ölçüm kaydı tutacak şekilde sarmalanır
+        if "plan_path" in cls.__dict__:
+            cls.plan_path = traced(cls.__dict__["plan_path"])
+
+    def spawn(self):
+        """Aynı tip ve grid boyutunda, varsayılan ayarlı yeni bir örnek
+
+        PathPlannerFactory önbellekteki prototipi değil bunun sonucunu verir.
+        Pahalı kurulumu olan planlayıcılar bu durumu paylaşacak şekilde
+        geçersiz kılar.
+        """
+        return type(self)(self.grid_size)
+
+    def enable_instrumentation(self, enabled=True):
+        """Sayaç, zamanlayıcı ve çağrı kayıtlarını aç/kapat"""
+        if not enabled:
+            self.stats = NULL_STATS
+        elif not self.stats.enabled:
+            self.stats = PlannerStats()
+        return self.stats
+    
+    def set_cost_map(self, cost_map):
+        """Arazi maliyeti katmanını ayarla (None: birim adım maliyeti)
+
+        Katman paylaşılır, kopyalanmaz; yerinde yapılan güncellemeler sonraki
+        planlamalarda doğrudan geçerli olur.
+        """
+        if cost_map is not None and tuple(cost_map.grid_size) != tuple(self.grid_size):
+            raise ValueError(f"Maliyet katmanı boyutu grid ile uyuşmuyor: {cost_map.grid_size}")
+        self.cost_map = cost_map
+
+    def set_connectivity(self, connectivity, corner_cutting="never"):
+        """Izgara aramalarının komşuluğunu ayarla (bkz. connectivity.CORNER_CUTTING_RULES)"""
+        check_connectivity(connectivity, corner_cutting)
+        self.connectivity = connectivity
+        self.corner_cutting = corner_cutting
+
+    def validate(self, path, start, goal, obstacles):
+        """Yolu bu planlayıcının adım kuralı ve maliyet katmanıyla doğrula
+
+        Sonuç validation.ValidationResult'tır; bkz. validation.validate_path.
+        reaches_goal False ise yolun hedefte bitmesi beklenmez.
+        """
+        # NumPy'ı çeken modül, paket import edilirken değil ilk doğrulamada yüklenir
+        from .validation import validate_path
+        connectivity = self.path_connectivity or self.connectivity
+        corner_cutting = self.path_corner_cutting or self.corner_cutting
+        goal = goal if self.reaches_goal else None
+        return validate_path(path, self.grid_size, obstacles, start=start, goal=goal,
+                             connectivity=connectivity, corner_cutting=corner_cutting,
+                             cost_map=self.cost_map)
+
+    def _report_progress(self, **info):
+        """Uzun planlamalarda ara ilerleme bildir (callback yoksa maliyetsiz)"""
+        if self.progress_callback is not None:
+            self.progress_callback(info)
     
     @abstractmethod
     def plan_path(self, start, goal, obstacles):
         """Yol planlama metodu - her alt sınıf implement etmeli"""
-        pass 
\ No newline at end of file
+        pass
+    
+    def iter_path(self, start, goal, obstacles):
+        """Yolu parçalar halinde üret (akışlı tüketiciler için)
+
+        Varsayılan olarak plan_path sonucunu tek parça olarak verir; parça parça
+        plan üretebilen planlayıcılar bunu geçersiz kılar.
+        """
+        path = self.plan_path(start, goal, obstacles)
+        if path:
+            yield path
@@ -0,0 +1,72 @@
+import math
+
+SQRT2 = math.sqrt(2)
+
+# Sıra önemlidir: 4-komşulu aramalar eskiden olduğu gibi aynı eşitlik
+# bozma sırasıyla aynı yolları üretir
+ORTHOGONAL_MOVES = ((0, 1), (1, 0), (0, -1), (-1, 0))
+DIAGONAL_MOVES = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+
+# Çapraz adımda köşe kesme kuralları:
+#   "never":    iki dik komşu da boş olmalı (engelin köşesine sürtünmez)
+#   "one_free": en az biri boş olmalı (iki engel arasındaki çapraz boşluktan geçmez)
+#   "always":   yalnızca hedef hücre boş olmalı
+CORNER_CUTTING_RULES = ("never", "one_free", "always")
+
+
+def check_connectivity(connectivity, corner_cutting="never"):
+    """Komşuluk ayarlarını doğrula"""
+    if connectivity not in (4, 8):
+        raise ValueError(f"Komşuluk 4 ya da 8 olmalı: {connectivity}")
+    if corner_cutting not in CORNER_CUTTING_RULES:
+        raise ValueError(f"Bilinmeyen köşe kesme kuralı: {corner_cutting}")
+
+
+def grid_neighbors(pos, grid_size, obstacles, costs=None, connectivity=4, corner_cutting="never"):
+    """pos'un geçilebilir komşuları
+
+    obstacles üyelik testi destekleyen bir koleksiyondur; costs verilirse
+    maliyeti inf olan hücreler de geçilemez sayılır.
+    """
+    rows, cols = grid_size
+    y, x = pos
+
+    def free(cell):
+        return (0 <= cell[0] < rows and 0 <= cell[1] < cols and
+                cell not in obstacles and
+                (costs is None or costs.item(cell) != math.inf))
+
+    neighbors = []
+    for dy, dx in ORTHOGONAL_MOVES:
+        cell = (y + dy, x + dx)
+        if free(cell):
+            neighbors.append(cell)
+    if connectivity == 4:
+        return neighbors
+
+    for dy, dx in DIAGONAL_MOVES:
+        cell = (y + dy, x + dx)
+        if not free(cell):
+            continue
+        if corner_cutting != "always":
+            side_y = (y + dy, x) in neighbors
+            side_x = (y, x + dx) in neighbors
+            if corner_cutting == "never" and not (side_y and side_x):
+                continue
+            if corner_cutting == "one_free" and not (side_y or side_x):
+                continue
+        neighbors.append(cell)
+    return neighbors
+
+
+def step_length(a, b):
+    """Komşu iki hücre arası adım uzunluğu (dik: 1, çapraz: √2)"""
+    return SQRT2 if a[0] != b[0] and a[1] != b[1] else 1
+
+
+def grid_heuristic(a, b, connectivity=4):
+    """Komşuluğa uygun kabul edilebilir mesafe: 4 için Manhattan, 8 için oktil"""
+    dy, dx = abs(a[0] - b[0]), abs(a[1] - b[1])
+    if connectivity == 4:
+        return dy + dx
+    return max(dy, dx) + (SQRT2 - 1) * min(dy, dx)
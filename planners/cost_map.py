@@ -0,0 +1,157 @@
+import operator
+import zlib
+
+import numpy as np
+
+# Varsayılan (düz, kuru zemin) adım maliyeti
+DEFAULT_COST = 1.0
+# Geçilemeyen hücre maliyeti (engel gibi davranır)
+IMPASSABLE = np.inf
+
+
+class CostMap:
+    """Hücre başına arazi maliyeti katmanı (float32)
+
+    Bir hücreye girmenin maliyeti costs[y, x] ile verilir: eğim, çamur, ekin
+    sırası ya da işlenmiş hücreler için 1'den büyük değerler kullanılır.
+    Maliyetler pozitif olmalıdır; IMPASSABLE (inf) hücreler geçilemez.
+
+    Katman yerinde güncellenir. En küçük maliyet (sezgisel ölçeği) ve içerik
+    parmak izi karo başına önbelleklenir; bir güncelleme yalnızca dokunduğu
+    karoların özetlerini yeniden hesaplatır.
+    """
+
+    def __init__(self, grid_size, default=DEFAULT_COST, tile_size=64):
+        self.grid_size = tuple(grid_size)
+        self.costs = np.full(self.grid_size, default, dtype=np.float32)
+        self._check(self.costs)
+        self.tile_size = tile_size
+        tiles = (-(-self.grid_size[0] // tile_size), -(-self.grid_size[1] // tile_size))
+        # Karo özetleri: en küçük sonlu maliyet ve içerik özeti (crc32)
+        self._tile_min = np.empty(tiles, dtype=np.float64)
+        self._tile_digest = np.zeros(tiles, dtype=np.uint32)
+        self._stale = np.ones(tiles, dtype=bool)
+        # Her güncellemede artar; planlayıcılar önbelleklerini buna göre tazeler
+        self.version = 0
+
+    @classmethod
+    def from_array(cls, costs, tile_size=64):
+        costs = np.asarray(costs)
+        cost_map = cls(costs.shape, tile_size=tile_size)
+        cost_map.update(0, 0, costs)
+        return cost_map
+
+    @staticmethod
+    def _check(values):
+        if np.isnan(values).any() or (values <= 0).any():
+            raise ValueError("Maliyetler pozitif olmalı (geçilemeyen hücreler için inf)")
+
+    # Güncelleme
+
+    def _touch(self, y0, y1, x0, x1):
+        size = self.tile_size
+        self._stale[y0 // size:(y1 - 1) // size + 1, x0 // size:(x1 - 1) // size + 1] = True
+        self.version += 1
+
+    def update(self, y0, x0, values):
+        """values dizisini (y0, x0) köşesinden itibaren yerinde yaz"""
+        values = np.asarray(values, dtype=np.float32)
+        self._check(values)
+        y1, x1 = y0 + values.shape[0], x0 + values.shape[1]
+        self.costs[y0:y1, x0:x1] = values
+        if values.size:
+            self._touch(y0, y1, x0, x1)
+
+    def set_cells(self, cells, value):
+        """Hücre listesine ((N, 2) indeks) tek bir maliyet yaz"""
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        self._check(np.float32(value))
+        if not len(cells):
+            return
+        self.costs[cells[:, 0], cells[:, 1]] = value
+        size = self.tile_size
+        self._stale[cells[:, 0] // size, cells[:, 1] // size] = True
+        self.version += 1
+
+    def scale_cells(self, cells, factor):
+        """Hücrelerin maliyetini factor ile çarp (ör. işlenmiş hücreleri pahalılaştır)"""
+        cells = np.asarray(cells, dtype=np.intp).reshape(-1, 2)
+        if factor <= 0:
+            raise ValueError("Çarpan pozitif olmalı")
+        if not len(cells):
+            return
+        self.costs[cells[:, 0], cells[:, 1]] *= np.float32(factor)
+        size = self.tile_size
+        self._stale[cells[:, 0] // size, cells[:, 1] // size] = True
+        self.version += 1
+
+    @staticmethod
+    def _span(index, size):
+        """Tek eksendeki tamsayı ya da dilim indeksinin kapladığı [başlangıç, bitiş)"""
+        if isinstance(index, slice):
+            cells = range(*index.indices(size))
+            if not cells:
+                return 0, 0
+            return min(cells[0], cells[-1]), max(cells[0], cells[-1]) + 1
+        try:
+            index = operator.index(index)
+        except TypeError:
+            raise TypeError("Yalnızca tamsayı ve dilim indeksleri desteklenir; "
+                            "hücre listeleri için set_cells kullanın") from None
+        if not -size <= index < size:
+            raise IndexError(f"İndeks grid dışında: {index}")
+        index %= size
+        return index, index + 1
+
+    def __setitem__(self, key, value):
+        """costs[key] = value gibi; key (y, x) ya da satır/sütun dilimleridir"""
+        if not (isinstance(key, tuple) and len(key) == 2):
+            raise TypeError("Anahtar (satır, sütun) olmalı")
+        (y0, y1), (x0, x1) = (self._span(k, n) for k, n in zip(key, self.grid_size))
+        values = np.asarray(value, dtype=np.float32)
+        self._check(values)
+        self.costs[key] = values
+        if y1 > y0 and x1 > x0:
+            self._touch(y0, y1, x0, x1)
+
+    # Sorgular
+
+    def __getitem__(self, pos):
+        return self.costs.item(pos)
+
+    def passable(self, pos):
+        return self.costs.item(pos) != IMPASSABLE
+
+    def impassable_mask(self):
+        return np.isinf(self.costs)
+
+    def _refresh(self):
+        """Yalnızca değişmiş karoların özetlerini yeniden hesapla"""
+        if not self._stale.any():
+            return
+        size = self.tile_size
+        for ty, tx in np.argwhere(self._stale).tolist():
+            tile = self.costs[ty * size:(ty + 1) * size, tx * size:(tx + 1) * size]
+            finite = tile[np.isfinite(tile)]
+            self._tile_min[ty, tx] = finite.min() if finite.size else np.inf
+            self._tile_digest[ty, tx] = zlib.crc32(np.ascontiguousarray(tile).tobytes())
+        self._stale[:] = False
+
+    @property
+    def min_cost(self):
+        """En küçük sonlu maliyet; sezgiselin kabul edilebilir kalması için çarpan"""
+        self._refresh()
+        smallest = float(self._tile_min.min())
+        return smallest if np.isfinite(smallest) else DEFAULT_COST
+
+    def fingerprint(self):
+        """İçeriğe bağlı özet; yol hafızası anahtarlarında kullanılır"""
+        self._refresh()
+        return zlib.crc32(self._tile_digest.tobytes())
+
+    def path_cost(self, path):
+        """Yolun toplam maliyeti (başlangıç hücresi hariç, her girilen hücre)"""
+        if len(path) < 2:
+            return 0.0
+        cells = np.asarray(path, dtype=np.intp)[1:]
+        return float(self.costs[cells[:, 0], cells[:, 1]].sum(dtype=np.float64))
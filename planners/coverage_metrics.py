@@ -0,0 +1,106 @@
+"""Planlanmış yolun kapsama kalitesi ölçümleri
+
+Tüm hesaplar düz (flat) hücre indeksleri üzerinde NumPy ile yapılır: ziyaret
+sayıları np.bincount ile, her hücrenin ilk ziyaret adımı np.unique'in
+return_index çıktısıyla bulunur. Milyon hücrelik yollar milisaniyeler içinde ölçülür.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .grid_path import GridPath
+
+# coverage_ratio: ziyaret edilen boş hücre / tüm boş hücre
+# revisited_cells: birden fazla ziyaret edilen hücre sayısı
+# overlap_ratio: tekrar ziyaretlerin (fazla adımların) toplam ziyarete oranı
+# working_distance: yeni hücreye giren adımların uzunluğu, transit_distance: geri kalanı
+# out_of_bounds / obstacle_visits: grid dışına ya da engele düşen yol noktaları
+CoverageMetrics = namedtuple('CoverageMetrics', [
+    'coverage_ratio', 'free_cells', 'covered_cells', 'uncovered_cells',
+    'revisited_cells', 'overlap_ratio', 'working_distance', 'transit_distance',
+    'turns', 'steps', 'out_of_bounds', 'obstacle_visits'])
+
+
+def _points(path):
+    if isinstance(path, GridPath):
+        return path.array.astype(np.int64)
+    return np.asarray(path, dtype=np.int64).reshape(-1, 2)
+
+
+def visit_counts(path, shape):
+    """Her hücrenin kaç kez ziyaret edildiği (grid dışı noktalar yok sayılır)"""
+    points = _points(path)
+    rows, cols = points[:, 0], points[:, 1]
+    inside = (rows >= 0) & (rows < shape[0]) & (cols >= 0) & (cols < shape[1])
+    flat = rows[inside] * shape[1] + cols[inside]
+    return np.bincount(flat, minlength=shape[0] * shape[1]).reshape(shape)
+
+
+def _turns(dy, dx):
+    # (N, 2) üzerinde axis=1 indirgemesi yavaş olduğundan sütunlar ayrı işlenir
+    moving = (dy != 0) | (dx != 0)
+    dy, dx = dy[moving], dx[moving]
+    if len(dy) < 2:
+        return 0
+    return int(np.count_nonzero((dy[1:] != dy[:-1]) | (dx[1:] != dx[:-1])))
+
+
+def count_turns(path):
+    """Yön değişikliği sayısı (yerinde bekleme adımları atlanır)"""
+    points = _points(path)
+    return _turns(np.diff(points[:, 0]), np.diff(points[:, 1]))
+
+
+def coverage_metrics(path, free):
+    """Yolun kapsama, tekrar, boşta kalan alan, iş/transit mesafesi ve dönüş ölçümleri
+
+    free: boş hücrelerde True olan boolean grid (ör. robot.grid != -1).
+    Sonuç CoverageMetrics'tir; JSON için ._asdict() kullanılabilir.
+    """
+    free = np.asarray(free, dtype=bool)
+    points = _points(path)
+    free_cells = int(free.sum())
+    if not len(points):
+        return CoverageMetrics(0.0, free_cells, 0, free_cells, 0, 0.0, 0.0, 0.0, 0, 0, 0, 0)
+
+    rows, cols = points[:, 0], points[:, 1]
+    inside = (rows >= 0) & (rows < free.shape[0]) & (cols >= 0) & (cols < free.shape[1])
+    valid = rows[inside] * free.shape[1] + cols[inside]
+
+    visits = np.bincount(valid, minlength=free.size)
+    flat_free = free.ravel()
+    covered = int(np.count_nonzero(visits[flat_free]))
+    revisited = int(np.count_nonzero(visits > 1))
+    obstacle_visits = int(visits[~flat_free].sum())
+
+    # Her hücrenin ilk ziyaret adımı: np.unique her değerin ilk geçtiği indeksi verir
+    order = np.flatnonzero(inside)
+    _, first = np.unique(valid, return_index=True)
+    is_first = np.zeros(len(points), dtype=bool)
+    is_first[order[first]] = True
+
+    dy, dx = np.diff(points[:, 0]), np.diff(points[:, 1])
+    lengths = np.hypot(dy, dx)
+    working = float(lengths[is_first[1:]].sum())
+    transit = float(lengths.sum()) - working
+
+    return CoverageMetrics(
+        coverage_ratio=covered / max(free_cells, 1),
+        free_cells=free_cells,
+        covered_cells=covered,
+        uncovered_cells=free_cells - covered,
+        revisited_cells=revisited,
+        overlap_ratio=float(len(valid) - np.count_nonzero(visits)) / len(valid) if len(valid) else 0.0,
+        working_distance=working,
+        transit_distance=transit,
+        turns=_turns(dy, dx),
+        steps=len(points) - 1,
+        out_of_bounds=int(len(points) - len(valid)),
+        obstacle_visits=obstacle_visits,
+    )
+
+
+def uncovered_mask(path, free):
+    """Yolun hiç uğramadığı boş hücreler (boolean grid)"""
+    free = np.asarray(free, dtype=bool)
+    return free & (visit_counts(path, free.shape) == 0)
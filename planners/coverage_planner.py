@@ -0,0 +1,326 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .astar_planner import AStarPlanner
+from .base_planner import BasePlanner
+from .distance import geodesic_distance
+from .grid_path import GridPath
+from .postprocess import occupancy_from_obstacles
+from .tsp import distance_matrix, solve_tsp
+
+# Ayrıştırılmış bölge: kimlik, tarama yönü ("columns"/"rows") ve sırasıyla
+# taranacak geçişler (her geçiş bitişik hücre listesi)
+SweepCell = namedtuple('SweepCell', ['index', 'direction', 'passes'])
+
+
+def _runs(line):
+    """Boolean dizideki ardışık True bölümleri: [(başlangıç, bitiş), ...] (bitiş dahil)"""
+    padded = np.concatenate(([0], line.astype(np.int8), [0]))
+    change = np.diff(padded)
+    return list(zip(np.flatnonzero(change == 1).tolist(), (np.flatnonzero(change == -1) - 1).tolist()))
+
+
+def boustrophedon_cells(mask):
+    """Boustrophedon ayrıştırma: her bölge sütun yönünde monotondur
+
+    Sütunlar soldan sağa taranır; bir sütundaki boş bölüm önceki sütunda
+    yalnızca bir bölümle ve o bölüm de yalnızca bununla örtüşüyorsa aynı
+    bölgede devam eder, aksi halde (bölünme/birleşme olayı) yeni bölge açılır.
+    Sonuç (etiketler, bölge sayısı); bölge dışı hücreler -1'dir.
+    """
+    labels = np.full(mask.shape, -1, dtype=np.int32)
+    previous = []
+    count = 0
+    for x in range(mask.shape[1]):
+        segments = _runs(mask[:, x])
+        current = []
+        for y0, y1 in segments:
+            overlaps = [p for p in previous if p[0] <= y1 and y0 <= p[1]]
+            label = None
+            if len(overlaps) == 1:
+                p = overlaps[0]
+                if sum(1 for s in segments if p[0] <= s[1] and s[0] <= p[1]) == 1:
+                    label = p[2]
+            if label is None:
+                label = count
+                count += 1
+            labels[y0:y1 + 1, x] = label
+            current.append((y0, y1, label))
+        previous = current
+    return labels, count
+
+
+def _sweep_passes(region, direction):
+    """Bölgenin tarama geçişleri: sütun ya da satır boyunca bitişik bölümler"""
+    passes = []
+    if direction == "columns":
+        for x in np.flatnonzero(region.any(axis=0)).tolist():
+            for y0, y1 in _runs(region[:, x]):
+                passes.append([(y, x) for y in range(y0, y1 + 1)])
+    else:
+        for y in np.flatnonzero(region.any(axis=1)).tolist():
+            for x0, x1 in _runs(region[y]):
+                passes.append([(y, x) for x in range(x0, x1 + 1)])
+    return passes
+
+
+def _serpentine(passes, reverse_order, flip_first):
+    """Geçişleri yılan biçiminde sırala: her geçiş bir öncekinin tersi yönde"""
+    ordered = passes[::-1] if reverse_order else passes
+    return [p[::-1] if (i % 2 == 1) != flip_first else p for i, p in enumerate(ordered)]
+
+
+def _manhattan(a, b):
+    return abs(a[0] - b[0]) + abs(a[1] - b[1])
+
+
+def _ring_loop(layer, rows, cols):
+    """layer. kenar halkasının hücreleri, saat yönünde ve tekrarsız"""
+    top, left, bottom, right = layer, layer, rows - 1 - layer, cols - 1 - layer
+    if top > bottom or left > right:
+        return []
+    loop = [(top, x) for x in range(left, right + 1)]
+    loop += [(y, right) for y in range(top + 1, bottom + 1)]
+    if bottom > top:
+        loop += [(bottom, x) for x in range(right - 1, left - 1, -1)]
+    if right > left:
+        loop += [(y, left) for y in range(bottom - 1, top, -1)]
+    return loop
+
+
+class HeadlandCoveragePlanner(BasePlanner):
+    """Baş tarlalı (headland) ve dönüş sayısını azaltan kapsama planlayıcısı
+
+    Tarla kenarından headland_width genişliğindeki şerit dönüşler için
+    ayrılır ve en son çevre turlarıyla işlenir. İç alan boustrophedon ile
+    bölgelere ayrılır; her bölge için daha az geçiş (dolayısıyla daha az
+    dönüş) gerektiren tarama yönü seçilir. Bölgelerin sırası ve her bölgenin
+    giriş/çıkış köşesi, başlangıçtan hedefe küçük bir gezgin satıcı
+    problemi olarak çözülür: exact_order_limit'e kadar bölge sayısında tam
+    (dinamik programlama), daha fazlasında bölgeler tsp motoruyla gerçek
+    (BFS) mesafelere göre sıralanıp varyantlar bu sıra üzerinde seçilir.
+    """
+
+    headland_width = 1
+    exact_order_limit = 8
+    # Çok bölgeli tarlalarda sıralama aramasına ayrılan süre (saniye)
+    order_time_budget = 0.5
+
+    def __init__(self, grid_size):
+        super().__init__(grid_size)
+        # Geçişler arası bağlantı yolları için (maliyet ve komşuluk ayarları paylaşılır)
+        self._router = AStarPlanner(grid_size)
+
+    def plan_path(self, start, goal, obstacles):
+        """Kapsama yolu: iç bölgeler seçilen sırada, ardından headland, en son hedef"""
+        free = self._free_mask(obstacles)
+        reachable = geodesic_distance(free, start) >= 0 if free[start] else free
+        headland = self._headland_mask() & reachable
+        interior = reachable & ~headland
+
+        with self.stats.timer("decompose"):
+            cells = self.decompose(interior)
+        with self.stats.timer("order"):
+            plan = self._order_cells(cells, start, goal if reachable[goal] else None, reachable)
+
+        passes = [p for cell, variant in plan for p in variant]
+        with self.stats.timer("headland"):
+            end = passes[-1][-1] if passes else start
+            passes += self._headland_passes(headland, end)
+
+        self._router.set_cost_map(self.cost_map)
+        self._router.set_connectivity(self.connectivity, self.corner_cutting)
+        path = [start]
+        for sweep in passes:
+            self._travel(path, sweep[0], obstacles)
+            path.extend(sweep[1:])
+        if reachable[goal]:
+            self._travel(path, goal, obstacles)
+
+        self.stats.count("cells", len(cells))
+        self.stats.count("passes", len(passes))
+        self.stats.count("headland_cells", int(headland.sum()))
+        self.stats.count("turns", GridPath(path).turn_count())
+        return path
+
+    def decompose(self, interior):
+        """İç alanı bölgelere ayır ve her bölge için tarama yönünü seç"""
+        labels, count = boustrophedon_cells(interior)
+        cells = []
+        for index in range(count):
+            region = labels == index
+            by_columns = _sweep_passes(region, "columns")
+            by_rows = _sweep_passes(region, "rows")
+            # Geçiş sayısı eşitse mevcut sütun taramasıyla uyumlu kalınır
+            if len(by_rows) < len(by_columns):
+                cells.append(SweepCell(index, "rows", by_rows))
+            else:
+                cells.append(SweepCell(index, "columns", by_columns))
+        return cells
+
+    def _free_mask(self, obstacles):
+        free = ~occupancy_from_obstacles(self.grid_size, obstacles)
+        if self.cost_map is not None:
+            free &= ~self.cost_map.impassable_mask()
+        return free
+
+    def _headland_mask(self):
+        rows, cols = self.grid_size
+        y, x = np.indices((rows, cols))
+        layer = np.minimum(np.minimum(y, x), np.minimum(rows - 1 - y, cols - 1 - x))
+        return layer < self.headland_width
+
+    def _order_cells(self, cells, start, goal, free):
+        """Bölge sırası ve her bölgenin yılan varyantı: [(bölge, geçişler), ...]"""
+        variants = [[_serpentine(cell.passes, r, f) for r in (False, True) for f in (False, True)]
+                    for cell in cells]
+        if not cells:
+            return []
+        if len(cells) <= self.exact_order_limit:
+            order = self._exact_order(variants, start, goal)
+        else:
+            order = self._tsp_order(cells, variants, start, goal, free)
+        return [(cells[c], variants[c][v]) for c, v in order]
+
+    @staticmethod
+    def _exact_order(variants, start, goal):
+        """Alt küme dinamik programlaması (Held-Karp), giriş/çıkış varyantlarıyla"""
+        n = len(variants)
+        entry = [[v[0][0] for v in cell] for cell in variants]
+        exit_ = [[v[-1][-1] for v in cell] for cell in variants]
+        best = {}
+        for c in range(n):
+            for v in range(4):
+                best[(1 << c, c, v)] = (_manhattan(start, entry[c][v]), None)
+        for mask in range(1, 1 << n):
+            for c in range(n):
+                if not mask & (1 << c):
+                    continue
+                for v in range(4):
+                    state = best.get((mask, c, v))
+                    if state is None:
+                        continue
+                    for d in range(n):
+                        if mask & (1 << d):
+                            continue
+                        for w in range(4):
+                            key = (mask | (1 << d), d, w)
+                            cost = state[0] + _manhattan(exit_[c][v], entry[d][w])
+                            if key not in best or cost < best[key][0]:
+                                best[key] = (cost, (mask, c, v))
+        full = (1 << n) - 1
+        final = min(((best[(full, c, v)][0] + (_manhattan(exit_[c][v], goal) if goal else 0), (full, c, v))
+                     for c in range(n) for v in range(4)))[1]
+        order = []
+        while final is not None:
+            order.append(final[1:])
+            final = best[final][1]
+        return order[::-1]
+
+    def _tsp_order(self, cells, variants, start, goal, free):
+        """Bölgeleri uç hücreleri arası BFS mesafeleriyle sırala ve varyant seç
+
+        Her bölgenin giriş/çıkış noktaları ilk ve son geçişin uçlarıdır; bu
+        noktalar arası mesafeler toplu BFS ile bir kez hesaplanır. Bölgeler
+        arası mesafe, bir bölgenin çıkışlarından diğerinin girişlerine en kısa
+        mesafedir. Varyant duyarlı en yakın komşu sırası ile tsp motorunun
+        sırası karşılaştırılır; her ikisinde de varyantlar sıra sabitken
+        Viterbi ile (bölge başına 4 durum) seçilir ve ucuz olan kullanılır.
+        """
+        points = [start] + ([goal] if goal else [])
+        index = {point: i for i, point in enumerate(points)}
+        for cell in variants:
+            for variant in cell:
+                for point in (variant[0][0], variant[-1][-1]):
+                    if point not in index:
+                        index[point] = len(points)
+                        points.append(point)
+        dist = distance_matrix(free, points, self.connectivity)
+        entry = np.array([[index[v[0][0]] for v in cell] for cell in variants])
+        exit_ = np.array([[index[v[-1][-1]] for v in cell] for cell in variants])
+        goal_index = 1 if goal else None
+
+        # Düğümler: 0 başlangıç, 1..n bölgeler, (varsa) n+1 hedef
+        n = len(cells)
+        outs = [np.array([0])] + list(exit_) + ([np.array([1])] if goal else [])
+        ins = [np.array([0])] + list(entry) + ([np.array([1])] if goal else [])
+        matrix = np.array([[dist[np.ix_(a, b)].min() for b in ins] for a in outs])
+        np.fill_diagonal(matrix, 0)
+        result = solve_tsp(matrix, start=0, end=len(outs) - 1 if goal else None,
+                           time_budget=self.order_time_budget)
+        self.stats.count("order_iterations", result.stats["iterations"])
+        candidates = [[i - 1 for i in result.order if 1 <= i <= n],
+                      self._greedy_sequence(entry, exit_, dist)]
+        plans = [self._choose_variants(seq, entry, exit_, dist, goal_index) for seq in candidates]
+        return min(plans, key=lambda plan: plan[0])[1]
+
+    @staticmethod
+    def _greedy_sequence(entry, exit_, dist):
+        """En yakın komşu: her adımda girişi en yakın bölge (çıkış varyantıyla ilerler)"""
+        remaining = np.ones(len(entry), dtype=bool)
+        position = 0
+        sequence = []
+        while remaining.any():
+            costs = np.where(remaining[:, None], dist[position][entry], np.inf)
+            c, v = np.unravel_index(int(np.argmin(costs)), costs.shape)
+            sequence.append(int(c))
+            remaining[c] = False
+            position = exit_[c, v]
+        return sequence
+
+    @staticmethod
+    def _choose_variants(sequence, entry, exit_, dist, goal_index):
+        """Sabit sıra için en ucuz varyant dizisi (Viterbi): (maliyet, [(bölge, varyant)])"""
+        costs = dist[0, entry[sequence[0]]]
+        back = []
+        for prev, cur in zip(sequence, sequence[1:]):
+            options = costs[:, None] + dist[np.ix_(exit_[prev], entry[cur])]
+            choice = np.argmin(options, axis=0)
+            costs = options[choice, np.arange(4)]
+            back.append(choice)
+        if goal_index is not None:
+            costs = costs + dist[exit_[sequence[-1]], goal_index]
+        v = int(np.argmin(costs))
+        total = float(costs[v])
+        chosen = [v]
+        for choice in reversed(back):
+            v = int(choice[v])
+            chosen.append(v)
+        return total, list(zip(sequence, reversed(chosen)))
+
+    def _headland_passes(self, headland, position):
+        """Headland halkalarını çevre turlarıyla işle (içten dışa, en yakından başlayarak)"""
+        rows, cols = self.grid_size
+        passes = []
+        for layer in range(self.headland_width - 1, -1, -1):
+            loop = _ring_loop(layer, rows, cols)
+            if not loop:
+                continue
+            inside = np.array([headland[c] for c in loop])
+            if not inside.any():
+                continue
+            if inside.all():
+                # Kesintisiz halka: en yakın hücreden başlayıp tam tur
+                first = min(range(len(loop)), key=lambda i: _manhattan(position, loop[i]))
+                runs = [loop[first:] + loop[:first]]
+            else:
+                # Engellerle bölünmüş halka: kesintiden başlatıp parçalara ayır
+                shift = int(np.flatnonzero(~inside)[0])
+                loop, inside = loop[shift:] + loop[:shift], np.roll(inside, -shift)
+                runs = [loop[a:b + 1] for a, b in _runs(inside)]
+            while runs:
+                i, flip = min(((i, f) for i in range(len(runs)) for f in (False, True)),
+                              key=lambda rf: _manhattan(position, runs[rf[0]][-1 if rf[1] else 0]))
+                run = runs.pop(i)
+                run = run[::-1] if flip else run
+                passes.append(run)
+                position = run[-1]
+        return passes
+
+    def _travel(self, path, target, obstacles):
+        """Yolun sonundan target'a bağlantı yolunu ekle"""
+        if path[-1] == target:
+            return
+        connector = self._router.plan_path(path[-1], target, obstacles)
+        path.extend(connector[1:])
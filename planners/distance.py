@@ -0,0 +1,87 @@
+import numpy as np
+
+# Ulaşılamayan hücrelerin mesafe değeri
+UNREACHABLE = -1
+
+
+def _neighbors(frontier, shape, connectivity=4):
+    """Düz (flat) indeksli hücrelerin 4- (ya da 8-) komşuları"""
+    rows, cols = shape
+    r, c = np.divmod(frontier, cols)
+    up, down, left, right = r > 0, r < rows - 1, c > 0, c < cols - 1
+    parts = [
+        frontier[up] - cols,
+        frontier[down] + cols,
+        frontier[left] - 1,
+        frontier[right] + 1,
+    ]
+    if connectivity == 8:
+        parts += [
+            frontier[up & left] - cols - 1,
+            frontier[up & right] - cols + 1,
+            frontier[down & left] + cols - 1,
+            frontier[down & right] + cols + 1,
+        ]
+    return np.concatenate(parts)
+
+
+def geodesic_distance(free, start, connectivity=4):
+    """start'tan her boş hücreye en kısa adım sayısı (BFS dalga cephesi)
+
+    Her dalga cephesi numpy ile tek seferde genişletilir; ulaşılamayan ve
+    engel hücreler UNREACHABLE (-1) olur. connectivity=8 ile çapraz adımlar da
+    1 sayılır (Chebyshev); sonuç Öklid yol uzunluğunun alt sınırıdır.
+    """
+    free = np.asarray(free, dtype=bool)
+    dist = np.full(free.size, UNREACHABLE, dtype=np.int32)
+    flat_free = free.ravel()
+
+    start = np.ravel_multi_index(tuple(start), free.shape)
+    if not flat_free[start]:
+        return dist.reshape(free.shape)
+
+    dist[start] = 0
+    frontier = np.array([start], dtype=np.intp)
+    # Tekrar eden hücreleri sıralamadan elemek için karalama dizisi
+    slot = np.empty(free.size, dtype=np.intp)
+    depth = 0
+    while frontier.size:
+        depth += 1
+        candidates = _neighbors(frontier, free.shape, connectivity)
+        candidates = candidates[flat_free[candidates] & (dist[candidates] == UNREACHABLE)]
+        # Aynı hücre birden fazla komşudan gelebilir: her hücrenin yalnızca
+        # son yazılan kopyası tutulur (np.unique'ten ucuz, O(n))
+        positions = np.arange(candidates.size)
+        slot[candidates] = positions
+        frontier = candidates[slot[candidates] == positions]
+        dist[frontier] = depth
+    return dist.reshape(free.shape)
+
+
+def distance_field(occupancy, max_distance=None):
+    """Her hücre merkezinin en yakın dolu hücre merkezine Öklid uzaklığı
+
+    Önce her sütunda en yakın dolu hücreye dikey uzaklık kümülatif max/min
+    ile bulunur, sonra yatay kaydırmalarla d² = min(kayma² + dikey²) alınır.
+    max_distance verilirse sonuç bu değerde kırpılır ve yalnızca o kadar
+    kayma denenir (çarpışma kontrolü için yeterli, maliyeti O(n * max_distance)).
+    Dolu hücre yoksa tüm hücreler max_distance (ya da grid köşegeni) olur.
+    """
+    occupancy = np.asarray(occupancy, dtype=bool)
+    rows, cols = occupancy.shape
+    limit = float(np.hypot(rows, cols) if max_distance is None else max_distance)
+    reach = min(int(np.ceil(limit)), max(rows, cols))
+
+    index = np.arange(rows)[:, None]
+    far = rows + reach + 1
+    above = np.maximum.accumulate(np.where(occupancy, index, -far), axis=0)
+    below = np.minimum.accumulate(np.where(occupancy, index, 2 * far)[::-1], axis=0)[::-1]
+    vertical = np.minimum(np.minimum(index - above, below - index), reach + 1)
+    squared = (vertical.astype(np.float64)) ** 2
+
+    best = squared.copy()
+    for offset in range(1, min(reach, cols - 1) + 1):
+        shift = offset * offset
+        np.minimum(best[:, offset:], squared[:, :-offset] + shift, out=best[:, offset:])
+        np.minimum(best[:, :-offset], squared[:, offset:] + shift, out=best[:, :-offset])
+    return np.minimum(np.sqrt(best), limit).astype(np.float32)
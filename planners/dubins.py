@@ -0,0 +1,128 @@
+"""Dubins eğrileri: en küçük dönüş yarıçaplı, yalnızca ileri giden araç için
+en kısa yollar (LSL, RSR, LSR, RSL, RLR, LRL)
+
+Pozlar (x, y, yön) biçimindedir; x sütun, y satır yönündedir ve yön x
+ekseninden radyan cinsinden ölçülür. Kelime uzunlukları numpy dizileri
+üzerinde hesaplanır; böylece aynı kod hem tek bir analitik genişletmede hem
+de sezgisel tablosunun tamamında kullanılır.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+WORDS = ("LSL", "RSR", "LSR", "RSL", "RLR", "LRL")
+
+# Dubins yolu: kelime, her bölümün normalize uzunluğu (açı ya da düz/yarıçap)
+# ve gerçek toplam uzunluk
+DubinsPath = namedtuple('DubinsPath', ['word', 'segments', 'length'])
+
+
+def _mod2pi(angle):
+    return np.mod(angle, 2 * np.pi)
+
+
+def word_lengths(alpha, beta, d):
+    """Normalize koordinatlarda altı kelimenin (t, p, q) bölüm uzunlukları
+
+    alpha, beta: başlangıç/bitiş yönlerinin bağlantı doğrusuna göre açısı,
+    d: yarıçapa bölünmüş mesafe. Sonuç (6, 3, ...) boyutludur; uygulanamayan
+    kelimeler NaN olur.
+    """
+    alpha, beta, d = np.broadcast_arrays(*(np.asarray(v, dtype=np.float64) for v in (alpha, beta, d)))
+    sa, sb, ca, cb = np.sin(alpha), np.sin(beta), np.cos(alpha), np.cos(beta)
+    cab = np.cos(alpha - beta)
+    out = np.full((6, 3) + alpha.shape, np.nan)
+
+    with np.errstate(invalid="ignore"):
+        # LSL
+        p2 = 2 + d * d - 2 * cab + 2 * d * (sa - sb)
+        tmp = np.arctan2(cb - ca, d + sa - sb)
+        ok = p2 >= 0
+        out[0] = np.where(ok, [_mod2pi(-alpha + tmp), np.sqrt(p2), _mod2pi(beta - tmp)], np.nan)
+
+        # RSR
+        p2 = 2 + d * d - 2 * cab + 2 * d * (sb - sa)
+        tmp = np.arctan2(ca - cb, d - sa + sb)
+        ok = p2 >= 0
+        out[1] = np.where(ok, [_mod2pi(alpha - tmp), np.sqrt(p2), _mod2pi(-beta + tmp)], np.nan)
+
+        # LSR
+        p2 = -2 + d * d + 2 * cab + 2 * d * (sa + sb)
+        p = np.sqrt(p2)
+        tmp = np.arctan2(-ca - cb, d + sa + sb) - np.arctan2(-2.0, p)
+        ok = p2 >= 0
+        out[2] = np.where(ok, [_mod2pi(-alpha + tmp), p, _mod2pi(-beta + tmp)], np.nan)
+
+        # RSL
+        p2 = d * d - 2 + 2 * cab - 2 * d * (sa + sb)
+        p = np.sqrt(p2)
+        tmp = np.arctan2(ca + cb, d - sa - sb) - np.arctan2(2.0, p)
+        ok = p2 >= 0
+        out[3] = np.where(ok, [_mod2pi(alpha - tmp), p, _mod2pi(beta - tmp)], np.nan)
+
+        # RLR
+        c = (6 - d * d + 2 * cab + 2 * d * (sa - sb)) / 8
+        p = _mod2pi(2 * np.pi - np.arccos(c))
+        t = _mod2pi(alpha - np.arctan2(ca - cb, d - sa + sb) + p / 2)
+        ok = np.abs(c) <= 1
+        out[4] = np.where(ok, [t, p, _mod2pi(alpha - beta - t + p)], np.nan)
+
+        # LRL
+        c = (6 - d * d + 2 * cab + 2 * d * (sb - sa)) / 8
+        p = _mod2pi(2 * np.pi - np.arccos(c))
+        t = _mod2pi(-alpha - np.arctan2(ca - cb, d + sa - sb) + p / 2)
+        ok = np.abs(c) <= 1
+        out[5] = np.where(ok, [t, p, _mod2pi(-alpha + beta - t + p)], np.nan)
+    return out
+
+
+def _normalize(dx, dy, start_heading, goal_heading, radius):
+    theta = np.arctan2(dy, dx)
+    d = np.hypot(dx, dy) / radius
+    return _mod2pi(start_heading - theta), _mod2pi(goal_heading - theta), d
+
+
+def dubins_lengths(dx, dy, start_heading, goal_heading, radius):
+    """Göreli hedefler için en kısa Dubins yolu uzunlukları (vektörel)"""
+    alpha, beta, d = _normalize(dx, dy, start_heading, goal_heading, radius)
+    totals = word_lengths(alpha, beta, d).sum(axis=1)
+    return np.nanmin(totals, axis=0) * radius
+
+
+def dubins_path(start, goal, radius):
+    """start'tan goal'e en kısa Dubins yolu; start/goal (x, y, yön)"""
+    dx, dy = goal[0] - start[0], goal[1] - start[1]
+    alpha, beta, d = _normalize(dx, dy, start[2], goal[2], radius)
+    lengths = word_lengths(alpha, beta, d)
+    totals = lengths.sum(axis=1)
+    best = int(np.nanargmin(totals))
+    return DubinsPath(WORDS[best], tuple(float(v) for v in lengths[best]),
+                      float(totals[best]) * radius)
+
+
+def sample_dubins(start, path, radius, spacing=0.5):
+    """Dubins yolunu yaklaşık spacing aralıklarla (x, y, yön) pozlarına örnekle
+
+    Başlangıç pozu dahil değildir, bitiş pozu dahildir; sonuç (N, 3) dizisidir.
+    """
+    x, y, heading = start
+    poses = []
+    for kind, segment in zip(path.word, path.segments):
+        arc = segment * radius
+        count = max(1, int(np.ceil(arc / spacing)))
+        s = np.arange(1, count + 1) / count * segment
+        if kind == "S":
+            xs = x + radius * s * np.cos(heading)
+            ys = y + radius * s * np.sin(heading)
+            hs = np.full(count, heading)
+        elif kind == "L":
+            xs = x + radius * (np.sin(heading + s) - np.sin(heading))
+            ys = y - radius * (np.cos(heading + s) - np.cos(heading))
+            hs = heading + s
+        else:
+            xs = x - radius * (np.sin(heading - s) - np.sin(heading))
+            ys = y + radius * (np.cos(heading - s) - np.cos(heading))
+            hs = heading - s
+        poses.append(np.stack((xs, ys, hs), axis=1))
+        x, y, heading = xs[-1], ys[-1], hs[-1]
+    return np.concatenate(poses)
@@ -0,0 +1,182 @@
+import struct
+from collections import namedtuple
+
+import numpy as np
+
+# Run-length sıkıştırılmış yol: başlangıç noktası, ardışık aynı adımların
+# (dy, dx) farkı ve her farkın kaç kez tekrarlandığı
+PathRuns = namedtuple('PathRuns', ['start', 'deltas', 'counts'])
+
+# İkili format başlığı: sihirli sayı, delta tipi (1: int8, 2: int16),
+# nokta sayısı, koşu sayısı, başlangıç (y, x)
+_MAGIC = b'AGP1'
+_HEADER = struct.Struct('<4sBQQii')
+_DELTA_DTYPES = {1: np.int8, 2: np.int16}
+
+
+def _coord_dtype(array):
+    """Koordinatların sığdığı en küçük tamsayı tipi"""
+    if not array.size:
+        return np.int16
+    info = np.iinfo(np.int16)
+    if array.min() >= info.min and array.max() <= info.max:
+        return np.int16
+    return np.int32
+
+
+class GridPath:
+    """(N, 2) int16/int32 dizisi üzerine kurulu kompakt ızgara yolu
+
+    Tuple listesi gibi davranır (len, indeksleme, iterasyon, == liste) ama
+    hücre başına 4-8 bayt tutar; dilimleme kopyalamadan görünüm döndürür.
+    Pickle edilirken run-length biçimine sıkıştırılır.
+    """
+
+    __slots__ = ('array',)
+
+    def __init__(self, points=(), dtype=None):
+        if isinstance(points, GridPath):
+            array = points.array
+        else:
+            array = np.asarray(points)
+        array = array.reshape(-1, 2)
+        if dtype is None:
+            dtype = _coord_dtype(array)
+        self.array = array.astype(dtype, copy=False)
+
+    @classmethod
+    def from_array(cls, array):
+        """Mevcut (N, 2) diziyi kopyalamadan sar"""
+        path = cls.__new__(cls)
+        path.array = array
+        return path
+
+    @classmethod
+    def concat(cls, paths):
+        """Birden fazla yolu art arda ekle"""
+        arrays = [GridPath(p).array for p in paths]
+        if not arrays:
+            return cls()
+        return cls(np.concatenate(arrays))
+
+    def __len__(self):
+        return len(self.array)
+
+    def __iter__(self):
+        return iter(self.tolist())
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return GridPath.from_array(self.array[index])
+        y, x = self.array[index]
+        return int(y), int(x)
+
+    def __eq__(self, other):
+        if isinstance(other, GridPath):
+            other = other.array
+        try:
+            other = np.asarray(other).reshape(-1, 2)
+        except ValueError:
+            return NotImplemented
+        return self.array.shape == other.shape and bool(np.array_equal(self.array, other))
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"GridPath({len(self)} nokta, {self.array.dtype})"
+
+    def __array__(self, dtype=None, copy=None):
+        if dtype is None:
+            return self.array
+        return self.array.astype(dtype)
+
+    def __reduce__(self):
+        return (GridPath.from_bytes, (self.to_bytes(),))
+
+    @property
+    def ys(self):
+        """Satır koordinatları (görünüm)"""
+        return self.array[:, 0]
+
+    @property
+    def xs(self):
+        """Sütun koordinatları (görünüm)"""
+        return self.array[:, 1]
+
+    @property
+    def nbytes(self):
+        return self.array.nbytes
+
+    def tolist(self):
+        """Tuple listesine çevir (eski API'ler için)"""
+        return [tuple(pos) for pos in self.array.tolist()]
+
+    def steps(self):
+        """Ardışık noktalar arasındaki (dy, dx) farkları"""
+        return np.diff(self.array.astype(np.int32), axis=0)
+
+    def turn_count(self):
+        """Yön değişikliği sayısı"""
+        steps = self.steps()
+        if len(steps) < 2:
+            return 0
+        return int(np.count_nonzero(np.any(steps[1:] != steps[:-1], axis=1)))
+
+    def to_runs(self):
+        """Yolu (başlangıç, delta, tekrar) koşularına sıkıştır"""
+        if not len(self.array):
+            return PathRuns(None, np.empty((0, 2), np.int16), np.empty(0, np.uint32))
+
+        steps = self.steps()
+        start = tuple(int(v) for v in self.array[0])
+        if not len(steps):
+            return PathRuns(start, np.empty((0, 2), np.int16), np.empty(0, np.uint32))
+
+        # Adımın değiştiği yerler yeni bir koşu başlatır
+        change = np.flatnonzero(np.any(steps[1:] != steps[:-1], axis=1)) + 1
+        run_starts = np.concatenate(([0], change))
+        counts = np.diff(np.append(run_starts, len(steps))).astype(np.uint32)
+        deltas = steps[run_starts]
+        delta_dtype = np.int8 if np.abs(deltas).max() <= 127 else np.int16
+        return PathRuns(start, deltas.astype(delta_dtype), counts)
+
+    @classmethod
+    def from_runs(cls, runs, dtype=None):
+        """to_runs çıktısından yolu geri oluştur"""
+        if runs.start is None:
+            return cls()
+        steps = np.repeat(np.asarray(runs.deltas, dtype=np.int64).reshape(-1, 2),
+                          runs.counts, axis=0)
+        array = np.empty((len(steps) + 1, 2), dtype=np.int64)
+        array[0] = runs.start
+        np.cumsum(steps, axis=0, out=array[1:])
+        array[1:] += array[0]
+        return cls(array, dtype=dtype)
+
+    def to_bytes(self):
+        """Run-length sıkıştırılmış ikili gösterim (saklama/aktarım için)"""
+        runs = self.to_runs()
+        start = runs.start if runs.start is not None else (0, 0)
+        code = 1 if runs.deltas.dtype == np.int8 else 2
+        header = _HEADER.pack(_MAGIC, code, len(self), len(runs.counts), *start)
+        return (header + runs.deltas.astype('<' + runs.deltas.dtype.str[1:]).tobytes()
+                + runs.counts.astype('<u4').tobytes())
+
+    @classmethod
+    def from_bytes(cls, data):
+        """to_bytes çıktısını çöz"""
+        magic, code, length, n_runs, y, x = _HEADER.unpack_from(data)
+        if magic != _MAGIC or code not in _DELTA_DTYPES:
+            raise ValueError("Geçersiz yol verisi")
+        if not length:
+            return cls()
+
+        offset = _HEADER.size
+        delta_dtype = np.dtype(_DELTA_DTYPES[code]).newbyteorder('<')
+        deltas = np.frombuffer(data, dtype=delta_dtype, count=n_runs * 2, offset=offset)
+        offset += deltas.nbytes
+        counts = np.frombuffer(data, dtype='<u4', count=n_runs, offset=offset)
+        path = cls.from_runs(PathRuns((y, x), deltas.reshape(-1, 2), counts))
+        if len(path) != length:
+            raise ValueError("Yol verisi bozuk: nokta sayısı uyuşmuyor")
+        return path
@@ -0,0 +1,336 @@
+import heapq
+import math
+
+import numpy as np
+
+from .base_planner import BasePlanner
+from .distance import UNREACHABLE, distance_field, geodesic_distance
+from .dubins import dubins_lengths, dubins_path, sample_dubins
+from .postprocess import obstacle_snapshot, occupancy_from_obstacles
+
+# (yarıçap, yön sayısı, geri vites, pencere) -> engelsiz Dubins sezgisel tablosu
+_HEURISTIC_TABLES = {}
+
+
+def _angle_diff(a, b):
+    return (a - b + math.pi) % (2 * math.pi) - math.pi
+
+
+def heuristic_table(radius, heading_bins, reverse, window):
+    """Engelsiz ortamda (0, 0, 0) pozundan göreli hedeflere Dubins mesafeleri
+
+    Tablo (2W+1, 2W+1, yön) boyutludur: [dy + W, dx + W, yön farkı kutusu].
+    Geri vites açıksa ileri ve geri giden Dubins yollarının kısası alınır.
+    Parametre başına bir kez hesaplanıp süreç içinde paylaşılır.
+    """
+    key = (float(radius), int(heading_bins), bool(reverse), int(window))
+    if key not in _HEURISTIC_TABLES:
+        offsets = np.arange(-window, window + 1, dtype=np.float64)
+        dy, dx, bins = np.meshgrid(offsets, offsets, np.arange(heading_bins), indexing="ij")
+        goal_heading = bins * (2 * np.pi / heading_bins)
+        table = dubins_lengths(dx, dy, 0.0, goal_heading, radius)
+        if reverse:
+            table = np.minimum(table, dubins_lengths(dx, dy, np.pi, goal_heading + np.pi, radius))
+        _HEURISTIC_TABLES[key] = table.astype(np.float32)
+    return _HEURISTIC_TABLES[key]
+
+
+class HybridAStarPlanner(BasePlanner):
+    """Dönüş yarıçapını dikkate alan Hybrid A*
+
+    Durumlar sürekli (x, y, yön) pozlarıdır; aynı hücre ve yön kutusuna düşen
+    durumlar birleştirilir. Her genişletmede en büyük eğriliğin katlarıyla
+    (steering) step_size uzunluğunda yaylar üretilir ve yay üzerindeki
+    örnekler engel uzaklık alanına bakılarak tek numpy işlemiyle kontrol
+    edilir. Hedefe yaklaştıkça Dubins eğrisiyle analitik bağlantı denenir.
+
+    Sezgisel, önbellekli engelsiz Dubins tablosu ile engelleri dikkate alan
+    8-komşulu dalga cephesi mesafesinin büyüğüdür. Koordinatlarda x sütun, y
+    satırdır; yön sütun ekseninden satır eksenine doğru radyan cinsindendir.
+    """
+
+    # Araç ve arama parametreleri (hücre birimiyle)
+    turning_radius = 3.0
+    heading_bins = 72
+    step_size = 1.5
+    steering = (-1.0, -0.5, 0.0, 0.5, 1.0)
+    allow_reverse = False
+    reverse_penalty = 2.0
+    switch_penalty = 4.0
+    steer_penalty = 0.1
+    steer_change_penalty = 0.2
+    # Yol üzerindeki her örneğin en yakın engele olan en küçük uzaklığı
+    clearance = 1.0
+    sample_spacing = 0.5
+    # Hedefe bu mesafeden yakın düğümlerde her genişletmede, diğerlerinde
+    # analytic_interval genişletmede bir Dubins bağlantısı denenir
+    analytic_range = 15.0
+    analytic_interval = 8
+    heuristic_window = 16
+    max_expansions = 100000
+
+    # Sürekli yolun geçtiği hücreler 8-komşuludur; açıklık clearance ile sağlanır
+    path_connectivity = 8
+    path_corner_cutting = "always"
+
+    def __init__(self, grid_size):
+        super().__init__(grid_size)
+        self._field = None
+        self._field_source = None
+        self._goal_distances = {}
+        self._primitive_cache = None
+
+    def plan_path(self, start, goal, obstacles, start_heading=0.0, goal_heading=None):
+        """Hybrid A* ile yol planla; sürekli yolun geçtiği hücreleri döndür"""
+        poses = self.plan_poses(start, goal, obstacles, start_heading, goal_heading)
+        if not poses:
+            return []
+        cells = np.rint(np.asarray(poses)[:, :2]).astype(np.int64)
+        keep = np.concatenate(([True], np.any(cells[1:] != cells[:-1], axis=1)))
+        return [tuple(p) for p in cells[keep].tolist()]
+
+    def plan_poses(self, start, goal, obstacles, start_heading=0.0, goal_heading=None):
+        """Sürekli yol: (satır, sütun, yön) pozları listesi (bulunamazsa boş)
+
+        goal_heading None ise hedef hücreye herhangi bir yönle varmak yeterlidir.
+        """
+        field = self._distance_field(obstacles)
+        if field[start] < self.clearance or field[goal] < self.clearance:
+            return []
+        goal_distance = self._goal_distance(goal, obstacles)
+        if goal_distance[start] == UNREACHABLE:
+            return []
+
+        costs = None if self.cost_map is None else self.cost_map.costs
+        scale = 1 if costs is None else self.cost_map.min_cost
+        local_x, local_y, turn, base_cost, directions, steers = self._primitives()
+        rows, cols = self.grid_size
+        bin_width = 2 * math.pi / self.heading_bins
+
+        def key_of(x, y, heading):
+            return (int(round(y)), int(round(x)), int(round(heading / bin_width)) % self.heading_bins)
+
+        def heuristic(x, y, heading):
+            cell = goal_distance[int(round(y)), int(round(x))]
+            if cell == UNREACHABLE:
+                return math.inf
+            return scale * max(float(cell), self._dubins_estimate(x, y, heading, goal, goal_heading))
+
+        # Düğüm: (x, y, yön, g, ebeveyn anahtarı, hareket indeksi)
+        start_pose = (float(start[1]), float(start[0]), float(start_heading))
+        start_key = key_of(*start_pose)
+        nodes = {start_key: start_pose + (0.0, None, None)}
+        frontier = [(heuristic(*start_pose), 0, start_key)]
+        closed = set()
+        counter = 1
+        expanded = 0
+        checks = 0
+        attempts = 0
+        hits = 0
+        result = None
+
+        while frontier and expanded < self.max_expansions:
+            current = heapq.heappop(frontier)[2]
+            if current in closed:
+                continue
+            closed.add(current)
+            expanded += 1
+            if expanded % 1024 == 0:
+                self._report_progress(expanded_nodes=expanded)
+
+            x, y, heading, g, _, move = nodes[current]
+            if current[:2] == tuple(goal) and (
+                    goal_heading is None or abs(_angle_diff(heading, goal_heading)) <= bin_width):
+                result = (current, None)
+                break
+
+            # Analitik genişletme: Dubins eğrisiyle doğrudan hedefe bağlanmayı dene
+            if (math.hypot(goal[1] - x, goal[0] - y) <= self.analytic_range or
+                    expanded % self.analytic_interval == 0):
+                attempts += 1
+                shot = self._analytic_shot((x, y, heading), goal, goal_heading, field)
+                if shot is not None:
+                    hits += 1
+                    result = (current, shot)
+                    break
+
+            # Tüm hareket ilkelleri tek seferde dünyaya taşınıp kontrol edilir
+            c, s = math.cos(heading), math.sin(heading)
+            world_x = x + c * local_x - s * local_y
+            world_y = y + s * local_x + c * local_y
+            col = np.rint(world_x).astype(np.intp)
+            row = np.rint(world_y).astype(np.intp)
+            inside = ((row >= 0) & (row < rows) & (col >= 0) & (col < cols)).all(axis=1)
+            clear = field[np.clip(row, 0, rows - 1), np.clip(col, 0, cols - 1)] >= self.clearance
+            valid = np.flatnonzero(inside & clear.all(axis=1))
+            checks += row.size
+
+            prev_direction = None if move is None else directions[move]
+            prev_steer = None if move is None else steers[move]
+            for index in valid.tolist():
+                nx, ny = float(world_x[index, -1]), float(world_y[index, -1])
+                nh = heading + turn[index]
+                key = key_of(nx, ny, nh)
+                if key in closed or key == current:
+                    continue
+                step = base_cost[index]
+                if costs is not None:
+                    step *= costs.item((int(row[index, -1]), int(col[index, -1])))
+                if prev_direction is not None:
+                    if directions[index] != prev_direction:
+                        step += self.switch_penalty
+                    step += self.steer_change_penalty * abs(steers[index] - prev_steer)
+                new_g = g + step
+                known = nodes.get(key)
+                if known is not None and known[3] <= new_g:
+                    continue
+                h = heuristic(nx, ny, nh)
+                if h == math.inf:
+                    continue
+                nodes[key] = (nx, ny, nh, new_g, current, index)
+                heapq.heappush(frontier, (new_g + h, counter, key))
+                counter += 1
+
+        self.stats.count("expanded_nodes", expanded)
+        self.stats.count("heap_pushes", counter)
+        self.stats.count("collision_checks", checks)
+        self.stats.count("analytic_attempts", attempts)
+        self.stats.count("analytic_hits", hits)
+
+        if result is None:
+            return []
+        return self._reconstruct(nodes, *result)
+
+    # Hareket ilkelleri ve yol oluşturma
+
+    def _primitives(self):
+        """Yerel çerçevede (P, K) yay örnekleri, yön değişimi ve temel maliyetler"""
+        params = (self.turning_radius, self.step_size, tuple(self.steering),
+                  self.allow_reverse, self.sample_spacing, self.reverse_penalty, self.steer_penalty)
+        if self._primitive_cache is not None and self._primitive_cache[0] == params:
+            return self._primitive_cache[1]
+
+        count = max(1, math.ceil(self.step_size / self.sample_spacing))
+        gears = (1, -1) if self.allow_reverse else (1,)
+        local_x, local_y, turn, base_cost, directions, steers = [], [], [], [], [], []
+        for gear in gears:
+            for steer in self.steering:
+                s = gear * self.step_size * np.arange(1, count + 1) / count
+                curvature = steer / self.turning_radius
+                if curvature == 0:
+                    xs, ys = s, np.zeros_like(s)
+                else:
+                    xs = np.sin(curvature * s) / curvature
+                    ys = (1 - np.cos(curvature * s)) / curvature
+                local_x.append(xs)
+                local_y.append(ys)
+                turn.append(curvature * s[-1])
+                penalty = self.reverse_penalty if gear < 0 else 1.0
+                base_cost.append(self.step_size * penalty * (1 + self.steer_penalty * abs(steer)))
+                directions.append(gear)
+                steers.append(steer)
+        primitives = (np.array(local_x), np.array(local_y), turn, base_cost, directions, steers)
+        self._primitive_cache = (params, primitives)
+        return primitives
+
+    def _analytic_shot(self, pose, goal, goal_heading, field):
+        """Pozdan hedefe engelsiz Dubins bağlantısı: ((N, 3) pozlar, vites) ya da None"""
+        gx, gy = float(goal[1]), float(goal[0])
+        x, y, heading = pose
+        if goal_heading is None:
+            if math.hypot(gx - x, gy - y) < 1e-9:
+                return None
+            goal_heading = math.atan2(gy - y, gx - x)
+
+        candidates = [(1, pose, (gx, gy, goal_heading))]
+        if self.allow_reverse:
+            # Geri vites: araç tersine döndürülmüş gibi ileri Dubins yolu
+            candidates.append((-1, (x, y, heading + math.pi), (gx, gy, goal_heading + math.pi)))
+
+        best = None
+        for gear, begin, end in candidates:
+            path = dubins_path(begin, end, self.turning_radius)
+            length = path.length * (self.reverse_penalty if gear < 0 else 1.0)
+            if best is not None and length >= best[0]:
+                continue
+            poses = sample_dubins(begin, path, self.turning_radius, self.sample_spacing)
+            col = np.rint(poses[:, 0]).astype(np.intp)
+            row = np.rint(poses[:, 1]).astype(np.intp)
+            rows, cols = self.grid_size
+            if ((row < 0) | (row >= rows) | (col < 0) | (col >= cols)).any():
+                continue
+            if (field[row, col] < self.clearance).any():
+                continue
+            if gear < 0:
+                poses[:, 2] -= math.pi
+            best = (length, poses)
+        return None if best is None else best[1]
+
+    def _reconstruct(self, nodes, key, shot):
+        """Düğüm zincirini hareket ilkelleriyle yeniden örnekleyerek pozlara çevir"""
+        local_x, local_y, turn, _, _, _ = self._primitives()
+        chain = []
+        while key is not None:
+            chain.append(nodes[key])
+            key = nodes[key][4]
+        chain.reverse()
+
+        x, y, heading = chain[0][:3]
+        poses = [(y, x, heading)]
+        for node in chain[1:]:
+            move = node[5]
+            c, s = math.cos(heading), math.sin(heading)
+            xs = x + c * local_x[move] - s * local_y[move]
+            ys = y + s * local_x[move] + c * local_y[move]
+            steps = len(xs)
+            for i in range(steps):
+                poses.append((float(ys[i]), float(xs[i]), heading + turn[move] * (i + 1) / steps))
+            x, y, heading = node[:3]
+        if shot is not None:
+            poses.extend((float(py), float(px), float(ph)) for px, py, ph in shot)
+        return poses
+
+    # Önbellekli alanlar ve sezgisel
+
+    def _distance_field(self, obstacles):
+        """Engel (ve geçilemeyen maliyet) hücrelerine uzaklık alanı
+
+        Önbellek engel kümesinin içeriğine göre yenilenir (kimliğine göre değil).
+        """
+        cost_map = self.cost_map
+        version = None if cost_map is None else cost_map.version
+        snapshot = obstacle_snapshot(obstacles)
+        cached = self._field_source
+        if (cached is None or cached[0] != snapshot or cached[1] is not cost_map or
+                cached[2] != version or cached[3] != self.clearance):
+            blocked = occupancy_from_obstacles(self.grid_size, obstacles)
+            if cost_map is not None:
+                blocked |= cost_map.impassable_mask()
+            self._field = distance_field(blocked, max_distance=self.clearance + 1)
+            self._field_source = (snapshot, cost_map, version, self.clearance)
+            self._goal_distances.clear()
+        return self._field
+
+    def _goal_distance(self, goal, obstacles):
+        """Hedefe engelleri dikkate alan 8-komşulu adım sayısı (hedef başına önbellekli)"""
+        field = self._distance_field(obstacles)
+        goal = tuple(goal)
+        if goal not in self._goal_distances:
+            self._goal_distances[goal] = geodesic_distance(field >= self.clearance, goal, connectivity=8)
+        return self._goal_distances[goal]
+
+    def _dubins_estimate(self, x, y, heading, goal, goal_heading):
+        """Engelsiz Dubins mesafesi (tablodan); pencere dışında Öklid mesafesi"""
+        dx, dy = goal[1] - x, goal[0] - y
+        window = self.heuristic_window
+        c, s = math.cos(heading), math.sin(heading)
+        local_x = int(round(c * dx + s * dy))
+        local_y = int(round(-s * dx + c * dy))
+        if abs(local_x) > window or abs(local_y) > window:
+            return math.hypot(dx, dy)
+        table = heuristic_table(self.turning_radius, self.heading_bins, self.allow_reverse, window)
+        cell = table[local_y + window, local_x + window]
+        if goal_heading is None:
+            return float(cell.min())
+        bin_width = 2 * math.pi / self.heading_bins
+        return float(cell[int(round(_angle_diff(goal_heading, heading) / bin_width)) % self.heading_bins])
@@ -0,0 +1,118 @@
+import time
+from collections import defaultdict
+from contextlib import contextmanager, nullcontext
+
+
+class PlannerStats:
+    """Planlayıcı ölçümleri: sayaçlar, faz süreleri ve çağrı kayıtları"""
+
+    enabled = True
+
+    def __init__(self, max_traces=1000):
+        self.counters = defaultdict(int)
+        self.timers = defaultdict(float)
+        self.traces = []
+        self.max_traces = max_traces
+
+    def count(self, name, n=1):
+        """Sayacı artır"""
+        self.counters[name] += n
+
+    def add_time(self, name, seconds):
+        """Dışarıda ölçülmüş bir süreyi ekle"""
+        self.timers[name] += seconds
+
+    @contextmanager
+    def timer(self, name):
+        """Bir fazın süresini ölç: with stats.timer('arama'): ..."""
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timers[name] += time.perf_counter() - t0
+
+    def record(self, **fields):
+        """Çağrı kaydı ekle (en fazla max_traces kayıt tutulur)"""
+        self.traces.append(fields)
+        if len(self.traces) > self.max_traces:
+            del self.traces[0]
+
+    def reset(self):
+        self.counters.clear()
+        self.timers.clear()
+        self.traces.clear()
+
+    def as_dict(self):
+        return {
+            "counters": dict(self.counters),
+            "timers": dict(self.timers),
+            "traces": list(self.traces),
+        }
+
+
+class NullStats:
+    """Ölçüm kapalıyken kullanılan, hiçbir şey yapmayan sürüm"""
+
+    enabled = False
+    _null_timer = nullcontext()
+
+    def count(self, name, n=1):
+        pass
+
+    def add_time(self, name, seconds):
+        pass
+
+    def timer(self, name):
+        return self._null_timer
+
+    def record(self, **fields):
+        pass
+
+    def reset(self):
+        pass
+
+    def as_dict(self):
+        return {"counters": {}, "timers": {}, "traces": []}
+
+
+NULL_STATS = NullStats()
+
+
+def _delta(before, after):
+    """İki ölçüm anı arasında değişen değerler"""
+    return {k: v - before.get(k, 0) for k, v in after.items() if v != before.get(k, 0)}
+
+
+def traced(plan_path):
+    """plan_path'i sarmalayıp ölçüm açıkken her çağrı için kayıt tut
+
+    Ölçüm kapalıyken ek maliyet çağrı başına tek bir öznitelik kontrolüdür.
+    """
+    def wrapper(self, start, goal, obstacles, *args, **kwargs):
+        stats = self.stats
+        if not stats.enabled:
+            return plan_path(self, start, goal, obstacles, *args, **kwargs)
+
+        before = dict(stats.counters)
+        before_timers = dict(stats.timers)
+        t0 = time.perf_counter()
+        path = plan_path(self, start, goal, obstacles, *args, **kwargs)
+        duration = time.perf_counter() - t0
+
+        stats.timers["plan_path"] += duration
+        stats.count("plan_calls")
+        stats.record(
+            planner=type(self).__name__,
+            start=start,
+            goal=goal,
+            duration=duration,
+            path_length=len(path) if path else 0,
+            counters=_delta(before, stats.counters),
+            timers=_delta(before_timers, stats.timers),
+        )
+        return path
+
+    wrapper.__name__ = plan_path.__name__
+    wrapper.__doc__ = plan_path.__doc__
+    wrapper.__wrapped__ = plan_path
+    return wrapper
@@ -8,4 +8,8 @@ class PlannerType(Enum):
     VORONOI = "Voronoi Diyagramları"
     GENETIC = "Genetik Algoritma"
     ANT_COLONY = "Karınca Kolonisi"
-    WAVEFRONT = "Dalga Yayılımı" 
\ No newline at end of file
+    WAVEFRONT = "Dalga Yayılımı"
+    THETA_STAR = "Theta* (Her Açılı)"
+    LAZY_THETA_STAR = "Lazy Theta* (Her Açılı)"
+    HYBRID_ASTAR = "Hybrid A* (Dönüş Yarıçaplı)"
+    HEADLAND_COVERAGE = "Baş Tarlalı Kapsama" 
\ No newline at end of file
@@ -0,0 +1,339 @@
+from collections import namedtuple
+
+import numpy as np
+
+from .grid_path import GridPath, PathRuns
+
+# Yumuşatılmış yol: sürekli (M, 2) noktalar, her noktadaki eğrilik ve
+# engelsiz + eğrilik sınırı içinde olup olmadığı
+SmoothedPath = namedtuple('SmoothedPath', ['points', 'curvature', 'feasible'])
+
+# postprocess_path sonucu: ızgara yolu, dönüş noktaları, (varsa) yumuşatılmış
+# yol ve önce/sonra ölçümleri
+PostProcessResult = namedtuple('PostProcessResult', ['path', 'waypoints', 'smoothed', 'stats'])
+
+# Kübik B-spline baz matrisi (uniform)
+_BSPLINE = np.array([[-1, 3, -3, 1],
+                     [3, -6, 3, 0],
+                     [-3, 0, 3, 0],
+                     [1, 4, 1, 0]], dtype=float) / 6.0
+
+
+def occupancy_from_obstacles(grid_size, obstacles):
+    """Engel listesinden boolean doluluk grid'i oluştur"""
+    occupancy = np.zeros(grid_size, dtype=bool)
+    if len(obstacles):
+        cells = np.asarray(list(obstacles), dtype=np.intp).reshape(-1, 2)
+        occupancy[cells[:, 0], cells[:, 1]] = True
+    return occupancy
+
+
+def obstacle_snapshot(obstacles):
+    """Engel hücrelerinin değişmez kopyası (önbellek anahtarı için)
+
+    Önbellekler kümenin kimliğine değil içeriğine bakar; çağıran aynı kümeye
+    yerinde hücre eklese de eski doluluk grid'i kullanılmaz.
+    """
+    if isinstance(obstacles, frozenset):
+        return obstacles
+    if isinstance(obstacles, set):
+        return frozenset(obstacles)
+    return frozenset(map(tuple, np.asarray(list(obstacles), dtype=np.int64).reshape(-1, 2).tolist()))
+
+
+def line_cells(a, b):
+    """a'dan b'ye doğru parçasını izleyen 4-komşulu hücreler (uçlar dahil)
+
+    Her eksendeki birim adımlar doğru üzerindeki parametre değerine göre
+    sıralanır; böylece hücreler döngüsüz, tek numpy işlemiyle üretilir.
+    """
+    a = np.asarray(a, dtype=np.int64)
+    dy, dx = np.asarray(b, dtype=np.int64) - a
+    ny, nx = abs(int(dy)), abs(int(dx))
+
+    # Adımın doğru üzerindeki konumu (hücre sınırını geçtiği t)
+    t = np.concatenate(((np.arange(ny) + 0.5) / max(ny, 1),
+                        (np.arange(nx) + 0.5) / max(nx, 1)))
+    moves = np.zeros((ny + nx, 2), dtype=np.int64)
+    moves[:ny, 0] = np.sign(dy)
+    moves[ny:, 1] = np.sign(dx)
+    moves = moves[np.argsort(t, kind='stable')]
+
+    cells = np.empty((ny + nx + 1, 2), dtype=np.int64)
+    cells[0] = a
+    np.cumsum(moves, axis=0, out=cells[1:])
+    cells[1:] += a
+    return cells
+
+
+def line_of_sight(occupancy, a, b):
+    """a ile b arasındaki doğru üzerindeki tüm hücreler boş mu"""
+    cells = line_cells(a, b)
+    return not occupancy[cells[:, 0], cells[:, 1]].any()
+
+
+def waypoints(path):
+    """Yolu yalnızca başlangıç, dönüş ve bitiş noktalarına indir"""
+    points = GridPath(path).array
+    if len(points) < 3:
+        return [tuple(p) for p in points.tolist()]
+    steps = np.diff(points.astype(np.int64), axis=0)
+    turns = np.flatnonzero(np.any(steps[1:] != steps[:-1], axis=1)) + 1
+    keep = np.concatenate(([0], turns, [len(points) - 1]))
+    return [tuple(p) for p in points[keep].tolist()]
+
+
+def _segment_cells(a, b, connectivity):
+    # 8-komşulu girdide tek çapraz adım köşe hücresinden geçirilmeden korunur
+    if connectivity == 8 and np.abs(np.asarray(b) - np.asarray(a)).max() == 1:
+        return np.asarray([a, b], dtype=np.int64)
+    return line_cells(a, b)
+
+
+def densify_path(points, connectivity=4):
+    """Dönüş noktaları arasını 4-komşulu ızgara hücreleriyle doldur
+
+    connectivity=8 ise komşu iki nokta arasındaki çapraz adımlar olduğu gibi
+    kalır (bkz. shortcut_path).
+    """
+    points = GridPath(points).array
+    if len(points) < 2:
+        return [tuple(p) for p in points.tolist()]
+    segments = [_segment_cells(points[0], points[1], connectivity)]
+    for a, b in zip(points[1:-1], points[2:]):
+        segments.append(_segment_cells(a, b, connectivity)[1:])
+    return [tuple(p) for p in np.concatenate(segments).tolist()]
+
+
+def shortcut_path(path, occupancy):
+    """Görüş hattı kısaltması: her noktadan görünen en uzak noktaya atla
+
+    Uzak nokta üstel arama + ikili arama ile bulunur; seçilen her kısayol
+    doğrulanmış olduğundan sonuç daima engelsizdir. Görüş hattı olmayan komşu
+    adımlar (ör. 8-komşulu yolda köşe kesen çapraz adım) kısaltılmadan
+    girdideki gibi kalır; bu yollar densify_path(..., connectivity=8) ile
+    doldurulmalıdır. Çıktı dönüş noktası listesidir. Kapsama yollarında hücre
+    atlanacağı için yalnızca noktadan noktaya yollar içindir.
+    """
+    points = GridPath(path).array
+    if len(points) < 3:
+        return [tuple(p) for p in points.tolist()]
+
+    last = len(points) - 1
+    result = [tuple(points[0])]
+    i = 0
+    while i < last:
+        # Üstel arama: görüş hattı kesilene kadar adımı ikiye katla
+        step = 1
+        while i + step * 2 <= last and line_of_sight(occupancy, points[i], points[i + step * 2]):
+            step *= 2
+        if step == 1 and not line_of_sight(occupancy, points[i], points[i + 1]):
+            result.append(tuple(points[i + 1]))
+            i += 1
+            continue
+        low, high = i + step, min(i + step * 2, last + 1)
+        # İkili arama: [low, high) aralığında görünen en uzak nokta
+        while high - low > 1:
+            mid = (low + high) // 2
+            if line_of_sight(occupancy, points[i], points[mid]):
+                low = mid
+            else:
+                high = mid
+        result.append(tuple(points[low]))
+        i = low
+    return [tuple(int(v) for v in p) for p in result]
+
+
+def _run_cells(start, runs):
+    """start'tan itibaren (delta, sayı) koşularının gezdiği hücreler (start hariç)"""
+    deltas = np.array([d for d, _ in runs], dtype=np.int64).reshape(-1, 2)
+    counts = [c for _, c in runs]
+    return np.asarray(start, dtype=np.int64) + np.cumsum(np.repeat(deltas, counts, axis=0), axis=0)
+
+
+def _is_unit(delta):
+    return abs(delta[0]) + abs(delta[1]) == 1
+
+
+def merge_turns(path, occupancy, preserve_coverage=True):
+    """Merdiven şeklindeki bölümleri tek dönüşlü L şekliyle değiştir
+
+    İki dik birim adımın sürekli değiştiği (≥2 dönüş) her bölüm, aynı
+    uzunlukta ve tek dönüşlü bir L ile değiştirilir; L üzerindeki hücreler
+    boş olmalıdır. preserve_coverage=True ise yalnızca bu bölümde gezilen bir
+    hücre kaybolacaksa değişiklik yapılmaz; kapsama yollarında işlenen
+    hücre kümesi korunur.
+    """
+    grid_path = GridPath(path)
+    if len(grid_path) < 4:
+        return grid_path.tolist()
+
+    runs = grid_path.to_runs()
+    deltas = [tuple(int(v) for v in d) for d in runs.deltas.tolist()]
+    counts = runs.counts.tolist()
+    visits = np.zeros(occupancy.shape, dtype=np.int32)
+    np.add.at(visits, (grid_path.ys, grid_path.xs), 1)
+
+    new_runs = []
+    pos = np.asarray(runs.start, dtype=np.int64)
+    r = 0
+    while r < len(deltas):
+        end = r + 1
+        if end < len(deltas) and _is_unit(deltas[r]) and _is_unit(deltas[end]) \
+                and deltas[r] != deltas[end] \
+                and deltas[r][0] * deltas[end][0] + deltas[r][1] * deltas[end][1] == 0:
+            pair = (deltas[r], deltas[end])
+            while end < len(deltas) and deltas[end] in pair:
+                end += 1
+
+        window = list(zip(deltas[r:end], counts[r:end]))
+        replacement = None
+        if end - r >= 3:
+            replacement = _merge_window(pos, window, occupancy, visits, new_runs,
+                                        preserve_coverage)
+        new_runs.extend(replacement or window)
+        pos = pos + sum(np.asarray(d) * c for d, c in window)
+        r = end
+
+    merged = PathRuns(runs.start,
+                      np.array([d for d, _ in new_runs], dtype=np.int16).reshape(-1, 2),
+                      np.array([c for _, c in new_runs], dtype=np.uint32))
+    return GridPath.from_runs(merged).tolist()
+
+
+def _merge_window(pos, window, occupancy, visits, previous_runs, preserve_coverage):
+    """Merdiven penceresi için geçerli bir L bul; yoksa None"""
+    totals = {}
+    for delta, count in window:
+        totals[delta] = totals.get(delta, 0) + count
+    first, second = window[0][0], next(d for d in totals if d != window[0][0])
+
+    # Önceki koşuyla aynı yönde başlayan L ek dönüş getirmez
+    orders = [(first, second), (second, first)]
+    if previous_runs and previous_runs[-1][0] == second:
+        orders.reverse()
+
+    original = _run_cells(pos, window)[:-1]
+    for a, b in orders:
+        candidate = [(a, totals[a]), (b, totals[b])]
+        cells = _run_cells(pos, candidate)[:-1]
+        if occupancy[cells[:, 0], cells[:, 1]].any():
+            continue
+        np.add.at(visits, (original[:, 0], original[:, 1]), -1)
+        np.add.at(visits, (cells[:, 0], cells[:, 1]), 1)
+        if preserve_coverage and not visits[original[:, 0], original[:, 1]].all():
+            # Bir hücre artık hiç gezilmiyor: geri al
+            np.add.at(visits, (cells[:, 0], cells[:, 1]), -1)
+            np.add.at(visits, (original[:, 0], original[:, 1]), 1)
+            continue
+        return candidate
+    return None
+
+
+def _bspline_samples(control, samples):
+    """Kübik B-spline noktaları ve birinci/ikinci türevleri (span başına `samples`)"""
+    u = np.linspace(0.0, 1.0, samples, endpoint=False)
+    powers = np.stack([u ** 3, u ** 2, u, np.ones_like(u)], axis=1)
+    d1 = np.stack([3 * u ** 2, 2 * u, np.ones_like(u), np.zeros_like(u)], axis=1)
+    d2 = np.stack([6 * u, 2 * np.ones_like(u), np.zeros_like(u), np.zeros_like(u)], axis=1)
+
+    # (span, 4, 2) kontrol noktası pencereleri
+    windows = np.lib.stride_tricks.sliding_window_view(control, 4, axis=0).transpose(0, 2, 1)
+    coeffs = np.einsum('ij,sjk->sik', _BSPLINE, windows)
+    points = np.einsum('ui,sik->suk', powers, coeffs)
+    first = np.einsum('ui,sik->suk', d1, coeffs)
+    second = np.einsum('ui,sik->suk', d2, coeffs)
+    return points, first, second
+
+
+def smooth_path(points, occupancy, max_curvature=None, samples=8, max_rounds=3):
+    """Dönüş noktalarından geçen kübik B-spline ile yolu yumuşat
+
+    Çarpışan bölümlerde ilgili kontrol noktaları çoğaltılarak eğri köşeye
+    (dolayısıyla engelsiz çoklu doğruya) yaklaştırılır. Eğrilik (1/hücre)
+    her örnekte hesaplanır; max_curvature aşılırsa feasible=False döner,
+    bu durumda yol kinematik kısıtlı bir planlayıcıyla yeniden planlanmalıdır.
+    """
+    control = np.asarray(GridPath(points).array, dtype=float)
+    if len(control) < 3:
+        return SmoothedPath(control, np.zeros(len(control)), True)
+
+    multiplicity = np.ones(len(control), dtype=np.int64)
+    # Uçların üç kez tekrarı eğrinin uç noktalardan geçmesini sağlar
+    multiplicity[[0, -1]] = 3
+    for _ in range(max_rounds + 1):
+        expanded = np.repeat(control, multiplicity, axis=0)
+        owner = np.repeat(np.arange(len(control)), multiplicity)
+        pts, first, second = _bspline_samples(expanded, samples)
+        cells = np.rint(pts.reshape(-1, 2)).astype(np.intp)
+        cells[:, 0] = np.clip(cells[:, 0], 0, occupancy.shape[0] - 1)
+        cells[:, 1] = np.clip(cells[:, 1], 0, occupancy.shape[1] - 1)
+        hits = occupancy[cells[:, 0], cells[:, 1]].reshape(len(pts), samples).any(axis=1)
+        if not hits.any():
+            break
+        # Çarpışan span'ların iç kontrol noktalarını çoğalt (en fazla 3)
+        for span in np.flatnonzero(hits):
+            for index in np.unique(owner[span + 1:span + 3]):
+                multiplicity[index] = min(multiplicity[index] + 1, 3)
+
+    pts = np.concatenate([pts.reshape(-1, 2), control[-1:]])
+    first = np.concatenate([first.reshape(-1, 2), first[-1, -1:]])
+    second = np.concatenate([second.reshape(-1, 2), second[-1, -1:]])
+    speed = np.hypot(first[:, 0], first[:, 1])
+    cross = np.abs(first[:, 0] * second[:, 1] - first[:, 1] * second[:, 0])
+    with np.errstate(divide='ignore', invalid='ignore'):
+        curvature = np.where(speed > 1e-9, cross / speed ** 3, 0.0)
+
+    feasible = not hits.any()
+    if max_curvature is not None:
+        feasible = feasible and bool(curvature.max() <= max_curvature)
+    return SmoothedPath(pts, curvature, feasible)
+
+
+def path_length(points):
+    """Noktalar arası Öklid uzunluğu"""
+    points = np.asarray(GridPath(points).array, dtype=float)
+    if len(points) < 2:
+        return 0.0
+    return float(np.hypot(*np.diff(points, axis=0).T).sum())
+
+
+def postprocess_path(path, occupancy, shortcut=False, merge=True, smooth=False,
+                     max_curvature=None, preserve_coverage=True, connectivity=4):
+    """Herhangi bir planlayıcının çıktısını son işlemden geçir
+
+    Sıra: turn birleştirme (kapsama yolları) → görüş hattı kısaltması
+    (noktadan noktaya yollar) → isteğe bağlı spline yumuşatma. Dönen `path`
+    ızgara yoludur: kısayollar 4-komşulu doldurulur, connectivity=8 ise
+    girdideki kısaltılamayan çapraz adımlar korunur. `waypoints` araç için
+    dönüş noktaları, `smoothed` ise smooth=True ise SmoothedPath'tir.
+    """
+    if not path:
+        return PostProcessResult([], [], None, {})
+
+    grid_path = GridPath(path)
+    stats = {
+        "steps_before": len(grid_path),
+        "turns_before": grid_path.turn_count(),
+        "length_before": path_length(grid_path),
+    }
+
+    result = grid_path.tolist()
+    if merge:
+        result = merge_turns(result, occupancy, preserve_coverage)
+    points = waypoints(result)
+    if shortcut:
+        points = shortcut_path(result, occupancy)
+        result = densify_path(points, connectivity)
+
+    smoothed = smooth_path(points, occupancy, max_curvature) if smooth else None
+
+    stats.update({
+        "steps_after": len(result),
+        "turns_after": max(len(points) - 2, 0),
+        "length_after": path_length(points),
+    })
+    if smoothed is not None:
+        stats["max_curvature"] = float(smoothed.curvature.max())
+        stats["smooth_feasible"] = smoothed.feasible
+    return PostProcessResult(result, points, smoothed, stats)
@@ -0,0 +1,96 @@
+import importlib
+from importlib import metadata
+
+from .planner_type import PlannerType
+
+# Entry point grubu - harici paketler planlayıcılarını bu grup altında kaydeder
+# Örnek (pyproject.toml):
+#   [project.entry-points."agriedge.planners"]
+#   ASTAR = "benim_paketim.planlayici:HizliAStar"      # yerleşik A*'ın yerine
+#   ORTAK_KAPSAMA = "benim_paketim.kapsama:OrtakKapsama"  # yeni, "ORTAK_KAPSAMA" adıyla
+ENTRY_POINT_GROUP = "agriedge.planners"
+
+# Yerleşik planlayıcılar "modül:Sınıf" olarak tutulur, ilk istekte import edilir
+_BUILTIN_PLANNERS = {
+    PlannerType.ADAPTIVE: "planners.adaptive_planner:AdaptivePathPlanner",
+    PlannerType.ASTAR: "planners.astar_planner:AStarPlanner",
+    PlannerType.RRT: "planners.rrt_planner:RRTPlanner",
+    PlannerType.POTENTIAL_FIELD: "planners.potential_field_planner:PotentialFieldPlanner",
+    PlannerType.VORONOI: "planners.voronoi_planner:VoronoiPlanner",
+    PlannerType.GENETIC: "planners.genetic_planner:GeneticPlanner",
+    PlannerType.ANT_COLONY: "planners.ant_colony_planner:AntColonyPlanner",
+    PlannerType.WAVEFRONT: "planners.wavefront_planner:WavefrontPlanner",
+    PlannerType.THETA_STAR: "planners.theta_star_planner:ThetaStarPlanner",
+    PlannerType.LAZY_THETA_STAR: "planners.theta_star_planner:LazyThetaStarPlanner",
+    PlannerType.HYBRID_ASTAR: "planners.hybrid_astar_planner:HybridAStarPlanner",
+    PlannerType.HEADLAND_COVERAGE: "planners.coverage_planner:HeadlandCoveragePlanner",
+}
+
+# PlannerType (ya da eklentiler için str ad) -> sınıf veya henüz yüklenmemiş
+# "modül:Sınıf" / entry point
+_registry = dict(_BUILTIN_PLANNERS)
+_entry_points_loaded = False
+
+
+def register_planner(planner_type):
+    """Planlayıcı sınıfını kaydeden dekoratör
+
+    planner_type bir PlannerType ya da yeni bir planlayıcı için str addır.
+    Entry point'ler kayıttan önce taranır; böylece dekoratörle yapılan kayıt
+    aynı addaki eklentiyi her zaman ezer.
+
+    Kullanım:
+        @register_planner(PlannerType.ASTAR)
+        class HizliAStar(BasePlanner): ...
+    """
+    def decorator(cls):
+        _discover_entry_points()
+        _registry[planner_type] = cls
+        return cls
+    return decorator
+
+
+def _discover_entry_points():
+    """Kurulu paketlerin entry point'lerini bir kez tara (import etmeden)
+
+    Adı bir PlannerType üyesi olan eklenti o yerleşik planlayıcının yerine
+    geçer; diğer adlar str anahtarla yeni planlayıcı olarak eklenir.
+    """
+    global _entry_points_loaded
+    if _entry_points_loaded:
+        return
+    _entry_points_loaded = True
+
+    try:
+        entry_points = metadata.entry_points(group=ENTRY_POINT_GROUP)
+    except Exception as e:
+        print(f"Planlayıcı eklentileri okunamadı: {e}")
+        return
+
+    for ep in entry_points:
+        key = PlannerType[ep.name] if ep.name in PlannerType.__members__ else ep.name
+        _registry[key] = ep
+
+
+def get_planner_class(planner_type):
+    """Planlayıcı sınıfını döndür, gerekiyorsa modülünü ilk kez import et"""
+    _discover_entry_points()
+
+    if planner_type not in _registry:
+        raise ValueError(f"Kayıtlı planlayıcı bulunamadı: {planner_type}")
+
+    target = _registry[planner_type]
+    if isinstance(target, str):
+        module_name, class_name = target.split(":")
+        target = getattr(importlib.import_module(module_name), class_name)
+        _registry[planner_type] = target
+    elif isinstance(target, metadata.EntryPoint):
+        target = target.load()
+        _registry[planner_type] = target
+    return target
+
+
+def registered_planners():
+    """Kayıtlı tüm planlayıcı tiplerini döndür (hiçbirini import etmeden)"""
+    _discover_entry_points()
+    return list(_registry)
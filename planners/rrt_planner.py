@@ -11,7 +11,15 @@ class RRTPlanner(BasePlanner):
         self.nodes = [start]
         self.parents = {start: None}
         
+        # Sayaçlar döngüde yerel tutulur, ölçüme sonda tek seferde yazılır
+        iterations = 0
+        collision_checks = 0
+        
         for _ in range(self.max_iterations):
+            iterations += 1
+            if iterations % 500 == 0:
+                self._report_progress(fraction=iterations / self.max_iterations,
+                                      expanded_nodes=len(self.nodes))
             # Rastgele nokta seç
             if np.random.random() < 0.1:
                 random_point = goal
@@ -28,18 +36,31 @@ class RRTPlanner(BasePlanner):
             new_node = self._steer(nearest_node, random_point)
             
             # Engel kontrolü
+            collision_checks += 1
+            # Tamsayıya yuvarlama aynı düğümü tekrar üretebilir; ağaca zaten
+            # ekli düğümü yeniden eklemek ebeveyn zincirinde döngü oluşturur
+            if new_node in self.parents:
+                continue
             if new_node not in obstacles and self._is_path_clear(nearest_node, new_node, obstacles):
                 self.nodes.append(new_node)
                 self.parents[new_node] = nearest_node
                 
                 # Hedefe ulaştık mı?
                 if self._distance(new_node, goal) < self.step_size:
+                    self._report_stats(iterations, collision_checks)
                     path = self._reconstruct_path(new_node)
                     path.append(goal)
                     return path
         
+        self._report_stats(iterations, collision_checks)
         return None
     
+    def _report_stats(self, iterations, collision_checks):
+        """Döngü sayaçlarını ölçüme yaz"""
+        self.stats.count("iterations", iterations)
+        self.stats.count("collision_checks", collision_checks)
+        self.stats.count("tree_nodes", len(self.nodes))
+    
     def _find_nearest(self, point):
         distances = [self._distance(point, node) for node in self.nodes]
         return self.nodes[np.argmin(distances)]
@@ -0,0 +1,338 @@
+import heapq
+import itertools
+
+import numpy as np
+
+from .astar_planner import AStarPlanner
+from .distance import UNREACHABLE, geodesic_distance
+from .postprocess import obstacle_snapshot
+
+class ReservationTable:
+    """Uzay-zaman rezervasyon tablosu
+
+    (hücre, t) çiftleri tek bir tamsayı anahtara (t * hücre_sayısı + hücre)
+    indirgenerek sözlükte tutulur. Hedefine varan robot hücresini o andan
+    itibaren süresiz olarak işgal eder (park). robot parametresi verilen
+    sorgularda robotun kendi rezervasyonları engel sayılmaz; sahipsiz
+    (robot=None) rezervasyonlar ve robot=None sorguları her zaman engeldir.
+    """
+
+    def __init__(self, grid_size):
+        self.cols = grid_size[1]
+        self.cells = grid_size[0] * grid_size[1]
+        self._vertex = {}
+        self._edge = {}
+        self._parked = {}
+        # Hücre başına en son rezervasyon zamanı (hedefte kalma kontrolü için)
+        self._last = {}
+        self.horizon = 0
+
+    def _id(self, pos):
+        return pos[0] * self.cols + pos[1]
+
+    @staticmethod
+    def _blocks(owner, robot):
+        return robot is None or owner != robot
+
+    def reserve(self, pos, t, robot=None):
+        cell = self._id(pos)
+        self._vertex[t * self.cells + cell] = robot
+        if t > self._last.get(cell, (-1, None))[0]:
+            self._last[cell] = (t, robot)
+        self.horizon = max(self.horizon, t)
+
+    def reserve_move(self, a, b, t, robot=None):
+        """robot'un t anında a'dan b'ye geçişini ayır (karşı yöndeki geçiş yasaklanır)"""
+        self._edge[(t * self.cells + self._id(a)) * self.cells + self._id(b)] = robot
+
+    def park(self, pos, t, robot=None):
+        """pos hücresini t anından itibaren süresiz ayır"""
+        cell = self._id(pos)
+        self._parked[cell] = (t, robot)
+        self.horizon = max(self.horizon, t)
+
+    def reserve_path(self, path, robot=None, start_time=0, park=True):
+        """Yolun her adımını ve geçişini ayır; park=True ise son hücrede kal"""
+        for offset, pos in enumerate(path):
+            self.reserve(pos, start_time + offset, robot)
+            if offset:
+                self.reserve_move(path[offset - 1], pos, start_time + offset - 1, robot)
+        if park and path:
+            self.park(path[-1], start_time + len(path) - 1, robot)
+
+    def is_free(self, pos, t, robot=None):
+        """pos hücresi t anında robot için boş mu"""
+        cell = self._id(pos)
+        key = t * self.cells + cell
+        if key in self._vertex and self._blocks(self._vertex[key], robot):
+            return False
+        parked = self._parked.get(cell)
+        return parked is None or t < parked[0] or not self._blocks(parked[1], robot)
+
+    def move_free(self, a, b, t, robot=None):
+        """t anındaki a -> b geçişi, b -> a geçen başka bir robotla çakışmıyor mu"""
+        key = (t * self.cells + self._id(b)) * self.cells + self._id(a)
+        return key not in self._edge or not self._blocks(self._edge[key], robot)
+
+    def last_reserved(self, pos, robot=None):
+        """Hücrenin başka robotlarca en son ayrıldığı zaman; park edilmişse sonsuz"""
+        cell = self._id(pos)
+        parked = self._parked.get(cell)
+        if parked is not None and self._blocks(parked[1], robot):
+            return float('inf')
+        t, owner = self._last.get(cell, (-1, None))
+        return t if self._blocks(owner, robot) else -1
+
+
+class SpaceTimeAStarPlanner(AStarPlanner):
+    """Zaman genişletilmiş A*: durum (hücre, t), eylemler 4 komşu + bekleme
+
+    Komşuluk AStarPlanner._get_neighbors ile aynıdır. Sezgisel olarak hedefe
+    engelleri dikkate alan gerçek mesafe (BFS) kullanılır; hedef başına bir
+    kez hesaplanıp önbelleğe alınır.
+    """
+
+    def __init__(self, grid_size):
+        super().__init__(grid_size)
+        self._heuristics = {}
+        self._heuristic_obstacles = None
+        self._free = None
+
+    def set_connectivity(self, connectivity, corner_cutting="never"):
+        # Rezervasyonlar ve BFS sezgiseli birim süreli dik adımlara göre kurulu
+        if connectivity != 4:
+            raise ValueError("Zaman genişletilmiş A* yalnızca 4-komşulu çalışır")
+        super().set_connectivity(connectivity, corner_cutting)
+
+    def _distance_to(self, goal, obstacles):
+        """Hedefe gerçek mesafe haritası (aynı engel içeriği için önbellekli)"""
+        snapshot = obstacle_snapshot(obstacles)
+        if snapshot != self._heuristic_obstacles:
+            self._heuristics.clear()
+            self._heuristic_obstacles = snapshot
+            self._free = np.ones(self.grid_size, dtype=bool)
+            if obstacles:
+                cells = np.asarray(list(obstacles), dtype=np.intp).reshape(-1, 2)
+                self._free[cells[:, 0], cells[:, 1]] = False
+        if goal not in self._heuristics:
+            self._heuristics[goal] = geodesic_distance(self._free, goal).ravel()
+        return self._heuristics[goal]
+
+    def plan_path(self, start, goal, obstacles, reservations=None, robot=None,
+                  start_time=0, max_time=None):
+        """Rezervasyonlarla çakışmayan, zaman damgalı yol planla
+
+        Dönen yolun i. elemanı robotun start_time + i anındaki hücresidir
+        (bekleme adımları tekrar eden hücrelerdir). Yol bulunamazsa [] döner.
+        """
+        cols = self.grid_size[1]
+        distance = self._distance_to(goal, obstacles)
+        if distance[start[0] * cols + start[1]] == UNREACHABLE:
+            return []
+        if reservations is None:
+            reservations = ReservationTable(self.grid_size)
+        if max_time is None:
+            max_time = (start_time + int(distance[start[0] * cols + start[1]])
+                        + reservations.horizon + sum(self.grid_size))
+        # Hedefte, başka robotun daha sonra gireceği bir anda kalınamaz; sezgisel
+        # varış zamanını bu sınırdan önceye koymaz
+        goal_free_after = reservations.last_reserved(goal, robot)
+        if goal_free_after == float('inf'):
+            return []
+        earliest_arrival = goal_free_after + 1
+
+        def priority(pos, t):
+            return max(t + int(distance[pos[0] * cols + pos[1]]), earliest_arrival) - start_time
+
+        # Eşit f değerlerinde daha ileri zamandaki (hedefe yakın) durum önce açılır
+        frontier = [(priority(start, start_time), -start_time, start)]
+        came_from = {(start, start_time): None}
+        expanded = 0
+        pushes = 1
+        found = None
+
+        while frontier:
+            _, t, current = heapq.heappop(frontier)
+            t = -t
+            expanded += 1
+            if expanded % 1024 == 0:
+                self._report_progress(expanded_nodes=expanded)
+
+            if current == goal and t > goal_free_after:
+                found = (current, t)
+                break
+            if t >= max_time:
+                continue
+
+            for next_pos in self._get_neighbors(current, obstacles) + [current]:
+                state = (next_pos, t + 1)
+                if state in came_from:
+                    continue
+                if not reservations.is_free(next_pos, t + 1, robot):
+                    continue
+                if next_pos != current and not reservations.move_free(current, next_pos, t, robot):
+                    continue
+                came_from[state] = (current, t)
+                heapq.heappush(frontier, (priority(next_pos, t + 1), -(t + 1), next_pos))
+                pushes += 1
+
+        self.stats.count("expanded_nodes", expanded)
+        self.stats.count("heap_pushes", pushes)
+        self.stats.count("collision_checks", 5 * expanded)
+
+        if found is None:
+            return []
+        path = []
+        state = found
+        while state is not None:
+            path.append(state[0])
+            state = came_from[state]
+        path.reverse()
+        return path
+
+
+def _robot_order(planner, starts, goals, obstacles):
+    """Varsayılan öncelik: hedefi en uzak olan robot önce planlanır"""
+    cols = planner.grid_size[1]
+    lengths = [planner._distance_to(goal, obstacles)[start[0] * cols + start[1]]
+               for start, goal in zip(starts, goals)]
+    return sorted(range(len(starts)), key=lambda robot: -lengths[robot])
+
+
+def plan_prioritized(grid_size, obstacles, starts, goals, order=None, max_restarts=3,
+                     planner=None):
+    """Öncelikli planlama: robotlar sırayla planlanır, her yol tabloya işlenir
+
+    Henüz planlanmamış robotların başlangıç hücreleri t=0'da ayrılır. Bir robot
+    yol bulamazsa önceliği en başa alınıp plan baştan yapılır (en fazla
+    max_restarts kez). Yol bulunamayan robotlar için [] döner.
+    """
+    planner = planner or SpaceTimeAStarPlanner(grid_size)
+    obstacles = obstacles if isinstance(obstacles, (set, frozenset)) else set(obstacles)
+    starts = [tuple(s) for s in starts]
+    goals = [tuple(g) for g in goals]
+    order = list(order) if order is not None else _robot_order(planner, starts, goals, obstacles)
+
+    paths = [[] for _ in starts]
+    for _ in range(max_restarts + 1):
+        table = ReservationTable(grid_size)
+        for robot, start in enumerate(starts):
+            table.reserve(start, 0, robot)
+
+        paths = [[] for _ in starts]
+        failed = None
+        for robot in order:
+            path = planner.plan_path(starts[robot], goals[robot], obstacles,
+                                     reservations=table, robot=robot)
+            if not path:
+                failed = robot
+                break
+            table.reserve_path(path, robot)
+            paths[robot] = path
+
+        if failed is None:
+            return paths
+        order.remove(failed)
+        order.insert(0, failed)
+    return paths
+
+
+def _position(path, t):
+    return path[t] if t < len(path) else path[-1]
+
+
+def first_conflict(paths):
+    """İlk çakışma: ('vertex', i, j, hücre, t) ya da ('edge', i, j, a, b, t); yoksa None"""
+    horizon = max(len(p) for p in paths)
+    for t in range(horizon):
+        seen = {}
+        for robot, path in enumerate(paths):
+            pos = _position(path, t)
+            if pos in seen:
+                return ('vertex', seen[pos], robot, pos, t)
+            seen[pos] = robot
+        if t + 1 < horizon:
+            for i, j in itertools.combinations(range(len(paths)), 2):
+                a, b = _position(paths[i], t), _position(paths[i], t + 1)
+                if a != b and _position(paths[j], t) == b and _position(paths[j], t + 1) == a:
+                    return ('edge', i, j, a, b, t)
+    return None
+
+
+def _constraint_table(grid_size, constraints):
+    """Bir robotun kısıtlarını rezervasyon tablosuna çevir"""
+    table = ReservationTable(grid_size)
+    for constraint in constraints:
+        if constraint[0] == 'vertex':
+            table.reserve(constraint[1], constraint[2])
+        else:
+            # a -> b geçişi yasak: karşı yöndeki (b -> a) geçişi ayrılmış say
+            _, a, b, t = constraint
+            table.reserve_move(b, a, t)
+    return table
+
+
+def plan_cbs(grid_size, obstacles, starts, goals, max_nodes=2000, planner=None):
+    """Çakışma Tabanlı Arama (CBS): küçük ekipler için toplam maliyeti en az yollar
+
+    Üst seviyede kısıt ağacı en küçük toplam yol uzunluğuyla genişletilir; alt
+    seviyede her robot kendi kısıtlarıyla SpaceTimeAStarPlanner'la planlanır.
+    max_nodes düğümde çözüm bulunamazsa None döner.
+    """
+    planner = planner or SpaceTimeAStarPlanner(grid_size)
+    obstacles = obstacles if isinstance(obstacles, (set, frozenset)) else set(obstacles)
+    starts = [tuple(s) for s in starts]
+    goals = [tuple(g) for g in goals]
+
+    def low_level(robot, constraints):
+        return planner.plan_path(starts[robot], goals[robot], obstacles,
+                                 reservations=_constraint_table(grid_size, constraints))
+
+    root_constraints = [() for _ in starts]
+    root_paths = [low_level(robot, ()) for robot in range(len(starts))]
+    if not all(root_paths):
+        return None
+
+    counter = itertools.count()
+    open_nodes = [(sum(map(len, root_paths)), next(counter), root_constraints, root_paths)]
+    for _ in range(max_nodes):
+        if not open_nodes:
+            break
+        _, _, constraints, paths = heapq.heappop(open_nodes)
+        conflict = first_conflict(paths)
+        if conflict is None:
+            return paths
+
+        if conflict[0] == 'vertex':
+            _, i, j, pos, t = conflict
+            branches = [(i, ('vertex', pos, t)), (j, ('vertex', pos, t))]
+        else:
+            _, i, j, a, b, t = conflict
+            branches = [(i, ('edge', a, b, t)), (j, ('edge', b, a, t))]
+
+        for robot, constraint in branches:
+            child_constraints = list(constraints)
+            child_constraints[robot] = constraints[robot] + (constraint,)
+            path = low_level(robot, child_constraints[robot])
+            if not path:
+                continue
+            child_paths = list(paths)
+            child_paths[robot] = path
+            heapq.heappush(open_nodes, (sum(map(len, child_paths)), next(counter),
+                                        child_constraints, child_paths))
+    return None
+
+
+def plan_multi_agent(grid_size, obstacles, starts, goals, method="auto", cbs_max_robots=6):
+    """Robotları çakışmasız yönlendir
+
+    method: "cbs", "prioritized" ya da "auto" (küçük ekiplerde CBS, çözüm
+    bulunamazsa veya ekip büyükse öncelikli planlama).
+    """
+    planner = SpaceTimeAStarPlanner(grid_size)
+    obstacles = obstacles if isinstance(obstacles, (set, frozenset)) else set(obstacles)
+    if method == "cbs" or (method == "auto" and len(starts) <= cbs_max_robots):
+        paths = plan_cbs(grid_size, obstacles, starts, goals, planner=planner)
+        if paths is not None or method == "cbs":
+            return paths
+    return plan_prioritized(grid_size, obstacles, starts, goals, planner=planner)
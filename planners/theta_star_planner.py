@@ -0,0 +1,171 @@
+import heapq
+import math
+
+import numpy as np
+
+from .astar_planner import AStarPlanner
+from .connectivity import grid_neighbors
+from .postprocess import line_cells, obstacle_snapshot, occupancy_from_obstacles
+
+
+def _euclidean(a, b):
+    return math.hypot(a[0] - b[0], a[1] - b[1])
+
+
+def _diagonal_cells(a, b):
+    """a'dan b'ye 8-komşulu hücre dizisi (uçlar dahil, her adımda ana eksende 1 hücre)"""
+    a, b = np.asarray(a, dtype=np.float64), np.asarray(b, dtype=np.float64)
+    n = int(np.abs(b - a).max())
+    if n == 0:
+        return a.astype(np.int64)[None]
+    t = np.arange(n + 1)[:, None] / n
+    return np.rint(a + t * (b - a)).astype(np.int64)
+
+
+class ThetaStarPlanner(AStarPlanner):
+    """Her açılı (any-angle) Theta*
+
+    8-komşulu A* gibi genişler ancak bir komşunun ebeveyni, görüş hattı varsa
+    mevcut hücrenin ebeveyni olur; böylece yol ızgara açılarına bağlı kalmaz.
+    Görüş hattı doluluk grid'i üzerinde iki yönlü supercover ile kontrol edilir
+    (doğru, engel köşelerine de değmez). plan_waypoints dönüş noktalarını,
+    plan_path bunlar arasını 8-komşulu hücrelerle dolduran ızgara yolunu verir.
+    """
+
+    # Dönüş noktaları arası doğrular engel köşelerine değmez ama hücre dolgusu
+    # köşeleri çapraz geçebilir
+    path_connectivity = 8
+    path_corner_cutting = "always"
+
+    # Lazy Theta*: görüş hattı genişletme anında değil, düğüm açılırken bir kez kontrol edilir
+    lazy = False
+
+    def __init__(self, grid_size):
+        super().__init__(grid_size)
+        self._blocked = None
+        self._blocked_source = None
+
+    def plan_path(self, start, goal, obstacles):
+        """Theta* ile yol planla; dönüş noktaları arası 8-komşulu hücrelerle doldurulur"""
+        points = self.plan_waypoints(start, goal, obstacles)
+        if len(points) < 2:
+            return points
+        segments = [_diagonal_cells(points[0], points[1])]
+        for a, b in zip(points[1:-1], points[2:]):
+            segments.append(_diagonal_cells(a, b)[1:])
+        return [tuple(p) for p in np.concatenate(segments).tolist()]
+
+    def plan_waypoints(self, start, goal, obstacles):
+        """Her açılı yolun dönüş noktaları (hedefe ulaşılamazsa boş liste)"""
+        blocked = self._blocked_grid(obstacles)
+        if blocked[start] or blocked[goal]:
+            return []
+        costs = None if self.cost_map is None else self.cost_map.costs
+        scale = 1 if costs is None else self.cost_map.min_cost
+
+        g = {start: 0.0}
+        parent = {start: start}
+        closed = set()
+        frontier = [(scale * _euclidean(start, goal), start)]
+        expanded = 0
+        pushes = 1
+        sight_checks = 0
+
+        while frontier:
+            current = heapq.heappop(frontier)[1]
+            if current in closed:
+                continue
+
+            if self.lazy and parent[current] != current:
+                # Ebeveyne görüş hattı yoksa en iyi kapalı komşuya bağlan
+                sight_checks += 1
+                if not self._visible(blocked, parent[current], current):
+                    g[current], parent[current] = min(
+                        (g[n] + self._segment_cost(n, current, costs), n)
+                        for n in self._neighbors(current, obstacles) if n in closed)
+
+            closed.add(current)
+            expanded += 1
+            if expanded % 1024 == 0:
+                self._report_progress(expanded_nodes=expanded)
+            if current == goal:
+                break
+
+            for next_pos in self._neighbors(current, obstacles):
+                if next_pos in closed:
+                    continue
+                via = parent[current]
+                if via != current and not self.lazy:
+                    sight_checks += 1
+                    if not self._visible(blocked, via, next_pos):
+                        via = current
+                candidate = g[via] + self._segment_cost(via, next_pos, costs)
+                if candidate < g.get(next_pos, math.inf):
+                    g[next_pos] = candidate
+                    parent[next_pos] = via
+                    heapq.heappush(frontier, (candidate + scale * _euclidean(next_pos, goal), next_pos))
+                    pushes += 1
+
+        self.stats.count("expanded_nodes", expanded)
+        self.stats.count("heap_pushes", pushes)
+        self.stats.count("line_of_sight_checks", sight_checks)
+
+        if goal not in closed:
+            return []
+        points = [goal]
+        while points[-1] != start:
+            points.append(parent[points[-1]])
+        points.reverse()
+        return points
+
+    def _neighbors(self, pos, obstacles):
+        # Theta* her zaman 8-komşulu genişler; köşe kesme kuralı planlayıcı ayarından gelir
+        costs = None if self.cost_map is None else self.cost_map.costs
+        return grid_neighbors(pos, self.grid_size, obstacles, costs, 8, self.corner_cutting)
+
+    def _blocked_grid(self, obstacles):
+        """Engel + geçilemeyen maliyet hücrelerinden doluluk grid'i (önbellekli)
+
+        Önbellek engel kümesinin içeriğine göre yenilenir; aynı küme yerinde
+        değiştirilse de güncel engeller kullanılır.
+        """
+        cost_map = self.cost_map
+        version = None if cost_map is None else cost_map.version
+        snapshot = obstacle_snapshot(obstacles)
+        cached = self._blocked_source
+        if (cached is None or cached[0] != snapshot or
+                cached[1] is not cost_map or cached[2] != version):
+            blocked = occupancy_from_obstacles(self.grid_size, obstacles)
+            if cost_map is not None:
+                blocked |= cost_map.impassable_mask()
+            self._blocked = blocked
+            self._blocked_source = (snapshot, cost_map, version)
+        return self._blocked
+
+    @staticmethod
+    def _visible(blocked, a, b):
+        """a ile b arası görüş hattı: doğrunun değdiği tüm hücreler boş mu
+
+        line_cells köşe eşitliklerinde tek hücre seçtiği için iki yönde izlenir.
+        """
+        for cells in (line_cells(a, b), line_cells(b, a)):
+            if blocked[cells[:, 0], cells[:, 1]].any():
+                return False
+        return True
+
+    @staticmethod
+    def _segment_cost(a, b, costs):
+        """Doğru parçasının maliyeti: uzunluk x girilen hücrelerin ortalama maliyeti"""
+        length = _euclidean(a, b)
+        if costs is None:
+            return length
+        if abs(a[0] - b[0]) <= 1 and abs(a[1] - b[1]) <= 1:
+            return length * costs.item(b)
+        cells = line_cells(a, b)[1:]
+        return length * float(costs[cells[:, 0], cells[:, 1]].mean())
+
+
+class LazyThetaStarPlanner(ThetaStarPlanner):
+    """Lazy Theta*: komşu başına değil, düğüm başına bir görüş hattı kontrolü"""
+
+    lazy = True
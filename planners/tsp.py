@@ -0,0 +1,266 @@
+"""Nokta ve bölge sıralama motoru (gezgin satıcı problemi için sezgisel çözücü)
+
+Mesafe matrisi her noktadan başlayan BFS'lerin toplu (batched) dalga
+cepheleriyle engeller dikkate alınarak hesaplanır. Tur önce en yakın komşu ile
+kurulur, ardından zaman bütçesi dolana ya da iyileşme kalmayana kadar 2-opt ve
+Or-opt yerel aramasıyla kısaltılır. Arama her an kesilebilir (anytime): o ana
+kadarki en iyi tur döner.
+"""
+import time
+from collections import namedtuple
+
+import numpy as np
+
+from .distance import UNREACHABLE
+
+# Çözüm: ziyaret sırası (indeksler), toplam maliyet ve arama istatistikleri
+TourResult = namedtuple('TourResult', ['order', 'cost', 'stats'])
+
+# Toplu BFS'te aynı anda tutulacak en fazla (kaynak x hücre) girdi sayısı
+DEFAULT_BATCH_CELLS = 1 << 24
+
+
+def _moves(cells, shape, connectivity):
+    """Düz indeksli hücrelerin komşuları ve her komşunun hangi girdiden geldiği"""
+    rows, cols = shape
+    r, c = np.divmod(cells, cols)
+    steps = [(r > 0, -cols), (r < rows - 1, cols), (c > 0, -1), (c < cols - 1, 1)]
+    if connectivity == 8:
+        steps += [((r > 0) & (c > 0), -cols - 1), ((r > 0) & (c < cols - 1), -cols + 1),
+                  ((r < rows - 1) & (c > 0), cols - 1), ((r < rows - 1) & (c < cols - 1), cols + 1)]
+    origins = np.concatenate([np.flatnonzero(ok) for ok, _ in steps])
+    targets = np.concatenate([cells[ok] + delta for ok, delta in steps])
+    return origins, targets
+
+
+def batched_geodesic_distances(free, sources, connectivity=4, batch_cells=DEFAULT_BATCH_CELLS):
+    """Her kaynaktan tüm hücrelere BFS adım sayıları: (K, satır, sütun) int32
+
+    Aynı partideki kaynakların dalga cepheleri tek dizide (kaynak * n + hücre)
+    birlikte genişletilir; böylece Python döngüsü kaynak başına değil, en
+    uzun mesafe kadar döner. Bellek batch_cells ile sınırlanır.
+    """
+    free = np.asarray(free, dtype=bool)
+    n = free.size
+    flat_free = free.ravel()
+    sources = np.ravel_multi_index(np.asarray(sources, dtype=np.intp).reshape(-1, 2).T, free.shape)
+    result = np.full((len(sources), n), UNREACHABLE, dtype=np.int32)
+    batch = max(1, batch_cells // n)
+
+    for first in range(0, len(sources), batch):
+        chunk = sources[first:first + batch]
+        dist = result[first:first + len(chunk)].reshape(-1)
+        frontier = (np.arange(len(chunk)) * n + chunk)[flat_free[chunk]]
+        dist[frontier] = 0
+        slot = np.empty(dist.size, dtype=np.intp)
+        depth = 0
+        while frontier.size:
+            depth += 1
+            owner, cell = np.divmod(frontier, n)
+            origins, targets = _moves(cell, free.shape, connectivity)
+            candidates = owner[origins] * n + targets
+            candidates = candidates[flat_free[targets] & (dist[candidates] == UNREACHABLE)]
+            # Tekrar eden girdileri O(n) karalama dizisiyle ele
+            positions = np.arange(candidates.size)
+            slot[candidates] = positions
+            frontier = candidates[slot[candidates] == positions]
+            dist[frontier] = depth
+    return result.reshape((len(sources),) + free.shape)
+
+
+def distance_matrix(free, points, connectivity=4, batch_cells=DEFAULT_BATCH_CELLS):
+    """Noktalar arası engelleri dikkate alan mesafe matrisi (ulaşılamayan: inf)"""
+    points = np.asarray(points, dtype=np.intp).reshape(-1, 2)
+    dist = batched_geodesic_distances(free, points, connectivity, batch_cells)
+    matrix = dist[:, points[:, 0], points[:, 1]].astype(np.float64)
+    matrix[matrix == UNREACHABLE] = np.inf
+    return matrix
+
+
+def nearest_neighbor_order(matrix, start=None, end=None):
+    """En yakın komşu turu; start/end verilirse başta/sonda sabit tutulur"""
+    n = len(matrix)
+    remaining = np.ones(n, dtype=bool)
+    current = 0 if start is None else start
+    order = [current]
+    remaining[current] = False
+    if end is not None and end != current:
+        remaining[end] = False
+    while remaining.any():
+        candidates = np.flatnonzero(remaining)
+        current = int(candidates[np.argmin(matrix[current, candidates])])
+        order.append(current)
+        remaining[current] = False
+    if end is not None and end != order[0]:
+        order.append(end)
+    return order
+
+
+def tour_cost(matrix, order, closed=False):
+    """Sıranın toplam maliyeti (closed=True ise başa dönüş dahil)"""
+    order = np.asarray(order)
+    cost = float(matrix[order[:-1], order[1:]].sum())
+    if closed and len(order) > 1:
+        cost += float(matrix[order[-1], order[0]])
+    return cost
+
+
+class _Search:
+    """Sabit uçlu açık yol üzerinde 2-opt ve Or-opt yerel araması"""
+
+    def __init__(self, matrix, order, lo, hi, deadline):
+        # Sonsuz mesafeler büyük ama sonlu bir cezaya çevrilir; fark hesapları bozulmasın
+        finite = matrix[np.isfinite(matrix)]
+        penalty = (finite.max() if finite.size else 1.0) * len(matrix) + 1.0
+        self.matrix = np.where(np.isfinite(matrix), matrix, penalty)
+        self.order = np.asarray(order, dtype=np.intp)
+        self.lo, self.hi = lo, hi
+        self.deadline = deadline
+        self.two_opt_moves = 0
+        self.or_opt_moves = 0
+
+    def expired(self):
+        return self.deadline is not None and time.perf_counter() >= self.deadline
+
+    def _edge(self, a, b):
+        """a -> b kenar maliyetleri; uç yoksa (-1) 0"""
+        cost = self.matrix[np.maximum(a, 0), np.maximum(b, 0)]
+        return np.where((a < 0) | (b < 0), 0.0, cost)
+
+    def two_opt(self):
+        """[i, j] aralığını ters çeviren en iyi hamleleri uygula; iyileşme olduysa True"""
+        order = self.order
+        n = len(order)
+        improved = False
+        for i in range(self.lo, self.hi - 1):
+            if self.expired():
+                break
+            j = np.arange(i + 1, self.hi)
+            before = order[i - 1] if i > 0 else -1
+            after = np.where(j + 1 < n, order[np.minimum(j + 1, n - 1)], -1)
+            a = np.full(j.size, before)
+            delta = (self._edge(a, order[j]) + self._edge(order[i] + 0 * j, after) -
+                     self._edge(a, order[i] + 0 * j) - self._edge(order[j], after))
+            best = int(np.argmin(delta))
+            if delta[best] < -1e-9:
+                k = int(j[best])
+                order[i:k + 1] = order[i:k + 1][::-1].copy()
+                self.two_opt_moves += 1
+                improved = True
+        return improved
+
+    def or_opt(self, max_segment=3):
+        """1..max_segment uzunluğundaki parçaları (gerekirse ters) başka yere taşı"""
+        improved = False
+        for length in range(1, min(max_segment, len(self.order) - 1) + 1):
+            i = self.lo
+            while i + length <= self.hi:
+                if self.expired():
+                    return improved
+                order = self.order
+                n = len(order)
+                segment = order[i:i + length]
+                prev = order[i - 1] if i > 0 else -1
+                nxt = order[i + length] if i + length < n else -1
+                removal = (self._edge(np.array([prev]), np.array([segment[0]]))[0] +
+                           self._edge(np.array([segment[-1]]), np.array([nxt]))[0] -
+                           self._edge(np.array([prev]), np.array([nxt]))[0])
+                rest = np.concatenate((order[:i], order[i + length:]))
+                # Ekleme noktası: rest[p-1] ile rest[p] arası (uçlar sabit değilse uçlara da)
+                p = np.arange(self.lo, self.hi - length + 1)
+                left = np.where(p > 0, rest[np.maximum(p - 1, 0)], -1)
+                right = np.where(p < len(rest), rest[np.minimum(p, len(rest) - 1)], -1)
+                forward = (self._edge(left, segment[0] + 0 * p) + self._edge(segment[-1] + 0 * p, right) -
+                           self._edge(left, right))
+                backward = (self._edge(left, segment[-1] + 0 * p) + self._edge(segment[0] + 0 * p, right) -
+                            self._edge(left, right))
+                gains = np.minimum(forward, backward) - removal
+                best = int(np.argmin(gains)) if gains.size else 0
+                if gains.size and gains[best] < -1e-9:
+                    insert = segment if forward[best] <= backward[best] else segment[::-1]
+                    position = int(p[best])
+                    self.order = np.concatenate((rest[:position], insert, rest[position:]))
+                    self.or_opt_moves += 1
+                    improved = True
+                else:
+                    i += 1
+        return improved
+
+
+def solve_tsp(matrix, start=None, end=None, closed=False, time_budget=1.0, callback=None):
+    """Sıralama problemini çöz: en yakın komşu + 2-opt/Or-opt, zaman bütçeli
+
+    matrix (N, N) mesafe matrisidir. start/end verilirse sıra o noktalarla
+    başlar/biter; closed=True ise tur başlangıca döner (maliyete dahil).
+    time_budget saniye cinsindendir (None: iyileşme kalmayana kadar).
+    callback(order, cost) her iyileşen turda çağrılır; arama herhangi bir anda
+    kesilse de o ana kadarki en iyi tur döndürülür.
+    """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    n = len(matrix)
+    began = time.perf_counter()
+    if n == 0:
+        return TourResult([], 0.0, {"iterations": 0, "time": 0.0})
+    if closed:
+        start = 0 if start is None else start
+        end = None
+
+    order = nearest_neighbor_order(matrix, start, end)
+    if closed:
+        # Kapalı tur, başlangıcın kopyasıyla biten açık yol olarak aranır
+        order = order + [order[0]]
+    initial = tour_cost(matrix, order)
+
+    lo = 1 if start is not None else 0
+    hi = len(order) - (1 if (end is not None or closed) else 0)
+    deadline = None if time_budget is None else began + time_budget
+    search = _Search(matrix, order, lo, hi, deadline)
+    best_cost = initial
+    iterations = 0
+    while not search.expired():
+        iterations += 1
+        changed = search.two_opt()
+        changed = search.or_opt() or changed
+        cost = tour_cost(matrix, search.order)
+        if cost < best_cost - 1e-9:
+            best_cost = cost
+            if callback is not None:
+                callback(search.order[:-1].tolist() if closed else search.order.tolist(), cost)
+        if not changed:
+            break
+
+    order = search.order.tolist()
+    if closed:
+        order = order[:-1]
+    stats = {
+        "iterations": iterations,
+        "time": time.perf_counter() - began,
+        "initial_cost": initial,
+        "two_opt_moves": search.two_opt_moves,
+        "or_opt_moves": search.or_opt_moves,
+        "timed_out": search.expired(),
+    }
+    return TourResult(order, tour_cost(matrix, order, closed), stats)
+
+
+def order_waypoints(free, waypoints, start=None, end=None, closed=False,
+                    time_budget=1.0, connectivity=4):
+    """Ziyaret noktalarını engelleri dikkate alarak sırala (ör. tek tek bitki çapalama)
+
+    start/end hücre olarak verilirse tura sabit uç olarak eklenir. Dönen
+    sıra yalnızca waypoints'in indekslerini içerir.
+    """
+    points = [tuple(p) for p in waypoints]
+    offset = 0
+    if start is not None:
+        points.insert(0, tuple(start))
+        offset = 1
+    if end is not None:
+        points.append(tuple(end))
+    matrix = distance_matrix(free, points, connectivity)
+    result = solve_tsp(matrix,
+                       start=0 if start is not None else None,
+                       end=len(points) - 1 if end is not None else None,
+                       closed=closed, time_budget=time_budget)
+    order = [i - offset for i in result.order if offset <= i < offset + len(waypoints)]
+    return TourResult(order, result.cost, result.stats)
@@ -0,0 +1,131 @@
+"""Planlayıcı çıktılarını doğrulama
+
+Yol tek bir (N, 2) diziye çevrilir ve tüm kontroller dizi işlemleriyle yapılır:
+sınırlar, engel çarpışmaları, adım uzunlukları (komşuluk), çapraz adımda köşe
+kesme ve başlangıç/hedef uçları. Her planlamada çalıştırılacak kadar ucuzdur;
+milyon noktalık bir yol birkaç on milisaniyede denetlenir.
+"""
+from collections import namedtuple
+
+import numpy as np
+
+from .connectivity import check_connectivity
+from .grid_path import GridPath
+from .postprocess import occupancy_from_obstacles
+
+# Sorun türü, toplam sayı, ilgili yol indeksleri (en fazla max_indices tane),
+# bu indekslerdeki hücreler ve okunabilir açıklama. Adım sorunlarında indeks,
+# adımın vardığı noktadır (i-1 -> i).
+PathIssue = namedtuple('PathIssue', ['kind', 'count', 'indices', 'cells', 'message'])
+
+# valid: hiç sorun yoksa True
+ValidationResult = namedtuple('ValidationResult', ['valid', 'issues'])
+
+ISSUE_KINDS = ("empty", "out_of_bounds", "collision", "discontinuity", "wait",
+               "corner_cut", "start_mismatch", "goal_mismatch")
+
+
+class InvalidPathError(ValueError):
+    """Geçersiz yol; issues alanı PathIssue listesidir"""
+
+    def __init__(self, issues):
+        self.issues = issues
+        super().__init__("; ".join(issue.message for issue in issues))
+
+
+def _issue(kind, indices, points, message, max_indices):
+    indices = np.asarray(indices, dtype=np.int64)
+    shown = indices[:max_indices]
+    return PathIssue(kind, int(indices.size), shown, points[shown], message)
+
+
+def validate_path(path, grid_size, obstacles=(), start=None, goal=None, connectivity=4,
+                  corner_cutting="never", allow_waits=True, cost_map=None, max_indices=100):
+    """Yolu doğrula, ValidationResult döndür (None ya da boş yol: "empty")
+
+    obstacles: engel hücreleri (küme/liste) ya da grid boyutunda boolean doluluk
+    grid'i. cost_map verilirse geçilemeyen (inf) hücreler de engel sayılır.
+    connectivity 4 ise yalnızca yatay/dikey birim adımlar, 8 ise çapraz adımlar
+    da geçerlidir; corner_cutting çapraz adımlar için connectivity modülündeki
+    kurallardır. allow_waits=False ise yerinde bekleme adımları da hatadır.
+    """
+    check_connectivity(connectivity, corner_cutting)
+    if path is None:
+        path = ()
+    points = path.array if isinstance(path, GridPath) else np.asarray(path)
+    points = points.astype(np.int64, copy=False).reshape(-1, 2)
+    if not len(points):
+        return ValidationResult(False, [PathIssue("empty", 1, np.zeros(0, dtype=np.int64),
+                                                  points, "Yol boş")])
+
+    if isinstance(obstacles, np.ndarray) and obstacles.dtype == bool:
+        blocked = obstacles
+    else:
+        blocked = occupancy_from_obstacles(grid_size, obstacles)
+    if cost_map is not None:
+        blocked = blocked | cost_map.impassable_mask()
+
+    issues = []
+    rows, cols = points[:, 0], points[:, 1]
+    inside = (rows >= 0) & (rows < grid_size[0]) & (cols >= 0) & (cols < grid_size[1])
+    if not inside.all():
+        outside = np.flatnonzero(~inside)
+        issues.append(_issue("out_of_bounds", outside, points,
+                             f"{outside.size} nokta grid dışında (ilk: {outside[0]})", max_indices))
+
+    hits = np.zeros(len(points), dtype=bool)
+    hits[inside] = blocked[rows[inside], cols[inside]]
+    if hits.any():
+        hit = np.flatnonzero(hits)
+        issues.append(_issue("collision", hit, points,
+                             f"{hit.size} nokta engel üzerinde (ilk: {hit[0]})", max_indices))
+
+    dy, dx = np.abs(np.diff(rows)), np.abs(np.diff(cols))
+    limit = dy + dx if connectivity == 4 else np.maximum(dy, dx)
+    jumps = np.flatnonzero(limit > 1) + 1
+    if jumps.size:
+        issues.append(_issue("discontinuity", jumps, points,
+                             f"{jumps.size} adım komşu olmayan hücreye atlıyor (ilk: {jumps[0]})",
+                             max_indices))
+    if not allow_waits:
+        waits = np.flatnonzero((dy == 0) & (dx == 0)) + 1
+        if waits.size:
+            issues.append(_issue("wait", waits, points,
+                                 f"{waits.size} adım yerinde bekliyor (ilk: {waits[0]})", max_indices))
+
+    if connectivity == 8 and corner_cutting != "always":
+        # Çapraz adımın köşe hücreleri: (y0, x1) ve (y1, x0); uçlar grid içindeyse köşeler de içerde
+        diagonal = np.flatnonzero((dy == 1) & (dx == 1) & inside[:-1] & inside[1:])
+        corner_a = blocked[rows[diagonal], cols[diagonal + 1]]
+        corner_b = blocked[rows[diagonal + 1], cols[diagonal]]
+        cut = corner_a | corner_b if corner_cutting == "never" else corner_a & corner_b
+        if cut.any():
+            cuts = diagonal[cut] + 1
+            issues.append(_issue("corner_cut", cuts, points,
+                                 f"{cuts.size} çapraz adım engel köşesini kesiyor (ilk: {cuts[0]})",
+                                 max_indices))
+
+    if start is not None and tuple(points[0]) != tuple(start):
+        issues.append(_issue("start_mismatch", [0], points,
+                             f"Yol {tuple(points[0].tolist())} ile başlıyor, beklenen {tuple(start)}",
+                             max_indices))
+    if goal is not None and tuple(points[-1]) != tuple(goal):
+        issues.append(_issue("goal_mismatch", [len(points) - 1], points,
+                             f"Yol {tuple(points[-1].tolist())} ile bitiyor, beklenen {tuple(goal)}",
+                             max_indices))
+    return ValidationResult(not issues, issues)
+
+
+def check_path(path, grid_size, obstacles=(), **kwargs):
+    """validate_path gibi; geçersiz yolda InvalidPathError fırlatır"""
+    result = validate_path(path, grid_size, obstacles, **kwargs)
+    if not result.valid:
+        raise InvalidPathError(result.issues)
+    return result
+
+
+def issues_to_dicts(issues):
+    """PathIssue listesini JSON'a yazılabilir sözlüklere çevir"""
+    return [{"kind": issue.kind, "count": issue.count,
+             "indices": issue.indices.tolist(), "cells": issue.cells.tolist(),
+             "message": issue.message} for issue in issues]
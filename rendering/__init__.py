@@ -0,0 +1,4 @@
+from .blit_renderer import SimulationRenderer
+from .export import ReplayState, export_replay
+
+__all__ = ['SimulationRenderer', 'ReplayState', 'export_replay']
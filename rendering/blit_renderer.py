@@ -0,0 +1,253 @@
+import time
+
+import numpy as np
+from matplotlib.colors import ListedColormap
+
+from .terrain import BASE_HEIGHT, MAX_SURFACE_CELLS, terrain_mesh
+
+# 2D görünüm renkleri: işlenmemiş toprak, işlenmiş toprak, engel
+COLORS_2D = ['#8B4513', '#654321', '#228B22']
+# 3D görünümde işlenmiş alanlar normal toprak gibi gösterilir
+COLORS_3D = ['#C19A6B', '#C19A6B', '#228B22']
+
+PATH_HEIGHT = BASE_HEIGHT + 0.04
+
+
+class SimulationRenderer:
+    """Blitting tabanlı simülasyon çizicisi
+
+    Tüm artist'ler bir kez oluşturulur; her karede sadece robot işaretçisi,
+    gidilen yol çizgisinin verisi ve değişen grid hücresi güncellenir.
+    Statik arka plan bir kez kaydedilir ve her karede geri yüklenir.
+    3D görünüm blitting ile güncellenemediği için her `view3d_interval`
+    karede bir tam çizimle yenilenir; zemin ağı tarla başına bir kez kurulur
+    ve büyük grid'lerde `terrain_max_cells` ile seyreltilir.
+    """
+
+    def __init__(self, robot, fig, ax2d, ax3d=None, view3d_interval=10,
+                 terrain_max_cells=MAX_SURFACE_CELLS):
+        self.robot = robot
+        self.fig = fig
+        self.canvas = fig.canvas
+        self.ax2d = ax2d
+        self.ax3d = ax3d
+        self.view3d_interval = view3d_interval
+        self.terrain_max_cells = terrain_max_cells
+        self.background = None
+        self.step_index = -1
+        # Motorun yol/engel değişiklik sayacının son görülen değeri
+        self.revision = 0
+        # Yol uzadığında statik artist'ler değişir, tam çizim gerekir
+        self._needs_full_draw = False
+
+        self.path = np.asarray(robot.path, dtype=np.int32).reshape(-1, 2)
+        self._setup_2d()
+        if ax3d is not None:
+            self._setup_3d()
+
+        # Görünüm değiştiğinde (yeniden boyutlandırma, 3D döndürme) arka planı yenile
+        self._draw_cid = self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    @property
+    def _animated_artists(self):
+        return [self.image, self.travelled_2d, self.robot_2d, self.title_2d]
+
+    def _setup_2d(self):
+        """2D artist'leri bir kez oluştur"""
+        ax = self.ax2d
+        self.display_grid = self.robot.grid.copy()
+        self.display_grid[self.display_grid == -1] = 2
+
+        self.image = ax.imshow(self.display_grid, cmap=ListedColormap(COLORS_2D),
+                               vmin=0, vmax=2, animated=True)
+
+        path_y, path_x = self.path[:, 0], self.path[:, 1]
+        goal_y, goal_x = self._last_point()
+        self.planned_2d, = ax.plot(path_x, path_y, 'white', alpha=0.3, linewidth=2,
+                                   label='Planlanan Yol')
+        self.travelled_2d, = ax.plot([], [], 'yellow', linewidth=3,
+                                     label='Gidilen Yol', animated=True)
+        self.robot_2d, = ax.plot([self.robot.position[1]], [self.robot.position[0]],
+                                 'ro', markersize=15, label='Robot',
+                                 markeredgecolor='white', animated=True)
+        self.target_2d, = ax.plot([goal_x], [goal_y], 'bo', markersize=15,
+                                  label='Hedef', markeredgecolor='white')
+
+        ax.grid(True, color='black', alpha=0.2)
+        ax.set_xlabel('X (metre)')
+        ax.set_ylabel('Y (metre)')
+        ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
+        self.title_2d = ax.set_title(self._title_2d(0))
+        self.title_2d.set_animated(True)
+
+    def _setup_3d(self):
+        """3D artist'leri bir kez oluştur"""
+        ax = self.ax3d
+        rows, cols = self.robot.grid_size
+        X, Y, Z = terrain_mesh(self.robot.grid, self.terrain_max_cells)
+
+        ax.plot_surface(X, Y, Z, cmap=ListedColormap(COLORS_3D),
+                        rstride=1, cstride=1, linewidth=0,
+                        antialiased=True, alpha=1.0)
+
+        path_y, path_x = self.path[:, 0], self.path[:, 1]
+        goal_y, goal_x = self._last_point()
+        self.planned_3d, = ax.plot(path_x, path_y, np.full(len(self.path), PATH_HEIGHT),
+                                   color='white', alpha=0.7, linewidth=3,
+                                   label='Planlanan Yol')
+        self.travelled_3d, = ax.plot([], [], [], color='#FFD700',
+                                     linewidth=4, label='Gidilen Yol')
+        self.robot_3d = ax.scatter([self.robot.position[1]], [self.robot.position[0]],
+                                   [PATH_HEIGHT], color='red', s=200, label='Robot',
+                                   edgecolor='white', linewidth=2)
+        self.target_3d = ax.scatter([goal_x], [goal_y], [PATH_HEIGHT], color='blue', s=200,
+                                    label='Hedef', edgecolor='white', linewidth=2)
+
+        ax.view_init(elev=30, azim=45)
+        ax.set_box_aspect([1, 1, 0.3])
+        ax.set_title('AgriEDGE Tarla Simülasyonu\n3D Arazi Görünümü', pad=20, fontsize=12)
+        ax.set_xticks([])
+        ax.set_yticks([])
+        ax.set_zticks([])
+        for axis in (ax.xaxis, ax.yaxis, ax.zaxis):
+            axis.pane.fill = False
+            axis.pane.set_edgecolor('none')
+        ax.set_facecolor('#F0F8FF')
+
+        margin = 2
+        ax.set_xlim(-margin, cols + margin)
+        ax.set_ylim(-margin, rows + margin)
+        ax.set_zlim(BASE_HEIGHT - 0.05, BASE_HEIGHT + 0.08)
+
+    def _last_point(self):
+        """Planlanan yolun son noktası (yol henüz boşsa robotun konumu)"""
+        if len(self.path):
+            return self.path[-1]
+        return self.robot.position
+
+    def extend_path(self, points):
+        """Akışlı planlamada yeni gelen yol parçasını ekle"""
+        points = np.asarray(points, dtype=np.int32).reshape(-1, 2)
+        if not len(points):
+            return
+        self.path = np.concatenate([self.path, points])
+        goal_y, goal_x = self.path[-1]
+
+        self.planned_2d.set_data(self.path[:, 1], self.path[:, 0])
+        self.target_2d.set_data([goal_x], [goal_y])
+        if self.ax3d is not None:
+            self.planned_3d.set_data_3d(self.path[:, 1], self.path[:, 0],
+                                        np.full(len(self.path), PATH_HEIGHT))
+            self.target_3d._offsets3d = ([goal_x], [goal_y], [PATH_HEIGHT])
+        self._needs_full_draw = True
+
+    def reload(self, engine):
+        """Yerel yeniden planlama ya da dinamik engel sonrası yolu ve engelleri yenile"""
+        _, path = engine.path_window(0, None)
+        self.path = np.asarray(path, dtype=np.int32).reshape(-1, 2)
+        obstacles = self.robot.grid == -1
+        # Kaybolan dinamik engeller işlenmemiş toprağa döner
+        self.display_grid[(self.display_grid == 2) & ~obstacles] = 0
+        self.display_grid[obstacles] = 2
+        self.image.set_data(self.display_grid)
+        self.revision = engine.revision
+        goal_y, goal_x = self._last_point()
+        self.planned_2d.set_data(self.path[:, 1], self.path[:, 0])
+        self.target_2d.set_data([goal_x], [goal_y])
+        if self.ax3d is not None:
+            self.planned_3d.set_data_3d(self.path[:, 1], self.path[:, 0],
+                                        np.full(len(self.path), PATH_HEIGHT))
+            self.target_3d._offsets3d = ([goal_x], [goal_y], [PATH_HEIGHT])
+        self._needs_full_draw = True
+
+    def _title_2d(self, step_index):
+        return (f'AgriEDGE Tarla Simülasyonu\n'
+                f'2D Görünüm - Adım {step_index+1}/{len(self.path)}')
+
+    def _on_draw(self, event):
+        """Tam çizimden sonra statik arka planı kaydet, dinamik artist'leri çiz"""
+        self.background = self.canvas.copy_from_bbox(self.fig.bbox)
+        for artist in self._animated_artists:
+            self.ax2d.draw_artist(artist)
+
+    def sync(self, step_index):
+        """Görüntüyü verilen adıma getir (çizim yapmadan)
+
+        Sadece renderer'ın kendi görüntü grid'i güncellenir; robot durumunu
+        simülasyon motoru ilerletir. Aradaki adımların hücreleri de işaretlenir.
+        """
+        for i in range(self.step_index + 1, step_index + 1):
+            pos = tuple(int(v) for v in self.path[i])
+            if self.display_grid[pos] != 2:
+                self.display_grid[pos] = 1
+        self.step_index = max(self.step_index, step_index)
+
+    def update_artists(self):
+        """Dinamik artist'lerin verisini mevcut adıma göre güncelle (çizmeden)"""
+        i = max(self.step_index, 0)
+        y, x = self.path[i]
+        self.image.set_data(self.display_grid)
+        self.robot_2d.set_data([x], [y])
+        self.travelled_2d.set_data(self.path[:i+1, 1], self.path[:i+1, 0])
+        self.title_2d.set_text(self._title_2d(i))
+
+        if self.ax3d is not None:
+            self.robot_3d._offsets3d = ([x], [y], [PATH_HEIGHT])
+            self.travelled_3d.set_data_3d(self.path[:i+1, 1], self.path[:i+1, 0],
+                                          np.full(i + 1, PATH_HEIGHT))
+
+    def draw_frame(self, full=False):
+        """Mevcut adımı çiz; full=True ise tüm figürü yeniden çiz"""
+        self.update_artists()
+
+        if (full or self._needs_full_draw or self.background is None
+                or not self.canvas.supports_blit):
+            self._needs_full_draw = False
+            # draw_event arka planı yeniler ve dinamik artist'leri çizer
+            self.canvas.draw()
+        else:
+            self.canvas.restore_region(self.background)
+            for artist in self._animated_artists:
+                self.ax2d.draw_artist(artist)
+            self.canvas.blit(self.fig.bbox)
+        self.canvas.flush_events()
+
+    def follow(self, engine, fps=30, should_stop=None):
+        """Simülasyon motorunun durumunu kendi kare hızında çiz
+
+        Motor robotu ayrı bir thread'de ilerletir; her karede son durum
+        çizilir. Çizim motorun gerisinde kalırsa ara adımlar çizilmeden
+        atlanır, böylece oynatma süresi artist maliyetiyle sınırlanmaz.
+        """
+        frame_time = 1.0 / fps
+        frame = 0
+
+        while True:
+            if should_stop is not None and should_stop():
+                break
+
+            frame_start = time.perf_counter()
+            snapshot = engine.snapshot()
+            # Yeniden planlamada yol değişmiş, akışlı planlamada uzamış olabilir
+            if snapshot.revision != self.revision:
+                self.reload(engine)
+            elif snapshot.path_length > len(self.path):
+                self.extend_path(engine.path[len(self.path):snapshot.path_length])
+
+            if snapshot.step_index >= 0:
+                self.sync(snapshot.step_index)
+                frame += 1
+                refresh_3d = self.ax3d is not None and frame % self.view3d_interval == 0
+                self.draw_frame(full=refresh_3d or snapshot.finished)
+            else:
+                # İlk yol parçası bekleniyor; pencere olaylarını işlemeye devam et
+                self.canvas.flush_events()
+            if snapshot.finished:
+                break
+
+            remaining = frame_time - (time.perf_counter() - frame_start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def close(self):
+        self.canvas.mpl_disconnect(self._draw_cid)
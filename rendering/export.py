@@ -0,0 +1,121 @@
+"""Simülasyonların ekransız video/GIF/PNG dışa aktarımı
+
+Figür doğrudan Agg tuvaliyle oluşturulur; pyplot ve etkileşimli bir pencere
+kullanılmaz, `pause` beklemesi yoktur. Kareler kodlayıcıya (ffmpeg /
+ImageMagick) boru üzerinden tek tek gönderilir, bellekte biriktirilmez.
+"""
+import os
+
+import numpy as np
+from matplotlib import animation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+from .blit_renderer import SimulationRenderer
+
+
+class ReplayState:
+    """Renderer'ın beklediği robot durumu (FarmRobot olmadan tekrar oynatma için)"""
+
+    def __init__(self, grid, path, position=None):
+        self.grid = np.array(grid, dtype=float)
+        self.grid_size = self.grid.shape
+        self.path = [tuple(pos) for pos in path]
+        self.position = position if position is not None else self.path[0]
+
+    @classmethod
+    def from_field(cls, field, path):
+        return cls(field.to_grid(), path)
+
+
+def _make_writer(output, fps):
+    """Çıktı uzantısına göre akışlı (streaming) bir kodlayıcı seç"""
+    ext = os.path.splitext(output)[1].lower()
+
+    if ext == ".mp4":
+        if not animation.writers.is_available("ffmpeg"):
+            raise RuntimeError("MP4 çıktısı için ffmpeg kurulu olmalı")
+        return animation.FFMpegWriter(fps=fps)
+
+    if ext == ".gif":
+        if animation.writers.is_available("ffmpeg"):
+            return animation.FFMpegWriter(fps=fps)
+        if animation.writers.is_available("imagemagick"):
+            return animation.ImageMagickWriter(fps=fps)
+        # Pillow tüm kareleri bellekte tutar; sadece son çare
+        print("Uyarı: ffmpeg/ImageMagick bulunamadı, GIF kareleri bellekte toplanacak")
+        return animation.PillowWriter(fps=fps)
+
+    if ext:
+        raise ValueError(f"Desteklenmeyen çıktı biçimi: {ext} (.mp4, .gif ya da dizin)")
+    return None  # Uzantısız çıktı: PNG dizisi
+
+
+def _frame_indices(n_steps, step):
+    """Her `step` adımda bir kare; son adım her zaman dahil"""
+    indices = list(range(0, n_steps, step))
+    if indices[-1] != n_steps - 1:
+        indices.append(n_steps - 1)
+    return indices
+
+
+def export_replay(state, output, fps=20, step=1, view="both", dpi=100,
+                  figsize=None, progress=None):
+    """Yolun tekrar oynatımını dosyaya yaz
+
+    state: FarmRobot ya da ReplayState (grid, grid_size, position, path)
+    output: .mp4, .gif ya da PNG dizisi için bir dizin yolu
+    step: her kaç yol adımında bir kare üretileceği
+    view: "both", "2d" ya da "3d"
+    progress: isteğe bağlı, (kare, toplam) ile çağrılan fonksiyon
+    """
+    if not state.path:
+        raise ValueError("Dışa aktarmak için önce bir yol planlanmalı")
+
+    if figsize is None:
+        figsize = (20, 10) if view == "both" else (10, 10)
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+
+    if view == "both":
+        ax2d = fig.add_subplot(1, 2, 1)
+        ax3d = fig.add_subplot(1, 2, 2, projection="3d")
+    elif view == "2d":
+        ax2d, ax3d = fig.add_subplot(1, 1, 1), None
+    elif view == "3d":
+        # Renderer 2D artist'leri her zaman kurar; görünmez bir eksende tutulur
+        ax2d = fig.add_axes([0, 0, 0, 0], visible=False)
+        ax3d = fig.add_subplot(1, 1, 1, projection="3d")
+    else:
+        raise ValueError(f"Geçersiz görünüm: {view}")
+
+    renderer = SimulationRenderer(state, fig, ax2d, ax3d)
+    if view != "3d":
+        fig.tight_layout()
+
+    indices = _frame_indices(len(renderer.path), step)
+    writer = _make_writer(output, fps)
+    if writer is None:
+        os.makedirs(output, exist_ok=True)
+
+    def frames():
+        for frame, i in enumerate(indices):
+            # Atlanan adımların hücreleri de işaretlenir
+            renderer.sync(i)
+            renderer.update_artists()
+            if progress is not None:
+                progress(frame + 1, len(indices))
+            yield frame
+
+    try:
+        if writer is None:
+            for frame in frames():
+                fig.savefig(os.path.join(output, f"frame_{frame:06d}.png"), dpi=dpi)
+        else:
+            with writer.saving(fig, output, dpi):
+                for _ in frames():
+                    writer.grab_frame()
+    finally:
+        renderer.close()
+
+    return len(indices)
@@ -0,0 +1,67 @@
+import math
+from collections import OrderedDict
+
+import numpy as np
+
+BASE_HEIGHT = 0.0
+OBSTACLE_HEIGHT = BASE_HEIGHT + 0.02
+
+# Otomatik ayrıntı seviyesinde yüzeyin bir kenarındaki en fazla hücre sayısı
+MAX_SURFACE_CELLS = 100
+
+# Son oluşturulan yüzey ağları (tarla başına bir kez hesaplanır)
+_mesh_cache = OrderedDict()
+_MESH_CACHE_SIZE = 8
+
+
+def lod_stride(grid_size, max_cells=MAX_SURFACE_CELLS):
+    """Yüzeyin bir kenarı max_cells'i geçmeyecek şekilde seyreltme adımı"""
+    if not max_cells:
+        return 1
+    return max(1, math.ceil(max(grid_size) / max_cells))
+
+
+def _block_max(mask, stride):
+    """Maskeyi stride x stride bloklara böl, blokta herhangi biri doluysa dolu say"""
+    rows, cols = mask.shape
+    pad_r = (-rows) % stride
+    pad_c = (-cols) % stride
+    mask = np.pad(mask, ((0, pad_r), (0, pad_c)))
+    blocks = mask.reshape(mask.shape[0] // stride, stride, mask.shape[1] // stride, stride)
+    return blocks.any(axis=(1, 3))
+
+
+def build_terrain_mesh(grid, max_cells=MAX_SURFACE_CELLS):
+    """Grid'den 3D zemin ağı (X, Y, Z) oluştur
+
+    Büyük grid'lerde ağ bloklara indirgenir; engeller kaybolmasın diye bir
+    blokta tek bir engel hücresi olsa bile blok engel olarak çizilir.
+    """
+    obstacles = np.asarray(grid) == -1
+    stride = lod_stride(obstacles.shape, max_cells)
+    if stride > 1:
+        obstacles = _block_max(obstacles, stride)
+
+    rows, cols = obstacles.shape
+    X, Y = np.meshgrid(np.arange(cols) * stride, np.arange(rows) * stride)
+    Z = np.where(obstacles, OBSTACLE_HEIGHT, BASE_HEIGHT)
+    return X, Y, Z
+
+
+def terrain_mesh(grid, max_cells=MAX_SURFACE_CELLS):
+    """build_terrain_mesh'in önbellekli sürümü
+
+    Zemin sadece engellere bağlı olduğundan (işlenmiş alanlar normal toprak
+    gibi gösterilir) anahtar engel maskesinden türetilir.
+    """
+    obstacles = np.asarray(grid) == -1
+    key = (obstacles.shape, hash(np.packbits(obstacles).tobytes()), max_cells)
+    if key in _mesh_cache:
+        _mesh_cache.move_to_end(key)
+        return _mesh_cache[key]
+
+    mesh = build_terrain_mesh(grid, max_cells)
+    _mesh_cache[key] = mesh
+    if len(_mesh_cache) > _MESH_CACHE_SIZE:
+        _mesh_cache.popitem(last=False)
+    return mesh
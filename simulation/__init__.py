@@ -0,0 +1,6 @@
+from .engine import SimulationEngine, SimulationSnapshot
+from .obstacles import ObstacleEvent, ObstacleInjector
+from .replanning import DynamicReplanner
+
+__all__ = ['SimulationEngine', 'SimulationSnapshot', 'ObstacleEvent', 'ObstacleInjector',
+           'DynamicReplanner']
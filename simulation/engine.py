@@ -0,0 +1,197 @@
+import threading
+import time
+from collections import namedtuple
+
+# Renderer'lara verilen salt okunur durum görüntüsü
+SimulationSnapshot = namedtuple(
+    'SimulationSnapshot',
+    ['step_index', 'position', 'sim_time', 'covered_cells', 'finished', 'path_length',
+     'revision']
+)
+
+
+class SimulationEngine:
+    """Sabit zaman adımlı simülasyon motoru
+
+    Robot durumunu (konum, işlenmiş hücreler) çizimden bağımsız olarak
+    ilerletir. Motor gerçek zamanlı, hızlandırılmış ya da olabildiğince
+    hızlı çalışabilir; renderer'lar kendi hızlarında `snapshot()` ile son
+    durumu okur ya da `subscribe` ile bildirim alır.
+    """
+
+    def __init__(self, robot, speed=10.0, dt=0.05, path_complete=True):
+        """
+        robot: path, grid ve position özniteliklerine sahip nesne (örn. FarmRobot)
+        speed: saniyede ilerlenen yol adımı (hücre/s)
+        dt: simülasyon zaman adımı (saniye)
+        path_complete: False ise yol akışlı olarak append_path ile gelir;
+            robot mevcut yolun sonuna ulaşınca yeni parçaları bekler
+        """
+        if path_complete and not robot.path:
+            raise ValueError("Simülasyon için önce bir yol planlanmalı")
+
+        self.robot = robot
+        self.path = [tuple(pos) for pos in robot.path]
+        self.speed = speed
+        self.dt = dt
+        self.path_complete = path_complete
+
+        self.sim_time = 0.0
+        self.step_index = -1
+        self.covered_cells = 0
+        self._progress = 0.0
+
+        self._lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._subscribers = []
+        # Her adımdan önce çağrılan kancalar (ör. dinamik engel algılama ve yeniden planlama)
+        self._step_hooks = []
+        # Yolun ilerisi ya da engeller değiştikçe artar; renderer'lar yeniden kurar
+        self.revision = 0
+
+        if self.path:
+            self._visit(0)
+
+    @property
+    def finished(self):
+        return self.path_complete and self.step_index >= len(self.path) - 1
+
+    @property
+    def waiting_for_path(self):
+        """Robot mevcut yolun sonunda ve planlama henüz bitmedi mi"""
+        return not self.path_complete and self.step_index >= len(self.path) - 1
+
+    def append_path(self, segment):
+        """Akışlı planlamadan gelen yol parçasını ekle (thread-safe)"""
+        with self._lock:
+            self.path.extend(tuple(pos) for pos in segment)
+            if self.step_index < 0 and self.path:
+                self._visit(0)
+
+    def splice_path(self, start, end, segment):
+        """path[start:end]'i segment ile değiştir (yalnızca henüz gidilmemiş kısım)
+
+        Yerel yeniden planlamada etkilenen yol parçasını değiştirmek için
+        kullanılır; robotun bulunduğu ya da geçtiği adımlara dokunulamaz.
+        """
+        with self._lock:
+            if start <= self.step_index:
+                raise ValueError(f"Gidilmiş adım değiştirilemez: {start} <= {self.step_index}")
+            self.path[start:end] = [tuple(pos) for pos in segment]
+            self.revision += 1
+
+    def path_window(self, start, stop):
+        """(step_index, path[start:stop] kopyası); tutarlı okuma için kilit altında"""
+        with self._lock:
+            return self.step_index, self.path[start:stop]
+
+    def mark_changed(self):
+        """Yol dışı bir değişikliği (ör. yeni engel) renderer'lara bildir"""
+        with self._lock:
+            self.revision += 1
+
+    def add_step_hook(self, hook):
+        """Her step başında (kilit dışında) hook(engine) çağır"""
+        self._step_hooks.append(hook)
+
+    def mark_path_complete(self):
+        """Planlamanın bittiğini bildir; robot yolun sonunda durur"""
+        with self._lock:
+            self.path_complete = True
+
+    def _visit(self, index):
+        """Robotu yolun verilen adımına taşı ve hücreyi işlenmiş olarak işaretle"""
+        pos = self.path[index]
+        self.robot.position = pos
+        if self.robot.grid[pos] == 0:
+            self.covered_cells += 1
+        if self.robot.grid[pos] != -1:
+            self.robot.grid[pos] = 1
+        self.step_index = index
+
+    def step(self):
+        """Simülasyonu bir zaman adımı (dt) ilerlet"""
+        for hook in self._step_hooks:
+            hook(self)
+        with self._lock:
+            if self.finished:
+                return False
+            available = len(self.path) - 1
+            if self.step_index < available:
+                self._progress += self.speed * self.dt
+                target = min(int(self._progress), available)
+                for index in range(self.step_index + 1, target + 1):
+                    self._visit(index)
+                # Yol parçası beklerken ilerleme birikmesin
+                self._progress = min(self._progress, float(available))
+            self.sim_time += self.dt
+        self._notify()
+        return True
+
+    def snapshot(self):
+        """Mevcut durumun tutarlı bir görüntüsünü döndür (thread-safe)"""
+        with self._lock:
+            return SimulationSnapshot(self.step_index, self.robot.position,
+                                      self.sim_time, self.covered_cells, self.finished,
+                                      len(self.path), self.revision)
+
+    def subscribe(self, callback, interval=0.0):
+        """Her `interval` saniyede (gerçek zaman) en fazla bir kez callback(snapshot) çağır
+
+        Callback motorun çalıştığı thread'de çağrılır; GUI nesnelerine doğrudan
+        dokunmamalıdır.
+        """
+        self._subscribers.append([callback, interval, 0.0])
+
+    def _notify(self, force=False):
+        if not self._subscribers:
+            return
+        now = time.perf_counter()
+        snapshot = None
+        for subscriber in self._subscribers:
+            callback, interval, last = subscriber
+            if force or now - last >= interval:
+                snapshot = snapshot or self.snapshot()
+                subscriber[2] = now
+                callback(snapshot)
+
+    def run(self, time_scale=1.0, max_time=None):
+        """Yol bitene kadar çalıştır
+
+        time_scale: 1.0 gerçek zaman, 10.0 on kat hızlı, None olabildiğince hızlı
+        max_time: isteğe bağlı simülasyon süresi sınırı (saniye)
+        """
+        start = time.perf_counter()
+        while not self._stop_event.is_set() and self.step():
+            if max_time is not None and self.sim_time >= max_time:
+                break
+            if time_scale:
+                delay = start + self.sim_time / time_scale - time.perf_counter()
+                if delay > 0:
+                    self._stop_event.wait(delay)
+            elif self.waiting_for_path:
+                # Olabildiğince hızlı modda yol parçası beklerken boşa dönme
+                self._stop_event.wait(self.dt)
+        self._notify(force=True)
+        return self.snapshot()
+
+    def start(self, time_scale=1.0, max_time=None):
+        """Motoru arka plan thread'inde çalıştır"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(target=self.run, args=(time_scale, max_time),
+                                        daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Arka plandaki motoru durdur ve bitmesini bekle"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    @property
+    def running(self):
+        return self._thread is not None and self._thread.is_alive()
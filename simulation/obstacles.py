@@ -0,0 +1,86 @@
+import random
+from collections import namedtuple
+
+# Dinamik engel olayı: görünme zamanı (simülasyon saniyesi), kapladığı hücreler,
+# kalma süresi (None: kalıcı, ör. park edilmiş ekipman) ve açıklama
+ObstacleEvent = namedtuple('ObstacleEvent', ['time', 'cells', 'duration', 'label'])
+
+
+class ObstacleInjector:
+    """Donanım olmadan dinamik engel denemek için simüle sensör
+
+    Planlanmış olaylar zamanı gelince tarlada belirir, ancak robot yalnızca
+    sensor_range (Chebyshev, hücre) içindeki engel hücrelerini algılar. poll
+    her çağrıda yeni algılanan ve kaybolan hücreleri bir kez bildirir; bu
+    arayüz gerçek sensör sürücüsüyle aynıdır (DynamicReplanner.report).
+    """
+
+    def __init__(self, events=(), sensor_range=4):
+        self.sensor_range = sensor_range
+        self.events = sorted(events, key=lambda event: event.time)
+        # Tarlada şu an bulunan (henüz algılanmamış olanlar dahil) engel hücreleri
+        self._active = {}
+        self._reported = set()
+        self._next = 0
+
+    def schedule(self, time, cells, duration=None, label="engel"):
+        """Yeni bir engel olayı ekle"""
+        event = ObstacleEvent(time, [tuple(cell) for cell in cells], duration, label)
+        self.events.append(event)
+        self.events.sort(key=lambda e: e.time)
+        return event
+
+    @classmethod
+    def along_path(cls, path, count=5, speed=10.0, lead_time=1.0, size=2,
+                   duration=(2.0, 8.0), permanent_ratio=0.2, sensor_range=4, seed=None):
+        """Yolun ilerisine, robot oraya varmadan lead_time saniye önce engel koy
+
+        Hayvan ya da insan gibi geçici engeller duration aralığında rastgele
+        süre kalır; permanent_ratio oranındakiler kalıcıdır (park edilmiş
+        ekipman). speed, simülasyon motorunun hızıdır (adım/s).
+        """
+        rng = random.Random(seed)
+        path = [tuple(cell) for cell in path]
+        injector = cls(sensor_range=sensor_range)
+        if len(path) < 3:
+            return injector
+        for index in sorted(rng.sample(range(2, len(path)), min(count, len(path) - 2))):
+            y, x = path[index]
+            cells = [(y + dy, x + dx) for dy in range(size) for dx in range(size)]
+            permanent = rng.random() < permanent_ratio
+            injector.schedule(
+                max(0.0, index / speed - lead_time), cells,
+                None if permanent else rng.uniform(*duration),
+                "ekipman" if permanent else "hayvan")
+        return injector
+
+    def poll(self, sim_time, position):
+        """(yeni algılanan hücreler, kaybolan hücreler) listeleri"""
+        while self._next < len(self.events) and self.events[self._next].time <= sim_time:
+            event = self.events[self._next]
+            until = None if event.duration is None else event.time + event.duration
+            for cell in event.cells:
+                self._active[cell] = until
+            self._next += 1
+
+        cleared = []
+        for cell, until in list(self._active.items()):
+            if until is not None and until <= sim_time:
+                del self._active[cell]
+                if cell in self._reported:
+                    self._reported.discard(cell)
+                    cleared.append(cell)
+
+        y, x = position
+        seen = []
+        for cell in self._active:
+            if (cell not in self._reported and
+                    max(abs(cell[0] - y), abs(cell[1] - x)) <= self.sensor_range):
+                self._reported.add(cell)
+                seen.append(cell)
+        return seen, cleared
+
+    @property
+    def pending(self):
+        """Henüz tarlada belirmemiş olay sayısı"""
+        return len(self.events) - self._next
@@ -0,0 +1,253 @@
+import heapq
+import math
+import time
+
+import numpy as np
+
+from planners.connectivity import grid_heuristic, grid_neighbors, step_length
+
+
+class _GridObstacles:
+    """grid_neighbors için üyelik testi: robot grid'inde -1 olan hücreler
+
+    Engel kümesi tutulmaz; grid artımlı güncellendiği için arama her zaman
+    güncel durumu görür.
+    """
+
+    def __init__(self, grid, box):
+        self.grid = grid
+        self.box = box
+
+    def __contains__(self, cell):
+        y0, x0, y1, x1 = self.box
+        y, x = cell
+        return not (y0 <= y <= y1 and x0 <= x <= x1) or self.grid.item(cell) == -1
+
+
+def local_astar(start, goal, grid, box, costs=None, scale=1, connectivity=4,
+                corner_cutting="never", deadline=None, max_expansions=None):
+    """box = (y0, x0, y1, x1) penceresiyle sınırlı A*; bulunamazsa ya da süre dolarsa None
+
+    costs verilirse scale en küçük hücre maliyeti olmalıdır (sezgisel kabul
+    edilebilir kalsın diye).
+    """
+    obstacles = _GridObstacles(grid, box)
+    diagonal = connectivity == 8
+    frontier = [(0, start)]
+    came_from = {start: None}
+    cost_so_far = {start: 0}
+    expanded = 0
+
+    while frontier:
+        current = heapq.heappop(frontier)[1]
+        if current == goal:
+            break
+        expanded += 1
+        if max_expansions is not None and expanded > max_expansions:
+            return None
+        if deadline is not None and expanded % 64 == 0 and time.perf_counter() >= deadline:
+            return None
+        for next_pos in grid_neighbors(current, grid.shape, obstacles, costs,
+                                       connectivity, corner_cutting):
+            step = step_length(current, next_pos) if diagonal else 1
+            if costs is not None:
+                step *= costs.item(next_pos)
+            new_cost = cost_so_far[current] + step
+            if next_pos not in cost_so_far or new_cost < cost_so_far[next_pos]:
+                cost_so_far[next_pos] = new_cost
+                heapq.heappush(frontier, (new_cost + scale * grid_heuristic(goal, next_pos, connectivity),
+                                          next_pos))
+                came_from[next_pos] = current
+
+    if goal not in came_from:
+        return None
+    path = [goal]
+    while path[-1] != start:
+        path.append(came_from[path[-1]])
+    path.reverse()
+    return path
+
+
+class DynamicReplanner:
+    """Çalışma anında dinamik engel algılama ve yerel yeniden planlama
+
+    Sensör (ya da ObstacleInjector) bildirdikçe robot grid'i artımlı
+    güncellenir. Her adımda yolun önündeki lookahead adım denetlenir; engel
+    düşen her parça için engelden önceki son boş noktadan engelden sonraki
+    ilk boş noktaya pencereyle sınırlı A* çalıştırılır ve yalnızca bu parça
+    değiştirilir. Olay başına süre latency_budget ile sınırlıdır: bütçede
+    sapma bulunamazsa robot engelin önünde bekler ve sonraki adımda yeniden
+    denenir. max_wait_steps adım beklendikten sonra sapma tüm grid'de aranır;
+    yine bulunamazsa yol engelin önünde kesilir.
+
+    Robotun özgün planı robot.path'te kalır; güncel yol engine.path'tir.
+    """
+
+    def __init__(self, robot, injector=None, latency_budget=0.05, lookahead=64,
+                 window=6, max_rejoin_attempts=4, max_wait_steps=40):
+        self.robot = robot
+        self.injector = injector
+        self.latency_budget = latency_budget
+        self.lookahead = lookahead
+        # Sapma araması, değiştirilen parçanın sınır kutusunun bu kadar hücre dışına taşabilir
+        self.window = window
+        self.max_rejoin_attempts = max_rejoin_attempts
+        self.max_wait_steps = max_wait_steps
+        self._waited = 0
+        self.stats = {"events": 0, "detected_cells": 0, "cleared_cells": 0,
+                      "replans": 0, "failed": 0, "waits": 0, "truncations": 0,
+                      "skipped_cells": 0, "latencies": []}
+
+    def attach(self, engine):
+        """Motorun her adımında algıla + onar"""
+        engine.add_step_hook(self.on_step)
+        return self
+
+    def on_step(self, engine):
+        if engine.finished:
+            return
+        if self.injector is not None:
+            snapshot = engine.snapshot()
+            seen, cleared = self.injector.poll(snapshot.sim_time, snapshot.position)
+            if seen or cleared:
+                self.report(seen, cleared)
+                engine.mark_changed()
+        if self.robot.dynamic_obstacles:
+            self.repair(engine)
+
+    def report(self, seen=(), cleared=()):
+        """Sensör bildirimi: yeni engel hücreleri ve kaybolan hücreler
+
+        Robotun bulunduğu hücre ve grid dışı hücreler yok sayılır.
+        """
+        rows, cols = self.robot.grid_size
+        position = tuple(self.robot.position)
+        seen = [tuple(c) for c in seen
+                if 0 <= c[0] < rows and 0 <= c[1] < cols and tuple(c) != position]
+        cleared = [tuple(c) for c in cleared if 0 <= c[0] < rows and 0 <= c[1] < cols]
+        self.stats["events"] += 1
+        self.stats["detected_cells"] += len(seen)
+        self.stats["cleared_cells"] += len(cleared)
+        self.robot.update_obstacles(seen, cleared)
+
+    def repair(self, engine):
+        """Yolun önündeki engelli parçaları onar; bu çağrının süresini döndür"""
+        began = time.perf_counter()
+        deadline = began + self.latency_budget
+        replanned = False
+        while time.perf_counter() < deadline:
+            index, ahead = engine.path_window(engine.step_index + 1,
+                                              engine.step_index + 1 + self.lookahead)
+            first = self._first_blocked(ahead)
+            if first is None:
+                break
+            replanned = True
+            if self._repair_run(engine, index + 1 + first, deadline) != "replanned":
+                break
+
+        elapsed = time.perf_counter() - began
+        if replanned:
+            self.stats["latencies"].append(elapsed)
+        return elapsed
+
+    def _first_blocked(self, cells):
+        """Hücre listesindeki ilk engelli hücrenin sırası (yoksa None)"""
+        if not cells:
+            return None
+        points = np.asarray(cells, dtype=np.intp)
+        blocked = np.flatnonzero(self.robot.grid[points[:, 0], points[:, 1]] == -1)
+        return int(blocked[0]) if blocked.size else None
+
+    def _rejoin_candidates(self, engine, first):
+        """first'ten sonraki engelli parçaların bitiminde yola yeniden katılma indeksleri"""
+        grid = self.robot.grid
+        rejoins = []
+        blocked = True
+        start = first
+        while len(rejoins) < self.max_rejoin_attempts:
+            _, chunk = engine.path_window(start, start + self.lookahead)
+            if not chunk:
+                break
+            for offset, cell in enumerate(chunk):
+                free = grid.item(cell) != -1
+                if free and blocked:
+                    rejoins.append(start + offset)
+                    if len(rejoins) == self.max_rejoin_attempts:
+                        break
+                blocked = not free
+            start += len(chunk)
+        return rejoins
+
+    def _repair_run(self, engine, first, deadline):
+        """path[first] engelliyse sapma bul; "replanned", "waiting" ya da "truncated" döndür"""
+        grid = self.robot.grid
+        entry = first - 1
+        rejoins = self._rejoin_candidates(engine, first)
+        step_index, entry_cell = engine.path_window(entry, first)
+        entry_cell = entry_cell[0]
+
+        if not rejoins:
+            # Yolun geri kalanı tamamen kapalı: yol girişte biter
+            engine.splice_path(first, None, [])
+            self.stats["truncations"] += 1
+            return "truncated"
+
+        cost_map = self.robot.cost_map
+        costs = None if cost_map is None else cost_map.costs
+        scale = 1 if cost_map is None else cost_map.min_cost
+        # Uzun beklemeden sonra engel kalıcı sayılır ve pencere tüm grid'e genişler
+        unbounded = self._waited >= self.max_wait_steps
+        for rejoin in rejoins:
+            if time.perf_counter() >= deadline:
+                break
+            _, segment = engine.path_window(entry, rejoin + 1)
+            cells = np.asarray(segment)
+            if unbounded:
+                y0, x0, (y1, x1) = 0, 0, np.subtract(self.robot.grid_size, 1)
+            else:
+                y0, x0 = cells.min(axis=0) - self.window
+                y1, x1 = cells.max(axis=0) + self.window
+            detour = local_astar(entry_cell, segment[-1], grid, (y0, x0, y1, x1), costs, scale,
+                                 self.robot.connectivity, self.robot.corner_cutting, deadline)
+            if detour is not None:
+                if len(detour) == 1:
+                    # Kapsama yolu engelden sonra giriş hücresine geri dönüyor:
+                    # aradaki döngü ve tekrarlanan giriş hücresi atlanır
+                    engine.splice_path(entry + 1, rejoin + 1, [])
+                else:
+                    engine.splice_path(entry + 1, rejoin, detour[1:-1])
+                self._waited = 0
+                self.stats["replans"] += 1
+                self.stats["skipped_cells"] += sum(1 for cell in segment[1:-1]
+                                                   if grid.item(cell) != -1)
+                return "replanned"
+
+        self.stats["failed"] += 1
+        # Motor bir adımda ceil(speed * dt) hücreye kadar ilerleyebilir
+        reach = max(1, math.ceil(engine.speed * engine.dt))
+        if first - step_index > reach:
+            # Robot bu adımda engele ulaşamaz; sonraki adımda yeniden denenir
+            return "waiting"
+        if unbounded and time.perf_counter() < deadline:
+            # Tüm grid'de de yol yok: robot engelin önünde durur
+            engine.splice_path(first, None, [])
+            self._waited = 0
+            self.stats["truncations"] += 1
+            return "truncated"
+        # Engel bu adımda ulaşılabilir: girişte bir adım bekle, sonraki adımda
+        # yeniden dene. Bekleme hücresi reach kez tekrarlanır; aksi halde hızlı
+        # motor bekleme hücresini geçip engele girerdi
+        engine.splice_path(first, first, [entry_cell] * reach)
+        self._waited += 1
+        self.stats["waits"] += 1
+        return "waiting"
+
+    def latency_summary(self):
+        """Yeniden planlama olaylarının süre özeti (saniye)"""
+        latencies = self.stats["latencies"]
+        if not latencies:
+            return {"count": 0, "max": 0.0, "mean": 0.0, "p95": 0.0}
+        values = np.asarray(latencies)
+        return {"count": len(values), "max": float(values.max()), "mean": float(values.mean()),
+                "p95": float(np.percentile(values, 95)), "budget": self.latency_budget}
+
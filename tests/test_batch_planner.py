@@ -0,0 +1,34 @@
+import numpy as np
+
+from batch_planner import plan_field
+from fields import open_field
+from path_planner_factory import PathPlannerFactory
+from planners.planner_type import PlannerType
+
+
+def test_plan_field_ignores_settings_left_on_other_planners():
+    field = open_field(30)
+    PathPlannerFactory.create_planner(PlannerType.ASTAR, field.grid_size).set_connectivity(8)
+    path, stats = plan_field(field, PlannerType.ASTAR)
+    steps = np.abs(np.diff(np.asarray(path), axis=0)).sum(axis=1)
+    assert (steps == 1).all()
+    assert stats["valid"]
+
+
+def test_plan_field_connectivity_is_explicit():
+    field = open_field(30)
+    path, stats = plan_field(field, PlannerType.ASTAR, connectivity=8)
+    assert len(path) == 30
+    assert stats["counters"]["expanded_nodes"] > 0
+
+
+def test_postprocess_shortcuts_avoid_impassable_costs():
+    from planners.cost_map import IMPASSABLE, CostMap
+
+    field = open_field(20)
+    cost_map = CostMap(field.grid_size)
+    cost_map.set_cells([(r, 10) for r in range(16)], IMPASSABLE)
+    path, stats = plan_field(field, PlannerType.ASTAR, goal=(0, 19), cost_map=cost_map,
+                             postprocess={"merge": False, "shortcut": True})
+    assert stats["valid"], stats["issues"]
+    assert all(cost_map.passable(cell) for cell in path)
@@ -0,0 +1,70 @@
+import numpy as np
+import pytest
+
+from planners.cost_map import IMPASSABLE, CostMap
+
+
+def fresh_digest(cost_map):
+    # Önbelleksiz karşılaştırma için aynı içerikle yeni katman
+    return CostMap.from_array(cost_map.costs, tile_size=cost_map.tile_size).fingerprint()
+
+
+def test_update_writes_in_place_and_bumps_version():
+    cost_map = CostMap((20, 20), tile_size=8)
+    costs = cost_map.costs
+    version = cost_map.version
+    cost_map.update(3, 4, np.full((2, 3), 5.0))
+    assert cost_map.costs is costs
+    assert (cost_map.costs[3:5, 4:7] == 5.0).all() and cost_map.costs.sum() == 400 + 6 * 4
+    assert cost_map.version > version
+
+
+def test_min_cost_follows_updates_in_every_tile():
+    cost_map = CostMap((20, 20), default=3.0, tile_size=8)
+    assert cost_map.min_cost == 3.0
+    cost_map[(17, 17)] = 0.5
+    assert cost_map.min_cost == 0.5
+    cost_map.set_cells([(17, 17)], IMPASSABLE)
+    assert cost_map.min_cost == 3.0
+    cost_map.update(0, 0, np.full((20, 20), 2.0))
+    assert cost_map.min_cost == 2.0
+    cost_map.scale_cells([(9, 9)], 0.25)
+    assert cost_map.min_cost == 0.5
+
+
+def test_fingerprint_tracks_content():
+    cost_map = CostMap((20, 20), tile_size=8)
+    initial = cost_map.fingerprint()
+    cost_map[(10, 10)] = 4.0
+    changed = cost_map.fingerprint()
+    assert changed != initial and changed == fresh_digest(cost_map)
+    cost_map[(10, 10)] = 1.0
+    assert cost_map.fingerprint() == initial
+    cost_map[2:5, 15:] = 7.0
+    assert cost_map.fingerprint() == fresh_digest(cost_map)
+
+
+@pytest.mark.parametrize("key", [(slice(None), 3), (slice(18, 2, -4), slice(None, None, 5)),
+                                 (-1, slice(-3, None)), (np.int64(4), 19)])
+def test_slice_assignment_invalidates_touched_tiles(key):
+    cost_map = CostMap((20, 20), default=2.0, tile_size=8)
+    cost_map.fingerprint()
+    cost_map[key] = 0.5
+    expected = np.full((20, 20), 2.0, dtype=np.float32)
+    expected[key] = 0.5
+    assert np.array_equal(cost_map.costs, expected)
+    assert cost_map.min_cost == 0.5
+    assert cost_map.fingerprint() == fresh_digest(cost_map)
+
+
+def test_rejects_unsupported_keys_and_values():
+    cost_map = CostMap((10, 10))
+    with pytest.raises(TypeError):
+        cost_map[[1, 2], [3, 4]] = 2.0
+    with pytest.raises(TypeError):
+        cost_map[np.zeros((10, 10), dtype=bool)] = 2.0
+    with pytest.raises(IndexError):
+        cost_map[(10, 0)] = 2.0
+    with pytest.raises(ValueError):
+        cost_map[0:2, 0] = -1.0
+    assert cost_map.version == 0
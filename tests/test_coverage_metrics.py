@@ -0,0 +1,43 @@
+import math
+
+import numpy as np
+
+from planners.coverage_metrics import count_turns, coverage_metrics, uncovered_mask
+
+
+def reference_working_distance(path):
+    seen = {tuple(path[0])}
+    working = 0.0
+    for prev, cell in zip(path, path[1:]):
+        if tuple(cell) not in seen:
+            working += math.dist(prev, cell)
+            seen.add(tuple(cell))
+    return working
+
+
+def test_first_visits_match_reference_on_revisiting_paths():
+    rng = np.random.default_rng(1)
+    free = np.ones((8, 8), dtype=bool)
+    for _ in range(20):
+        steps = rng.choice([(0, 1), (1, 0), (0, -1), (-1, 0)], size=200)
+        path = np.clip(np.cumsum(np.vstack([[(4, 4)], steps]), axis=0), 0, 7)
+        metrics = coverage_metrics(path, free)
+        assert math.isclose(metrics.working_distance, reference_working_distance(path.tolist()))
+        total = np.hypot(*np.diff(path, axis=0).T).sum()
+        assert math.isclose(metrics.working_distance + metrics.transit_distance, total)
+
+
+def test_counts_obstacles_and_out_of_bounds():
+    free = np.ones((3, 3), dtype=bool)
+    free[1, 1] = False
+    path = [(0, 0), (0, 1), (1, 1), (1, 2), (1, 3), (1, 2)]
+    metrics = coverage_metrics(path, free)
+    assert metrics.covered_cells == 3
+    assert metrics.obstacle_visits == 1
+    assert metrics.out_of_bounds == 1
+    assert metrics.revisited_cells == 1
+    assert uncovered_mask(path, free).sum() == free.sum() - 3
+
+
+def test_turns_skip_waits():
+    assert count_turns([(0, 0), (0, 1), (0, 1), (0, 2), (1, 2)]) == 1
@@ -0,0 +1,27 @@
+import pytest
+
+from fields import builtin_fields, maze_field, random_field
+from planners.coverage_metrics import coverage_metrics
+from planners.coverage_planner import HeadlandCoveragePlanner
+from planners.distance import geodesic_distance
+from planners.validation import validate_path
+
+FIELDS = builtin_fields() + [random_field(30, 0.15, seed=5), maze_field(21, seed=1)]
+
+
+@pytest.mark.parametrize("field", FIELDS, ids=lambda field: field.name)
+def test_headland_covers_every_reachable_cell(field):
+    rows, cols = field.grid_size
+    start, goal = (0, 0), (rows - 1, cols - 1)
+    obstacles = set(field.obstacles) - {start, goal}
+    free = ~field.occupancy()
+    free[start] = free[goal] = True
+    reachable = geodesic_distance(free, start) >= 0
+
+    path = HeadlandCoveragePlanner(field.grid_size).plan_path(start, goal, obstacles)
+    metrics = coverage_metrics(path, reachable)
+    assert metrics.coverage_ratio == 1.0
+    assert metrics.obstacle_visits == 0
+    assert validate_path(path, field.grid_size, obstacles, start=start,
+                         goal=goal if reachable[goal] else None).valid
+
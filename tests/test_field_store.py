@@ -0,0 +1,99 @@
+import numpy as np
+import pytest
+
+from field_store import COVERED, OBSTACLE, TiledFieldStore
+
+
+def test_overview_stride_larger_than_tile(tmp_path):
+    store = TiledFieldStore.create(str(tmp_path / "f.npy"), (1000, 1000), tile_size=64)
+    store[(5, 5)] = OBSTACLE
+    store.write_window(600, 600, np.full((256, 256), COVERED, dtype=np.int8))
+    view, stride = store.overview(max_cells=10)
+    assert stride % 64 == 0 and stride >= 100
+    assert max(view.shape) <= 10
+    assert view[0, 0] == OBSTACLE
+    assert view[600 // stride + 1, 600 // stride + 1] == COVERED
+    store.close()
+
+
+def test_overview_matches_grid_within_tile(tmp_path):
+    grid = np.zeros((40, 40), dtype=np.int8)
+    grid[:20, :20] = COVERED
+    grid[30, 30] = OBSTACLE
+    store = TiledFieldStore.from_grid(str(tmp_path / "f.npy"), grid, tile_size=16)
+    view, stride = store.overview(max_cells=10)
+    assert stride == 4
+    assert view.shape == (10, 10)
+    assert (view[:5, :5] == COVERED).all()
+    assert view[30 // 4, 30 // 4] == OBSTACLE
+    store.close()
+
+
+def test_lru_evicts_and_writes_back_dirty_tiles(tmp_path):
+    path = str(tmp_path / "f.npy")
+    store = TiledFieldStore.create(path, (64, 64), tile_size=16, cache_tiles=2)
+    store[(0, 0)] = COVERED
+    store[(0, 20)] = COVERED
+    assert store.writebacks == 0
+    store[(0, 40)] = COVERED
+    assert store.writebacks == 1
+    assert len(store._cache) == 2
+    # İlk karo diske yazıldı; yeniden okununca değer korunur
+    assert store[(0, 0)] == COVERED
+    store.close()
+
+    reopened = TiledFieldStore(path, mode="r")
+    assert [reopened[(0, x)] for x in (0, 20, 40)] == [COVERED] * 3
+    reopened.close()
+
+
+def test_cache_hits_do_not_reload(tmp_path):
+    store = TiledFieldStore.create(str(tmp_path / "f.npy"), (32, 32), tile_size=16)
+    store.tile(0, 0)
+    store.tile(0, 0)
+    assert (store.hits, store.misses) == (1, 1)
+    store.close()
+
+
+def test_readonly_store_rejects_writes_without_touching_cache(tmp_path):
+    path = str(tmp_path / "f.npy")
+    TiledFieldStore.create(path, (32, 32), tile_size=16).close()
+    store = TiledFieldStore(path, mode="r")
+    store.tile(0, 0)
+    for write in (lambda: store.__setitem__((1, 1), COVERED),
+                  lambda: store.write_window(0, 0, np.ones((4, 4))),
+                  lambda: store.mark_covered([(2, 2)]),
+                  lambda: store.set_obstacles([(3, 3)])):
+        with pytest.raises(ValueError):
+            write()
+    assert not store.window(0, 32, 0, 32).any()
+    store.close()
+
+
+@pytest.mark.parametrize("origin", [(-1, 0), (0, 30), (28, 28)])
+def test_set_obstacles_mask_is_bounds_checked(tmp_path, origin):
+    store = TiledFieldStore.create(str(tmp_path / "f.npy"), (32, 32), tile_size=16)
+    with pytest.raises(IndexError):
+        store.set_obstacles(np.ones((5, 5), dtype=bool), origin=origin)
+    assert not store.window(0, 32, 0, 32).any()
+    store.set_obstacles(np.ones((4, 4), dtype=bool), origin=(28, 28))
+    assert store.counts()["obstacle"] == 16
+    store.close()
+
+
+def test_write_window_is_bounds_checked(tmp_path):
+    store = TiledFieldStore.create(str(tmp_path / "f.npy"), (20, 20), tile_size=16)
+    with pytest.raises(IndexError):
+        store.write_window(18, 0, np.ones((4, 4)))
+    store.close()
+
+
+def test_mark_covered_only_dirties_changed_tiles(tmp_path):
+    store = TiledFieldStore.create(str(tmp_path / "f.npy"), (32, 32), tile_size=16)
+    store.set_obstacles([(0, 0), (20, 20)])
+    store.flush()
+    assert store.mark_covered([(0, 0), (20, 20)]) == 0
+    assert not store._dirty
+    assert store.mark_covered([(0, 0), (1, 1), (20, 20)]) == 1
+    assert store._dirty == {(0, 0)}
+    store.close()
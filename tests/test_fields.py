@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from fields import Field, field_from_dict, rasterize_polygons
+
+# Dış kare ve ters yönde iç kare tek köşe listesinde; çift-tek kuralıyla iç kare delik olur.
+# (0, 0) -> (3, 3) köprüsü iki kez geçildiği için alanı etkilemez.
+OUTER = [(0, 0), (0, 10), (10, 10), (10, 0), (0, 0)]
+INNER = [(3, 3), (7, 3), (7, 7), (3, 7), (3, 3)]
+
+
+def ring_mask(shape=(14, 14)):
+    mask = np.zeros(shape, dtype=bool)
+    mask[0:11, 0:11] = True
+    mask[4:7, 4:7] = False
+    return mask
+
+
+def test_polygon_with_hole_matches_known_mask():
+    mask = rasterize_polygons((14, 14), [OUTER + INNER])
+    assert np.array_equal(mask, ring_mask())
+
+
+def test_rasterization_is_independent_of_block_size():
+    polygons = [OUTER + INNER, [(2, 11.5), (13, 12.5), (8, 13)]]
+    full = rasterize_polygons((14, 14), polygons)
+    assert np.array_equal(full, rasterize_polygons((14, 14), polygons, max_block=7))
+
+
+def test_polygon_outside_grid_is_clipped():
+    mask = rasterize_polygons((5, 5), [[(-3, -3), (-3, 2), (2, 2), (2, -3)]])
+    expected = np.zeros((5, 5), dtype=bool)
+    expected[0:3, 0:3] = True
+    assert np.array_equal(mask, expected)
+    with pytest.raises(ValueError):
+        rasterize_polygons((5, 5), [[(0, 0), (1, 1)]])
+
+
+def test_from_mask_round_trips():
+    mask = ring_mask()
+    field = Field.from_mask("halka", mask)
+    assert field.grid_size == mask.shape
+    assert len(field.obstacles) == mask.sum()
+    assert np.array_equal(field.occupancy(), mask)
+    assert np.array_equal(field.to_grid() == -1, mask)
+
+
+def test_field_from_dict_combines_polygons_and_cells():
+    field = field_from_dict({"name": "t", "grid_size": [14, 14],
+                             "obstacles": [[13, 13]], "polygons": [OUTER + INNER]})
+    expected = ring_mask()
+    expected[13, 13] = True
+    assert np.array_equal(field.occupancy(), expected)
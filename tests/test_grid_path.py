@@ -0,0 +1,36 @@
+import numpy as np
+import pytest
+
+from planners.grid_path import GridPath
+
+
+def roundtrip(path):
+    return GridPath.from_bytes(path.to_bytes())
+
+
+def test_unit_step_path_uses_int8_deltas():
+    rng = np.random.default_rng(0)
+    steps = rng.choice([(0, 1), (1, 0), (0, -1), (-1, 0), (0, 0)], size=500)
+    path = GridPath(np.cumsum(np.vstack([[(300, 300)], steps]), axis=0))
+    assert path.to_runs().deltas.dtype == np.int8
+    assert roundtrip(path) == path
+    assert GridPath.from_runs(path.to_runs()) == path
+
+
+def test_long_jumps_use_int16_deltas():
+    path = GridPath([(0, 0), (0, 200), (-150, 200), (-150, 200), (1000, -3000)])
+    assert path.to_runs().deltas.dtype == np.int16
+    assert roundtrip(path).tolist() == path.tolist()
+
+
+@pytest.mark.parametrize("points", [[], [(7, 9)]])
+def test_empty_and_single_point(points):
+    path = GridPath(points)
+    restored = roundtrip(path)
+    assert len(restored) == len(points)
+    assert restored.tolist() == [tuple(p) for p in points]
+
+
+def test_rejects_foreign_data():
+    with pytest.raises(ValueError):
+        GridPath.from_bytes(b"\0" * 64)
@@ -0,0 +1,66 @@
+import math
+
+import numpy as np
+import pytest
+
+from planners.dubins import dubins_path, sample_dubins
+from planners.hybrid_astar_planner import HybridAStarPlanner, heuristic_table
+
+WALL = {(r, 15) for r in range(0, 22)}
+
+
+def end_cell(poses):
+    return tuple(int(v) for v in np.rint(poses[-1][:2]))
+
+
+def test_reaches_goal_with_requested_heading():
+    planner = HybridAStarPlanner((30, 30))
+    poses = planner.plan_poses((5, 5), (20, 24), set(), start_heading=0.0, goal_heading=math.pi / 2)
+    assert end_cell(poses) == (20, 24)
+    assert abs((poses[-1][2] - math.pi / 2 + math.pi) % (2 * math.pi) - math.pi) < 0.1
+
+
+def test_path_keeps_clear_of_obstacles():
+    planner = HybridAStarPlanner((30, 30))
+    start, goal = (5, 5), (5, 25)
+    path = planner.plan_path(start, goal, WALL)
+    assert path[0] == start and path[-1] == goal
+    assert planner.validate(path, start, goal, WALL).valid
+
+
+def test_obstacles_added_in_place_are_respected():
+    planner = HybridAStarPlanner((30, 30))
+    obstacles = set()
+    assert planner.plan_path((5, 5), (5, 25), obstacles)
+    obstacles.update(WALL)
+    path = planner.plan_path((5, 5), (5, 25), obstacles)
+    assert path and not obstacles & set(path)
+    assert planner.validate(path, (5, 5), (5, 25), obstacles).valid
+
+
+def test_unreachable_goal_returns_empty():
+    walled = {(r, 15) for r in range(30)}
+    assert HybridAStarPlanner((30, 30)).plan_path((5, 5), (5, 25), walled) == []
+
+
+@pytest.mark.parametrize("goal", [(10.0, 0.0, 0.0), (0.0, 8.0, math.pi), (-6.0, 3.0, -math.pi / 2)])
+def test_dubins_samples_end_at_goal(goal):
+    radius = 3.0
+    path = dubins_path((0.0, 0.0, 0.0), goal, radius)
+    poses = sample_dubins((0.0, 0.0, 0.0), path, radius)
+    assert np.allclose(poses[-1, :2], goal[:2], atol=1e-6)
+    assert path.length >= math.hypot(goal[0], goal[1]) - 1e-9
+    steps = np.hypot(*np.diff(np.vstack([[0.0, 0.0], poses[:, :2]]), axis=0).T)
+    assert steps.sum() == pytest.approx(path.length, rel=0.02)
+
+
+def test_heuristic_table_is_dubins_length():
+    window, bins = 8, 36
+    table = heuristic_table(3.0, bins, False, window)
+    assert table.shape == (2 * window + 1, 2 * window + 1, bins)
+    # Düz ileri hedef: Dubins mesafesi düz uzaklıktır
+    assert table[window, window + 5, 0] == pytest.approx(5.0, abs=1e-4)
+    offsets = np.arange(-window, window + 1)
+    euclid = np.hypot(*np.meshgrid(offsets, offsets, indexing="ij"))
+    assert (table >= euclid[..., None] - 1e-4).all()
+    assert heuristic_table(3.0, bins, False, window) is table
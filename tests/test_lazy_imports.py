@@ -0,0 +1,24 @@
+import os
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _loaded_after(statement, module):
+    code = f"import sys; {statement}; print({module!r} in sys.modules)"
+    result = subprocess.run([sys.executable, "-c", code], cwd=ROOT,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip() == "True"
+
+
+def test_factory_import_does_not_load_numpy():
+    assert not _loaded_after("import path_planner_factory", "numpy")
+
+
+def test_planners_package_import_does_not_load_numpy():
+    assert not _loaded_after("import planners; planners.PlannerType", "numpy")
+
+
+def test_lazy_export_loads_on_access():
+    assert _loaded_after("import planners; planners.CostMap", "numpy")
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+from fields import builtin_fields, open_field
+from multi_robot import NO_REGION, default_starts, find_conflicts, partition_field, route_robots
+from planners.distance import geodesic_distance
+
+FIELDS = [open_field(30)] + builtin_fields()
+
+
+@pytest.mark.parametrize("robots", [2, 3, 4])
+@pytest.mark.parametrize("field", FIELDS, ids=lambda field: field.name)
+def test_partition_assigns_every_free_cell_once_and_balanced(field, robots):
+    occupancy = field.occupancy()
+    starts = default_starts(occupancy, robots)
+    labels = partition_field(occupancy, starts)
+    free = ~occupancy
+    reachable = geodesic_distance(free, starts[0]) >= 0
+
+    # Etiket grid'i her hücreye tek bir robot verir; erişilebilir her boş hücre atanmış olmalı
+    assert (labels[occupancy] == NO_REGION).all()
+    assert (labels[reachable] >= 0).all()
+    sizes = np.bincount(labels[labels >= 0], minlength=robots)
+    assert sizes.sum() == reachable.sum()
+    assert sizes.min() > 0
+    assert np.abs(sizes - reachable.sum() / robots).max() / (reachable.sum() / robots) <= 0.1
+
+    for robot, start in enumerate(starts):
+        region = labels == robot
+        assert region[start]
+        # Bölge başlangıcından bağlantılı
+        assert (geodesic_distance(region, start)[region] >= 0).all()
+
+
+def test_find_conflicts_detects_vertex_and_swap():
+    vertex = find_conflicts([[(0, 0), (0, 1)], [(0, 2), (0, 1)]])
+    assert vertex["vertex"] == [{"time": 1, "cell": [0, 1], "robots": [0, 1]}]
+    assert not vertex["edge"]
+
+    swap = find_conflicts([[(0, 0), (0, 1)], [(0, 1), (0, 0)]])
+    assert not swap["vertex"]
+    assert swap["edge"] == [{"time": 0, "robots": [0, 1], "cells": [[0, 0], [0, 1]]}]
+
+    # Yolunu bitiren robot son hücresinde bekler
+    waiting = find_conflicts([[(1, 1)], [(0, 1), (1, 1)]])
+    assert waiting["vertex"][0]["cell"] == [1, 1]
+    assert find_conflicts([[(0, 0), (0, 1)], [(1, 0), (1, 1)]]) == {
+        "vertex": [], "edge": [], "shared_cells": 0}
+
+
+@pytest.mark.parametrize("method", ["cbs", "prioritized"])
+def test_route_robots_resolves_swap_and_crossing(method):
+    field = open_field(7)
+    # İki robot yer değiştiriyor, ikisi kesişen yollarda
+    starts = [(3, 0), (3, 6), (0, 3), (6, 3)]
+    goals = [(3, 6), (3, 0), (6, 3), (0, 3)]
+    naive = [[(3, c) for c in range(7)], [(3, c) for c in range(6, -1, -1)]]
+    assert find_conflicts(naive)["vertex"] or find_conflicts(naive)["edge"]
+
+    plan = route_robots(field, starts, goals, method=method)
+    assert plan.stats["routed"] == 4
+    assert not plan.conflicts["vertex"] and not plan.conflicts["edge"]
+    for path, start, goal in zip(plan.paths, starts, goals):
+        assert path[0] == start and path[-1] == goal
@@ -0,0 +1,61 @@
+import numpy as np
+
+from path_planner_factory import PathPlannerFactory
+from planners.cost_map import CostMap
+from planners.planner_type import PlannerType
+
+
+def test_configuration_is_not_shared_between_callers():
+    first = PathPlannerFactory.create_planner(PlannerType.ASTAR, (30, 30))
+    first.set_connectivity(8)
+    first.set_cost_map(CostMap((30, 30), default=2.0))
+    first.enable_instrumentation()
+    first.progress_callback = print
+
+    second = PathPlannerFactory.create_planner(PlannerType.ASTAR, (30, 30))
+    assert second is not first
+    assert second.connectivity == 4
+    assert second.cost_map is None
+    assert not second.stats.enabled
+    assert second.progress_callback is None
+
+
+def test_fresh_planner_after_diagonal_configuration_stays_orthogonal():
+    PathPlannerFactory.create_planner(PlannerType.ASTAR, (30, 30)).set_connectivity(8)
+    path = PathPlannerFactory.create_planner(PlannerType.ASTAR, (30, 30)).plan_path(
+        (0, 0), (29, 29), set())
+    steps = np.abs(np.diff(np.asarray(path), axis=0)).sum(axis=1)
+    assert (steps == 1).all()
+
+
+def test_adaptive_spawn_shares_memory_but_not_settings(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    PathPlannerFactory.clear_cache()
+    first = PathPlannerFactory.create_planner(PlannerType.ADAPTIVE, (10, 10))
+    first.set_connectivity(8)
+    second = PathPlannerFactory.create_planner(PlannerType.ADAPTIVE, (10, 10))
+    assert second.connectivity == 4
+    assert second.path_memory is first.path_memory
+    PathPlannerFactory.clear_cache()
+
+
+def test_concurrent_adaptive_planners_keep_every_learned_route(tmp_path, monkeypatch):
+    import threading
+
+    from fields import builtin_fields
+    from planners.adaptive_planner import AdaptivePathPlanner
+
+    monkeypatch.chdir(tmp_path)
+    PathPlannerFactory.clear_cache()
+    fields = builtin_fields()
+    planners = [PathPlannerFactory.create_planner(PlannerType.ADAPTIVE, (30, 30)) for _ in fields]
+    threads = [threading.Thread(target=planner.plan_path, args=((0, 0), (29, 29), set(field.obstacles)))
+               for planner, field in zip(planners, fields)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    PathPlannerFactory.clear_cache()
+
+    saved = AdaptivePathPlanner((30, 30))
+    assert {saved._get_path_key(set(field.obstacles)) for field in fields} <= set(saved.path_memory)
@@ -0,0 +1,72 @@
+import numpy as np
+import pytest
+
+from fields import random_field
+from planners.astar_planner import AStarPlanner
+from planners.coverage_planner import HeadlandCoveragePlanner
+from planners.grid_path import GridPath
+from planners.postprocess import (densify_path, line_cells, merge_turns, occupancy_from_obstacles,
+                                  path_length, postprocess_path, shortcut_path, waypoints)
+from planners.validation import validate_path
+
+
+def staircase(n):
+    path = [(0, 0)]
+    for i in range(n):
+        path.append((i, i + 1))
+        path.append((i + 1, i + 1))
+    return path
+
+
+def test_line_cells_are_four_connected():
+    cells = line_cells((3, 2), (-4, 11))
+    assert tuple(cells[0]) == (3, 2) and tuple(cells[-1]) == (-4, 11)
+    assert (np.abs(np.diff(cells, axis=0)).sum(axis=1) == 1).all()
+
+
+def test_merge_turns_reduces_turns_and_keeps_endpoints():
+    path = staircase(6)
+    occupancy = np.zeros((8, 8), dtype=bool)
+    merged = merge_turns(path, occupancy, preserve_coverage=False)
+    assert merged[0] == path[0] and merged[-1] == path[-1]
+    assert len(merged) == len(path)
+    assert GridPath(merged).turn_count() < GridPath(path).turn_count()
+    assert validate_path(merged, (8, 8), occupancy).valid
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_shortcut_is_collision_free_and_not_longer(seed):
+    field = random_field(30, 0.2, seed=seed)
+    occupancy = occupancy_from_obstacles(field.grid_size, field.obstacles)
+    start, goal = (0, 0), (29, 29)
+    occupancy[start] = occupancy[goal] = False
+    path = AStarPlanner(field.grid_size).plan_path(start, goal, set(field.obstacles) - {start, goal})
+    if not path:
+        pytest.skip("hedef erişilemez")
+    shortcut = shortcut_path(path, occupancy)
+    assert len(shortcut) <= len(waypoints(path))
+    assert path_length(shortcut) <= path_length(path)
+    dense = densify_path(shortcut)
+    assert validate_path(dense, field.grid_size, occupancy, start=start, goal=goal).valid
+
+
+def test_postprocess_preserves_coverage_cells():
+    field = random_field(20, 0.1, seed=4)
+    occupancy = occupancy_from_obstacles(field.grid_size, field.obstacles)
+    path = HeadlandCoveragePlanner(field.grid_size).plan_path((0, 0), (19, 19), set(field.obstacles))
+    result = postprocess_path(path, occupancy)
+    assert set(result.path) >= set(map(tuple, path))
+    assert validate_path(result.path, field.grid_size, occupancy).valid
+    assert GridPath(result.path).turn_count() <= GridPath(path).turn_count()
+
+
+def test_shortcut_keeps_unverified_diagonal_steps():
+    # 8-komşulu yol köşe kesen çapraz adım içeriyor: kısayol ve dolgu engele girmemeli
+    occupancy = occupancy_from_obstacles((3, 3), {(0, 1), (1, 0)})
+    path = [(0, 0), (1, 1), (2, 2)]
+    points = shortcut_path(path, occupancy)
+    assert points[:2] == [(0, 0), (1, 1)]
+    dense = densify_path(points, connectivity=8)
+    assert not occupancy[tuple(np.asarray(dense).T)].any()
+    result = postprocess_path(path, occupancy, shortcut=True, merge=False, connectivity=8)
+    assert not occupancy[tuple(np.asarray(result.path).T)].any()
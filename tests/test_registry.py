@@ -0,0 +1,54 @@
+from importlib import metadata
+
+import pytest
+
+from planners import registry
+from planners.astar_planner import AStarPlanner
+from planners.planner_type import PlannerType
+
+
+class PluginAStar(AStarPlanner):
+    pass
+
+
+class DecoratedAStar(AStarPlanner):
+    pass
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    """registry'yi temiz duruma al ve entry point olarak verilen eklentileri tanıt"""
+    monkeypatch.setattr(registry, "_registry", dict(registry._BUILTIN_PLANNERS))
+    monkeypatch.setattr(registry, "_entry_points_loaded", False)
+    installed = []
+    monkeypatch.setattr(metadata, "entry_points", lambda group: list(installed))
+
+    def install(name, target):
+        installed.append(metadata.EntryPoint(name, f"{__name__}:{target.__name__}",
+                                             registry.ENTRY_POINT_GROUP))
+    return install
+
+
+def test_entry_point_can_add_a_new_planner(plugins):
+    plugins("ORTAK_KAPSAMA", PluginAStar)
+    assert "ORTAK_KAPSAMA" in registry.registered_planners()
+    assert registry.get_planner_class("ORTAK_KAPSAMA") is PluginAStar
+
+
+def test_entry_point_can_replace_a_builtin(plugins):
+    plugins("ASTAR", PluginAStar)
+    assert registry.get_planner_class(PlannerType.ASTAR) is PluginAStar
+
+
+def test_decorator_wins_over_entry_point(plugins):
+    plugins("ASTAR", PluginAStar)
+    plugins("YENI", PluginAStar)
+    registry.register_planner(PlannerType.ASTAR)(DecoratedAStar)
+    registry.register_planner("YENI")(DecoratedAStar)
+    assert registry.get_planner_class(PlannerType.ASTAR) is DecoratedAStar
+    assert registry.get_planner_class("YENI") is DecoratedAStar
+
+
+def test_unknown_planner_raises(plugins):
+    with pytest.raises(ValueError):
+        registry.get_planner_class("YOK")
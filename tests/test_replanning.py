@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from fields import BUILTIN_FIELDS, open_field
+from planners.coverage_planner import HeadlandCoveragePlanner
+from simulation import DynamicReplanner, ObstacleInjector, SimulationEngine
+
+
+class GridRobot:
+    """SimulationEngine ve DynamicReplanner'ın kullandığı FarmRobot arayüzü (PyQt5'siz)"""
+
+    cost_map = None
+    connectivity = 4
+    corner_cutting = "never"
+
+    def __init__(self, grid_size, obstacles, path):
+        self.grid_size = grid_size
+        self.grid = np.zeros(grid_size)
+        for cell in obstacles:
+            self.grid[cell] = -1
+        self.position = path[0]
+        self.path = list(path)
+        self.dynamic_obstacles = {}
+
+    def update_obstacles(self, added=(), cleared=()):
+        for cell in added:
+            if self.grid[cell] != -1:
+                self.dynamic_obstacles[cell] = self.grid[cell]
+                self.grid[cell] = -1
+        for cell in cleared:
+            if cell in self.dynamic_obstacles:
+                self.grid[cell] = self.dynamic_obstacles.pop(cell)
+
+
+def headland_robot(obstacles, grid_size=(30, 30)):
+    path = HeadlandCoveragePlanner(grid_size).plan_path((0, 0), (29, 29), obstacles)
+    return GridRobot(grid_size, obstacles, path)
+
+
+def simulate(robot, injector, speed=10.0, **kwargs):
+    engine = SimulationEngine(robot, speed=speed, dt=0.05)
+    replanner = DynamicReplanner(robot, injector, **kwargs).attach(engine)
+    # Robot hiçbir adımda algılanmış bir engelin üzerinde durmamalı
+    engine.add_step_hook(lambda e: assert_not_on_obstacle(robot))
+    snapshot = engine.run(time_scale=None, max_time=600)
+    assert_not_on_obstacle(robot)
+    return engine.path[:snapshot.step_index + 1], replanner
+
+
+def assert_not_on_obstacle(robot):
+    assert robot.grid[tuple(robot.position)] != -1
+
+
+def zero_length_steps(walked):
+    steps = np.abs(np.diff(np.asarray(walked), axis=0)).sum(axis=1)
+    assert (steps <= 1).all()
+    return int(np.count_nonzero(steps == 0))
+
+
+@pytest.mark.parametrize("speed", [10.0, 40.0])
+@pytest.mark.parametrize("seed", range(6))
+def test_detours_on_coverage_path_have_no_zero_length_steps(seed, speed):
+    robot = headland_robot(list(BUILTIN_FIELDS[2]))
+    injector = ObstacleInjector.along_path(robot.path, speed=speed, seed=seed)
+    walked, replanner = simulate(robot, injector, speed)
+    assert replanner.stats["replans"] > 0 or replanner.stats["waits"] > 0
+    if not replanner.stats["waits"]:
+        assert zero_length_steps(walked) == 0
+
+
+def test_rejoin_at_entry_cell_drops_the_loop():
+    # Yol (2,2)'den bir döngü yapıp aynı hücreye döner; döngü kapanınca atlanmalı
+    path = [(2, 0), (2, 1), (2, 2), (1, 2), (1, 3), (2, 3), (2, 2), (3, 2), (4, 2)]
+    robot = GridRobot((6, 6), [], path)
+    engine = SimulationEngine(robot)
+    replanner = DynamicReplanner(robot)
+    replanner.report([(1, 2), (1, 3), (2, 3)])
+    replanner.repair(engine)
+    assert engine.path == [(2, 0), (2, 1), (2, 2), (3, 2), (4, 2)]
+    assert replanner.stats["replans"] == 1
+
+
+@pytest.mark.parametrize("speed", [10.0, 40.0, 75.0])
+def test_waits_behind_temporary_blockage_in_corridor(speed):
+    field = open_field(10)
+    obstacles = [(r, c) for r in (4, 6) for c in range(10)]
+    path = [(5, c) for c in range(10)]
+    robot = GridRobot(field.grid_size, obstacles, path)
+    injector = ObstacleInjector(sensor_range=3)
+    injector.schedule(0.0, [(5, 4)], duration=1.5)
+    # Hızlı motorda adım başına birden çok hücre ilerlenir; robot yine engele girmemeli
+    walked, replanner = simulate(robot, injector, speed)
+    assert (5, 4) not in walked[:walked.index((5, 3)) + 1]
+    assert replanner.stats["waits"] > 0
+    assert walked[-1] == (5, 9)
+
+
+def test_permanent_blockage_truncates_path():
+    obstacles = [(r, c) for r in (4, 6) for c in range(10)]
+    path = [(5, c) for c in range(10)]
+    robot = GridRobot((10, 10), obstacles, path)
+    injector = ObstacleInjector(sensor_range=3)
+    injector.schedule(0.0, [(5, 4)])
+    walked, replanner = simulate(robot, injector, max_wait_steps=5)
+    assert replanner.stats["truncations"] == 1
+    assert walked[-1] == (5, 3)
+
+
+def test_farm_robot_simulate_dynamic_walks_without_zero_length_steps():
+    pytest.importorskip("PyQt5")
+    from farm_robot_simulation import FarmRobot
+    from planners.planner_type import PlannerType
+
+    robot = FarmRobot((30, 30))
+    robot.set_obstacles(BUILTIN_FIELDS[2])
+    robot.set_planner(PlannerType.HEADLAND_COVERAGE)
+    robot.plan_coverage_path()
+    walked, replanner = robot.simulate_dynamic(ObstacleInjector.along_path(robot.path, seed=3))
+    if not replanner.stats["waits"]:
+        assert zero_length_steps(walked) == 0
@@ -0,0 +1,64 @@
+import pytest
+
+from planners.spacetime_planner import first_conflict, plan_cbs, plan_multi_agent, plan_prioritized
+
+# İki robotun karşı yönlerden aynı koridoru kullandığı, bir cepte yol verdiği senaryo
+CORRIDOR = {(0, c) for c in range(7)} | {(2, c) for c in range(7) if c != 3}
+SWAP = ([(1, 0), (1, 6)], [(1, 6), (1, 0)])
+
+
+def assert_valid_paths(paths, starts, goals, obstacles):
+    for path, start, goal in zip(paths, starts, goals):
+        assert path[0] == tuple(start) and path[-1] == tuple(goal)
+        assert not obstacles & set(path)
+        for a, b in zip(path, path[1:]):
+            assert abs(a[0] - b[0]) + abs(a[1] - b[1]) <= 1
+
+
+def test_first_conflict_detects_vertex_and_edge_conflicts():
+    assert first_conflict([[(0, 0), (0, 1)], [(0, 2), (0, 1)]])[0] == 'vertex'
+    assert first_conflict([[(0, 0), (0, 1)], [(0, 1), (0, 0)]])[0] == 'edge'
+    assert first_conflict([[(0, 0), (0, 1)], [(1, 0), (1, 1)]]) is None
+    # Hedefe varan robot orada bekler: sonradan gelenle çakışır
+    assert first_conflict([[(0, 1)], [(0, 0), (0, 1)]])[0] == 'vertex'
+
+
+def test_cbs_resolves_corridor_swap():
+    starts, goals = SWAP
+    paths = plan_cbs((4, 7), CORRIDOR, starts, goals)
+    assert paths is not None
+    assert first_conflict(paths) is None
+    assert_valid_paths(paths, starts, goals, CORRIDOR)
+
+
+@pytest.mark.parametrize("robots", [2, 4, 8])
+def test_prioritized_routes_crossing_robots(robots):
+    size = 12
+    starts = [(r, 0) for r in range(robots)]
+    goals = [(robots - 1 - r, size - 1) for r in range(robots)]
+    paths = plan_prioritized((size, size), set(), starts, goals)
+    assert all(paths)
+    assert first_conflict(paths) is None
+    assert_valid_paths(paths, starts, goals, set())
+
+
+def test_multi_agent_auto_is_conflict_free():
+    starts, goals = SWAP
+    paths = plan_multi_agent((4, 7), CORRIDOR, starts, goals)
+    assert first_conflict(paths) is None
+
+
+def test_obstacles_changed_in_place_refresh_the_heuristic():
+    from planners.spacetime_planner import SpaceTimeAStarPlanner
+
+    planner = SpaceTimeAStarPlanner((5, 5))
+    obstacles = {(r, 2) for r in range(5)}
+    assert planner.plan_path((0, 0), (0, 4), obstacles) == []
+    obstacles.discard((4, 2))
+    path = planner.plan_path((0, 0), (0, 4), obstacles)
+    assert path and path[-1] == (0, 4) and (4, 2) in path
+    obstacles.add((4, 2))
+    obstacles.discard((2, 2))
+    path = planner.plan_path((0, 0), (0, 4), obstacles)
+    assert path and not obstacles & set(path)
+    assert plan_prioritized((5, 5), obstacles, [(0, 0)], [(0, 4)], planner=planner)[0]
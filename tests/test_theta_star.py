@@ -0,0 +1,72 @@
+import math
+
+import numpy as np
+import pytest
+
+from planners.postprocess import occupancy_from_obstacles
+from planners.theta_star_planner import LazyThetaStarPlanner, ThetaStarPlanner
+
+PLANNERS = [ThetaStarPlanner, LazyThetaStarPlanner]
+WALL = {(r, 10) for r in range(0, 16)}
+
+
+def length(points):
+    return sum(math.dist(a, b) for a, b in zip(points, points[1:]))
+
+
+def octile(a, b):
+    dy, dx = abs(a[0] - b[0]), abs(a[1] - b[1])
+    return max(dy, dx) + (math.sqrt(2) - 1) * min(dy, dx)
+
+
+@pytest.mark.parametrize("cls", PLANNERS)
+def test_open_field_is_a_single_segment(cls):
+    planner = cls((20, 20))
+    assert planner.plan_waypoints((0, 0), (19, 13), set()) == [(0, 0), (19, 13)]
+    path = planner.plan_path((0, 0), (19, 13), set())
+    assert planner.validate(path, (0, 0), (19, 13), set()).valid
+
+
+@pytest.mark.parametrize("cls", PLANNERS)
+def test_waypoints_have_line_of_sight_around_wall(cls):
+    planner = cls((20, 20))
+    start, goal = (2, 2), (2, 17)
+    points = planner.plan_waypoints(start, goal, WALL)
+    blocked = occupancy_from_obstacles((20, 20), WALL)
+    assert points[0] == start and points[-1] == goal
+    assert all(ThetaStarPlanner._visible(blocked, a, b) for a, b in zip(points, points[1:]))
+    # Her açılı yol 8-komşulu ızgara yolundan uzun olamaz
+    assert length(points) <= octile(start, (16, 10)) + octile((16, 10), goal) + 1e-9
+    assert planner.validate(planner.plan_path(start, goal, WALL), start, goal, WALL).valid
+
+
+@pytest.mark.parametrize("cls", PLANNERS)
+@pytest.mark.parametrize("rule, reachable", [("never", False), ("one_free", False), ("always", True)])
+def test_corner_cutting_rule_applies_to_diagonal_steps(cls, rule, reachable):
+    planner = cls((3, 3))
+    planner.set_connectivity(8, rule)
+    path = planner.plan_path((0, 0), (1, 1), {(0, 1), (1, 0)})
+    assert (path == [(0, 0), (1, 1)]) is reachable
+
+
+@pytest.mark.parametrize("cls", PLANNERS)
+def test_obstacles_added_in_place_are_respected(cls):
+    planner = cls((12, 12))
+    obstacles = set()
+    assert planner.plan_waypoints((0, 0), (11, 11), obstacles) == [(0, 0), (11, 11)]
+    obstacles.update((i, i) for i in range(3, 8))
+    obstacles.update((i, i + 1) for i in range(3, 8))
+    path = planner.plan_path((0, 0), (11, 11), obstacles)
+    assert path and not obstacles & set(path)
+    assert planner.validate(path, (0, 0), (11, 11), obstacles).valid
+
+
+def test_lazy_matches_eager_cost_on_random_fields():
+    rng = np.random.default_rng(3)
+    for _ in range(5):
+        obstacles = {tuple(c) for c in rng.integers(0, 25, (80, 2)).tolist()} - {(0, 0), (24, 24)}
+        eager = ThetaStarPlanner((25, 25)).plan_waypoints((0, 0), (24, 24), obstacles)
+        lazy = LazyThetaStarPlanner((25, 25)).plan_waypoints((0, 0), (24, 24), obstacles)
+        assert bool(eager) == bool(lazy)
+        if eager:
+            assert length(lazy) <= length(eager) * 1.1
@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from fields import random_field
+from planners.distance import geodesic_distance
+from planners.tsp import distance_matrix, nearest_neighbor_order, order_waypoints, solve_tsp, tour_cost
+
+
+def euclidean_matrix(n, seed):
+    points = np.random.default_rng(seed).random((n, 2)) * 100
+    return np.hypot(*(points[:, None, :] - points[None, :, :]).transpose(2, 0, 1))
+
+
+@pytest.mark.parametrize("seed", range(10))
+@pytest.mark.parametrize("ends", [(None, None), (0, None), (0, 5), (3, 3)])
+def test_never_worse_than_nearest_neighbor(seed, ends):
+    matrix = euclidean_matrix(40, seed)
+    start, end = ends
+    result = solve_tsp(matrix, start=start, end=end, time_budget=None)
+    greedy = tour_cost(matrix, nearest_neighbor_order(matrix, start, end))
+    assert result.cost <= greedy + 1e-9
+    assert sorted(set(result.order)) == list(range(40))
+    if start is not None:
+        assert result.order[0] == start
+    if end is not None and end != start:
+        assert result.order[-1] == end
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_closed_tour_visits_every_point_once(seed):
+    matrix = euclidean_matrix(30, seed)
+    result = solve_tsp(matrix, closed=True, time_budget=None)
+    assert sorted(result.order) == list(range(30))
+    assert result.cost == pytest.approx(tour_cost(matrix, result.order, closed=True))
+    greedy = nearest_neighbor_order(matrix, 0)
+    assert result.cost <= tour_cost(matrix, greedy, closed=True) + 1e-9
+
+
+def test_distance_matrix_matches_single_source_bfs():
+    field = random_field(25, 0.2, seed=2)
+    free = ~field.occupancy()
+    points = [tuple(p) for p in np.argwhere(free)[::37][:12].tolist()]
+    matrix = distance_matrix(free, points)
+    for i, source in enumerate(points):
+        distances = geodesic_distance(free, source)
+        expected = [distances[p] for p in points]
+        reachable = np.asarray(expected) >= 0
+        assert np.array_equal(np.asarray(matrix[i])[reachable], np.asarray(expected)[reachable])
+
+
+def test_order_waypoints_returns_waypoint_indices():
+    free = np.ones((20, 20), dtype=bool)
+    waypoints = [(0, 19), (19, 19), (10, 10), (19, 0)]
+    result = order_waypoints(free, waypoints, start=(0, 0), end=(0, 0), time_budget=None)
+    assert sorted(result.order) == list(range(len(waypoints)))
@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from planners.grid_path import GridPath
+from planners.validation import InvalidPathError, check_path, issues_to_dicts, validate_path
+
+
+def kinds(result):
+    return {issue.kind: issue.indices.tolist() for issue in result.issues}
+
+
+def test_valid_path():
+    path = [(0, 0), (0, 1), (1, 1), (1, 2)]
+    result = validate_path(path, (3, 3), start=(0, 0), goal=(1, 2))
+    assert result.valid and not result.issues
+    assert validate_path(GridPath(path), (3, 3)).valid
+
+
+@pytest.mark.parametrize("path", [None, [], GridPath()])
+def test_empty(path):
+    result = validate_path(path, (3, 3))
+    assert not result.valid
+    assert kinds(result) == {"empty": []}
+
+
+def test_issue_kinds_and_indices():
+    path = [(0, 0), (0, 1), (1, 1), (1, 1), (1, 3), (1, 4), (2, 4)]
+    result = validate_path(path, (3, 4), obstacles={(1, 1)}, start=(0, 1), goal=(2, 2),
+                           allow_waits=False)
+    assert kinds(result) == {
+        "out_of_bounds": [5, 6],
+        "collision": [2, 3],
+        "discontinuity": [4],
+        "wait": [3],
+        "start_mismatch": [0],
+        "goal_mismatch": [6],
+    }
+    issue = next(i for i in result.issues if i.kind == "collision")
+    assert issue.count == 2 and issue.cells.tolist() == [[1, 1], [1, 1]]
+
+
+def test_diagonal_steps_depend_on_connectivity():
+    path = [(0, 0), (1, 1), (2, 2)]
+    assert kinds(validate_path(path, (3, 3))) == {"discontinuity": [1, 2]}
+    assert validate_path(path, (3, 3), connectivity=8).valid
+
+
+@pytest.mark.parametrize("rule, blocked, cut", [
+    ("never", {(0, 1)}, True),
+    ("never", set(), False),
+    ("one_free", {(0, 1)}, False),
+    ("one_free", {(0, 1), (1, 0)}, True),
+    ("always", {(0, 1), (1, 0)}, False),
+])
+def test_corner_cutting_rules(rule, blocked, cut):
+    result = validate_path([(0, 0), (1, 1)], (2, 2), blocked, connectivity=8, corner_cutting=rule)
+    assert ("corner_cut" in kinds(result)) is cut
+
+
+def test_boolean_occupancy_and_max_indices():
+    occupancy = np.zeros((1, 200), dtype=bool)
+    occupancy[0, 50:] = True
+    path = [(0, c) for c in range(200)]
+    issue = validate_path(path, (1, 200), occupancy, max_indices=10).issues[0]
+    assert issue.kind == "collision"
+    assert issue.count == 150 and issue.indices.tolist() == list(range(50, 60))
+
+
+def test_check_path_raises_with_issues():
+    with pytest.raises(InvalidPathError) as error:
+        check_path([(0, 0), (0, 2)], (1, 3))
+    assert [d["kind"] for d in issues_to_dicts(error.value.issues)] == ["discontinuity"]
+
+
+@pytest.mark.parametrize("index", range(4))
+def test_default_coverage_planner_passes_its_own_validation(index, tmp_path, monkeypatch):
+    # Hafıza dosyası çalışma dizinine yazılır; testler depodaki dosyaya dokunmasın
+    monkeypatch.chdir(tmp_path)
+    from fields import builtin_fields
+    from path_planner_factory import PathPlannerFactory
+    from planners.planner_type import PlannerType
+
+    field = builtin_fields()[index]
+    PathPlannerFactory.clear_cache()
+    planner = PathPlannerFactory.create_planner(PlannerType.ADAPTIVE, field.grid_size)
+    start, goal = (0, 0), (29, 29)
+    path = planner.plan_path(start, goal, set(field.obstacles))
+    result = planner.validate(path, start, goal, field.occupancy())
+    assert result.valid, issues_to_dicts(result.issues)
+
+    # Öğrenilmiş rota hafızadan kullanıldığında da geçerli kalmalı
+    for key in planner.path_scores:
+        planner.path_scores[key] = 1.0
+    remembered = planner.plan_path(start, goal, set(field.obstacles))
+    assert planner.validate(remembered, start, goal, field.occupancy()).valid
+    PathPlannerFactory.clear_cache()
@@ -2,5 +2,6 @@
 
 from .statistics_widget import StatisticsWidget
 from .sensor_widget import SensorWidget
+from .planning_worker import PlanningWorker
 
-__all__ = ['StatisticsWidget', 'SensorWidget'] 
\ No newline at end of file
+__all__ = ['StatisticsWidget', 'SensorWidget', 'PlanningWorker'] 
\ No newline at end of file
@@ -0,0 +1,76 @@
+import threading
+import time
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+from path_planner_factory import PathPlannerFactory
+from planners.base_planner import PlanningCancelled
+
+
+class PlanningSignals(QObject):
+    """Arka plan planlama işinin GUI thread'ine gönderdiği sinyaller"""
+    progress = pyqtSignal(int, dict)          # iş no, ilerleme bilgisi
+    finished = pyqtSignal(int, list, float)   # iş no, yol, planlama süresi
+    failed = pyqtSignal(int, str)             # iş no, hata mesajı
+    cancelled = pyqtSignal(int)               # iş no
+
+
+class PlanningWorker(QRunnable):
+    """Yol planlamayı QThreadPool üzerinde çalıştıran iş
+
+    Sinyaller ana thread'de oluşturulan PlanningSignals üzerinden gönderilir,
+    böylece sonuçlar GUI thread'inde işlenir. cancel() planlayıcının bir
+    sonraki ilerleme bildiriminde planlamayı durdurur.
+
+    Planlayıcı iş oluşturulurken (GUI thread'inde) fabrikadaki prototipten
+    alınır. Ayarlar işe özeldir; adaptif planlayıcının hafızası ise tüm işlerle
+    paylaşılır ve kilit altında güncellenip kaydedilir. Böylece eşzamanlı
+    planlanan tarlaların öğrendiği rotalar birbirini ezmez.
+    """
+
+    # İlerleme sinyalleri en fazla bu aralıkla gönderilir (saniye)
+    PROGRESS_INTERVAL = 0.1
+
+    def __init__(self, job_id, planner_type, grid_size, start, goal, obstacles):
+        super().__init__()
+        self.job_id = job_id
+        self.planner_type = planner_type
+        self.grid_size = grid_size
+        self.start = start
+        self.goal = goal
+        self.obstacles = set(obstacles)
+        self.planner = PathPlannerFactory.create_planner(planner_type, grid_size)
+        self.signals = PlanningSignals()
+        self._cancel_event = threading.Event()
+        self._last_progress = 0.0
+
+    def cancel(self):
+        self._cancel_event.set()
+
+    def _on_progress(self, info):
+        if self._cancel_event.is_set():
+            raise PlanningCancelled()
+        now = time.perf_counter()
+        if now - self._last_progress >= self.PROGRESS_INTERVAL:
+            self._last_progress = now
+            self.signals.progress.emit(self.job_id, info)
+
+    def run(self):
+        if self._cancel_event.is_set():
+            self.signals.cancelled.emit(self.job_id)
+            return
+
+        planner = self.planner
+        planner.progress_callback = self._on_progress
+        try:
+            start_time = time.time()
+            path = planner.plan_path(self.start, self.goal, self.obstacles)
+            planning_time = time.time() - start_time
+        except PlanningCancelled:
+            self.signals.cancelled.emit(self.job_id)
+        except Exception as e:
+            self.signals.failed.emit(self.job_id, str(e))
+        else:
+            self.signals.progress.emit(self.job_id, {"fraction": 1.0,
+                                                     "covered_cells": len(path or [])})
+            self.signals.finished.emit(self.job_id, list(path or []), planning_time)
@@ -20,6 +20,9 @@ class StatisticsWidget(QWidget):
         self.create_stat_card("İşlenen Alan", "450 m²", "🌾", stats_layout)
         self.create_stat_card("Enerji Tüketimi", "85 kWh", "⚡", stats_layout)
         self.create_stat_card("Verimlilik", "%92", "📈", stats_layout)
+        # Son planlanan yolun kapsama ölçümleri (show_coverage ile güncellenir)
+        self.coverage_label = self.create_stat_card("Kapsama", "-", "🗺️", stats_layout)
+        self.overlap_label = self.create_stat_card("Tekrar / Dönüş", "-", "🔁", stats_layout)
         
         self.layout.addWidget(stats_frame)
         
@@ -96,6 +99,12 @@ class StatisticsWidget(QWidget):
         layout.addWidget(title_label)
         
         parent_layout.addWidget(card)
+        return value_label
+
+    def show_coverage(self, metrics):
+        """planners.coverage_metrics.CoverageMetrics sonucunu kartlara yaz"""
+        self.coverage_label.setText(f"%{metrics.coverage_ratio * 100:.1f}")
+        self.overlap_label.setText(f"%{metrics.overlap_ratio * 100:.1f} / {metrics.turns}")
 
     def create_line_chart(self, title):
         fig = Figure(figsize=(6, 4))